@@ -1,4 +1,5 @@
 """Database setup and session management."""
+from contextlib import contextmanager
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
@@ -8,9 +9,17 @@ from pathlib import Path
 DB_PATH = Path(__file__).parent.parent / "fishing_forecast.db"
 SQLALCHEMY_DATABASE_URL = f"sqlite:///{DB_PATH}"
 
+# Connection pool size. Scheduler jobs hold at most 6 connections at once
+# (fetch_all_data: 4, one per DB fetch thread plus forecasts; capture_environment
+# and periodic_score_recalculation: 1 each), which leaves room for API requests
+POOL_SIZE = 8
+MAX_OVERFLOW = 4
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
+    pool_size=POOL_SIZE,
+    max_overflow=MAX_OVERFLOW
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -30,3 +39,23 @@ def get_db():
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+
+
+@contextmanager
+def scheduler_session():
+    """
+    Database session for background jobs.
+
+    Commits when the block completes, rolls back if it raises (so the
+    connection never goes back to the pool idle in a transaction), and
+    always closes the session.
+    """
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
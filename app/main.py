@@ -11,7 +11,7 @@ from pathlib import Path
 
 from app.database import get_db, init_db
 from app.config import config
-from app.scheduler import start_scheduler, stop_scheduler
+from app.scheduler import start_scheduler, stop_scheduler, enqueue_invalidation, PREY_SPECIES
 from app.models.schemas import ForecastWindow, Alert, Catch, WeatherData, TideData, BaitLog, PredatorLog, LearningBucket
 from app.services.tide_service import get_current_tide_state
 from app.services.scoring_service import get_current_conditions
@@ -24,12 +24,10 @@ from app.utils.timezone import get_central_isoformat, central_to_utc, central_no
 from app.utils.location_manager import get_current_location, set_current_location, VALID_LOCATIONS
 from app.utils.location_registry import get_location, get_all_locations, is_valid_location
 from app.services.learning_service import get_learning_delta, get_zone_data_sufficiency
+from app.utils.logging_config import setup_logging
 
 # Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -475,8 +473,8 @@ async def get_species_forecast(
         behavior_data = get_species_behavior_cheatsheet(species_key)
 
         # Make zones dynamic based on CURRENT conditions
-        from app.services.advanced_features import get_best_zones_now
-        top_species_for_zones = [{'key': species_key, 'tier': current_bite_tier}]
+        from app.services.advanced_features import get_best_zones_now, SpeciesEntry
+        top_species_for_zones = [SpeciesEntry(species_key, current_bite_tier)]
         dynamic_zones = get_best_zones_now(
             top_species_list=top_species_for_zones,
             tide_state=current_data.get('tide_state', 'unknown'),
@@ -758,6 +756,7 @@ async def log_catch(catch_data: CatchCreate, db: Session = Depends(get_db)) -> D
                 update_rig_condition_effect(db, catch.species, rig_type, conditions_for_learning, condition_weight)
 
             # 3. Recalculate bite score with smoothing
+            enqueue_invalidation(catch.species, catch.zone_id)
             recalculate_bite_score(db, catch.species, catch.zone_id)
 
             # 4. Update tip
@@ -1179,10 +1178,10 @@ async def log_predator(predator_data: PredatorLogCreate, db: Session = Depends(g
         from app.services.score_cache_service import recalculate_bite_score
 
         try:
-            # Prey species affected by predators
-            prey_species = ['speckled_trout', 'white_trout', 'menhaden', 'mullet']
-
-            for prey in prey_species:
+            # Prey species affected by predators (the scheduler seeds recent
+            # activity from the same list after a restart)
+            for prey in PREY_SPECIES:
+                enqueue_invalidation(prey, predator_log.zone)
                 try:
                     recalculate_bite_score(db, prey, predator_log.zone)
                 except Exception as e:
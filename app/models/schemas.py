@@ -1,5 +1,5 @@
 """SQLAlchemy models for database tables."""
-from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, ForeignKey, Text
+from sqlalchemy import Column, Integer, Float, String, DateTime, Boolean, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -155,6 +155,12 @@ class Catch(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Covers the scheduler's recent-activity scan (timestamp >= cutoff,
+        # grouped by species+zone)
+        Index('ix_catch_ts_species_zone', 'timestamp', 'species', 'zone_id'),
+    )
+
 
 class MarineCondition(Base):
     """Stores marine forecast and safety data."""
@@ -234,6 +240,11 @@ class PredatorLog(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        # Covers the scheduler's recent-activity scan (time >= cutoff, grouped by zone)
+        Index('ix_predatorlog_time_zone', 'time', 'zone'),
+    )
+
 
 class LearningBucket(Base):
     """Stores learning deltas for species/zone/tide/time combinations."""
@@ -412,3 +423,11 @@ class Species(Base):
     name = Column(String(100), nullable=False)  # Display name
     tier = Column(Integer, nullable=False)  # 1 or 2
     category = Column(String(20), nullable=True)  # tier1_full, tier2_simplified, bait
+
+
+class SchedulerState(Base):
+    """Scheduler bookkeeping that must survive restarts (e.g. last_recalc_at)."""
+    __tablename__ = "scheduler_state"
+
+    key = Column(String(50), primary_key=True)
+    value = Column(DateTime, nullable=True)
@@ -3,8 +3,24 @@
 This module implements species-specific rules for calculating bite scores (0-100)
 based on a weighted average of environmental sub-scores.
 """
+import re
+from bisect import bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from math import fabs
 from typing import Dict, Any, Optional
 
+from app.config import config
+from app.rules.species_params import (
+    SPECIES, SPECIES_ID, UNKNOWN_SPECIES, species_id,
+    SPECKLED_TROUT, REDFISH, FLOUNDER, JACK_CREVALLE, MACKEREL, SHARK,
+    TIDE_STATES, TIDE_OTHER, TIDE_RATE_THRESH, TIDE_SCORES,
+    WIND_BREAKS, WIND_SCORES,
+    TEMP_BREAKS, TEMP_SCORES,
+    PRESSURE_TRENDS, PRESSURE_SCORES,
+    CLOUD_COVERS, CLOUD_SCORES,
+)
+
 
 # Species-specific environmental factor weights
 SPECIES_ENV_WEIGHTS = {
@@ -53,6 +69,7 @@ SPECIES_ENV_WEIGHTS = {
 }
 
 
+
 def clamp(value: float, min_val: float = 0.0, max_val: float = 1.0) -> float:
     """Clamp a value between min and max."""
     return max(min_val, min(max_val, value))
@@ -85,7 +102,8 @@ def calculate_bite_score(
     running_factor: float,
     conditions: Dict[str, Any],
     safety_level: Optional[str] = None,
-    safety_score: Optional[int] = None
+    safety_score: Optional[int] = None,
+    env_score: Optional[float] = None
 ) -> float:
     """
     Calculate bite score (0-100) for a species given environmental conditions.
@@ -106,6 +124,7 @@ def calculate_bite_score(
             - moon_phase: 0-1 (0=new, 0.5=full)
         safety_level: Optional marine safety level ('SAFE', 'CAUTION', 'UNSAFE')
         safety_score: Optional marine safety score (0-100)
+        env_score: Optional precomputed environmental score (see score_all_species)
 
     Returns:
         Bite score from 0-100
@@ -115,7 +134,8 @@ def calculate_bite_score(
         return 0.0  # Species not present
 
     # Get species-specific environmental score using weighted sub-scores
-    env_score = _get_species_environmental_score(species, conditions)
+    if env_score is None:
+        env_score = _get_species_environmental_score(species, conditions)
 
     # Multiply seasonality by environmental conditions
     # bite_score = running_factor * environmental_score * 100
@@ -149,45 +169,80 @@ def _get_species_environmental_score(species: str, conditions: Dict[str, Any]) -
     Each sub-score is clamped to [0.0, 1.0] before weighting.
     Final environmental_score is clamped to [0.0, 1.0].
     """
-    # Get weights for this species (default to all 0.5 if species not found)
-    weights = SPECIES_ENV_WEIGHTS.get(species, {
-        "tide": 0.5, "wind": 0.5, "temp": 0.5,
-        "pressure": 0.5, "moon": 0.5, "cloud": 0.5
-    })
-
-    # Extract conditions
-    tide_state = conditions.get('tide_state', 'slack')
-    tide_change_rate = conditions.get('tide_change_rate', 0.0)
-    time_of_day = conditions.get('time_of_day', 'day')
-    wind_speed = conditions.get('wind_speed', 0.0)  # ALWAYS in MPH
-    temperature = conditions.get('temperature', 70.0)  # Air temperature
-    water_temperature = conditions.get('water_temperature', None)  # Water temperature (may be None)
-    pressure_trend = conditions.get('pressure_trend', 'stable')
-    cloud_cover = conditions.get('cloud_cover', 'clear')
-    weather_conditions = conditions.get('conditions', '').lower()
-    moon_phase = conditions.get('moon_phase', 0.0)
+    sid = species_id(species)
+    weights = _ENV_WEIGHT_ROWS[sid] if sid != UNKNOWN_SPECIES else _DEFAULT_ENV_WEIGHT_ROW
+    return _environmental_score(sid, weights, ScenarioContext.from_conditions(conditions))
 
-    # Calculate each sub-score (0-1) based on species
-    tide_score = clamp(_calculate_tide_score(species, tide_state, tide_change_rate, time_of_day))
-    wind_score = clamp(_calculate_wind_score(species, wind_speed, weather_conditions))
-    temp_score = clamp(_calculate_temp_score(species, temperature, water_temperature))
-    pressure_score = clamp(_calculate_pressure_score(species, pressure_trend))
-    moon_score = clamp(_calculate_moon_score(species, moon_phase))
-    cloud_score = clamp(_calculate_cloud_score(species, cloud_cover))
-
-    # Weighted average
-    w_tide = weights["tide"]
-    w_wind = weights["wind"]
-    w_temp = weights["temp"]
-    w_pressure = weights["pressure"]
-    w_moon = weights["moon"]
-    w_cloud = weights["cloud"]
-
-    total_weight = w_tide + w_wind + w_temp + w_pressure + w_moon + w_cloud
+
+def score_all_species(conditions: Dict[str, Any]) -> Dict[str, float]:
+    """
+    Get environmental suitability scores (0-1) for every known species.
+
+    Reads the conditions once and evaluates all species in a single pass,
+    instead of re-parsing the conditions for each species.
+
+    Args:
+        conditions: Environmental data dictionary (see calculate_bite_score)
+
+    Returns:
+        Dict mapping species key to environmental score
+    """
+    ctx = ScenarioContext.from_conditions(conditions)
+    return {
+        species: _environmental_score(sid, _ENV_WEIGHT_ROWS[sid], ctx)
+        for species, sid in SPECIES_ID.items()
+    }
+
+
+@dataclass(frozen=True)
+class ScenarioContext:
+    """
+    Species-independent scoring inputs, resolved once per scenario.
+
+    String categories are reduced to table columns and the moon phase to its
+    base score, so the per-species scorers only index tables and do arithmetic.
+    """
+    tide_column: int
+    tide_change_rate: float
+    wind_speed: float
+    severe_weather: bool
+    effective_temp: float
+    pressure_column: int
+    moon_score: float
+    cloud_column: int
+
+    @classmethod
+    def from_conditions(cls, conditions: Dict[str, Any]) -> 'ScenarioContext':
+        """Build the context from a conditions dictionary (see calculate_bite_score)."""
+        temperature = conditions.get('temperature', 70.0)  # Air temperature
+        water_temperature = conditions.get('water_temperature', None)  # Water temperature (may be None)
+        return cls(
+            tide_column=TIDE_STATES.get(conditions.get('tide_state', 'slack'), TIDE_OTHER),
+            tide_change_rate=conditions.get('tide_change_rate', 0.0),
+            wind_speed=conditions.get('wind_speed', 0.0),  # ALWAYS in MPH
+            severe_weather=is_severe_weather(conditions.get('conditions', '')),
+            effective_temp=water_temperature if water_temperature is not None else temperature,
+            pressure_column=PRESSURE_TRENDS.get(conditions.get('pressure_trend', 'stable'), 3),
+            moon_score=_base_moon_score(conditions.get('moon_phase', 0.0)),
+            cloud_column=CLOUD_COVERS.get(conditions.get('cloud_cover', 'clear'), 4),
+        )
+
+
+def _environmental_score(sid: int, weights: tuple, ctx: ScenarioContext) -> float:
+    """Weighted environmental score core for one species id."""
+    w_tide, w_wind, w_temp, w_pressure, w_moon, w_cloud, total_weight = weights
 
     if total_weight == 0:
         return 0.5  # Default if no weights
 
+    # Calculate each sub-score (0-1) based on species
+    tide_score = clamp(_tide_score(sid, ctx.tide_column, ctx.tide_change_rate))
+    wind_score = 0.1 if ctx.severe_weather else clamp(_wind_score(sid, ctx.wind_speed))
+    temp_score = clamp(_temp_score(sid, ctx.effective_temp))
+    pressure_score = clamp(_pressure_score(sid, ctx.pressure_column))
+    moon_score = clamp(_moon_score(sid, ctx.moon_score))
+    cloud_score = clamp(_cloud_score(sid, ctx.cloud_column))
+
     env_score = (
         w_tide * tide_score +
         w_wind * wind_score +
@@ -201,262 +256,65 @@ def _get_species_environmental_score(species: str, conditions: Dict[str, Any]) -
     return clamp(env_score, 0.0, 1.0)
 
 
+def _weight_row(weights: Dict[str, float]) -> tuple:
+    """Flatten a weights dict to (tide, wind, temp, pressure, moon, cloud, total)."""
+    row = (weights["tide"], weights["wind"], weights["temp"],
+           weights["pressure"], weights["moon"], weights["cloud"])
+    return row + (row[0] + row[1] + row[2] + row[3] + row[4] + row[5],)
+
+
+# Weight rows indexed by species id (default to all 0.5 if species not found)
+_ENV_WEIGHT_ROWS = tuple(_weight_row(SPECIES_ENV_WEIGHTS[species]) for species in SPECIES)
+_DEFAULT_ENV_WEIGHT_ROW = _weight_row({
+    "tide": 0.5, "wind": 0.5, "temp": 0.5,
+    "pressure": 0.5, "moon": 0.5, "cloud": 0.5
+})
+
+
 # ============================================================================
 # SUB-SCORE FUNCTIONS (each returns 0-1 score before clamping)
 # ============================================================================
 
 def _calculate_tide_score(species: str, tide_state: str, tide_change_rate: float, time_of_day: str) -> float:
     """Calculate tide sub-score (0-1) based on species preferences."""
-    score = 0.5  # baseline
-
-    # Species-specific tide preferences
-    if species == 'speckled_trout':
-        # Love moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.3:
-            score = 0.9
-        elif tide_state in ['rising', 'falling']:
-            score = 0.7
-        elif tide_state == 'slack':
-            score = 0.3
-
-    elif species == 'redfish':
-        # Moving water is key
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.2:
-            score = 0.85
-        elif tide_state in ['rising', 'falling']:
-            score = 0.65
-        elif tide_state == 'slack':
-            score = 0.4
-
-    elif species == 'flounder':
-        # LOVE falling tide
-        if tide_state == 'falling' and tide_change_rate > 0.3:
-            score = 0.95
-        elif tide_state == 'falling':
-            score = 0.75
-        elif tide_state == 'rising' and tide_change_rate > 0.3:
-            score = 0.65
-        elif tide_state == 'slack':
-            score = 0.3
-
-    elif species == 'sheepshead':
-        # Prefer gentle movement or slack around structure
-        if tide_change_rate < 0.4:
-            score = 0.75
-        if tide_state == 'slack':
-            score = 0.70
-        else:
-            score = 0.55
-
-    elif species == 'black_drum':
-        # Less tide dependent
-        if tide_state in ['rising', 'falling']:
-            score = 0.65
-        else:
-            score = 0.55
-
-    elif species == 'white_trout':
-        # Prefer moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.25:
-            score = 0.8
-        elif tide_state == 'slack':
-            score = 0.4
-
-    elif species == 'croaker':
-        # Moderate movement
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.2:
-            score = 0.75
-        else:
-            score = 0.55
+    return _tide_score(species_id(species), TIDE_STATES.get(tide_state, TIDE_OTHER), tide_change_rate)
 
-    elif species == 'tripletail':
-        # Not very tide dependent
-        if tide_state in ['rising', 'falling']:
-            score = 0.6
-        else:
-            score = 0.5
-
-    elif species == 'blue_crab':
-        # Prefer moving water (crabs move with tide)
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.2:
-            score = 0.9
-        elif tide_state == 'slack':
-            score = 0.4
-
-    elif species == 'mullet':
-        # Like moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.2:
-            score = 0.7
-        else:
-            score = 0.5
-
-    elif species == 'jack_crevalle':
-        # Love moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.3:
-            score = 0.85
-        elif tide_state == 'slack':
-            score = 0.35
-
-    elif species == 'mackerel':
-        # Like moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.3:
-            score = 0.85
-        elif tide_state == 'slack':
-            score = 0.35
-
-    elif species == 'shark':
-        # Prefer moving water
-        if tide_state in ['rising', 'falling'] and tide_change_rate > 0.2:
-            score = 0.8
-        elif tide_state == 'slack':
-            score = 0.4
-
-    elif species == 'stingray':
-        # Like some movement
-        if tide_state in ['rising', 'falling']:
-            score = 0.65
-        else:
-            score = 0.5
 
-    return score
+def _tide_score(sid: int, tide_column: int, tide_change_rate: float) -> float:
+    """Tide sub-score core keyed by integer species id and tide column."""
+    if sid == UNKNOWN_SPECIES:
+        return 0.5  # baseline
 
+    # Moving water below the species' rate threshold scores as slow
+    if tide_column < 4 and not tide_change_rate > TIDE_RATE_THRESH[sid]:
+        tide_column += 1
+    return TIDE_SCORES[sid][tide_column]
 
-def _calculate_wind_score(species: str, wind_speed: float, weather_conditions: str) -> float:
-    """Calculate wind sub-score (0-1). Wind speed is ALWAYS in MPH."""
-    score = 0.5
 
-    # Penalize severe weather for all species
-    if any(word in weather_conditions for word in ['storm', 'thunder', 'severe']):
-        return 0.1
+# Weather condition keywords that indicate severe weather
+_SEVERE_WEATHER_RE = re.compile(r'storm|thunder|severe', re.IGNORECASE)
 
-    # Species-specific wind preferences (wind in MPH)
-    if species == 'speckled_trout':
-        if wind_speed < 10:
-            score = 0.8
-        elif wind_speed < 15:
-            score = 0.6
-        elif wind_speed < 20:
-            score = 0.4
-        else:
-            score = 0.2
-
-    elif species == 'redfish':
-        # Can handle more wind
-        if wind_speed < 15:
-            score = 0.75
-        elif wind_speed < 20:
-            score = 0.6
-        elif wind_speed < 25:
-            score = 0.45
-        else:
-            score = 0.3
 
-    elif species == 'flounder':
-        if wind_speed < 12:
-            score = 0.75
-        elif wind_speed < 20:
-            score = 0.55
-        else:
-            score = 0.3
+def is_severe_weather(weather_conditions: Optional[str]) -> bool:
+    """Check whether a weather conditions string describes severe weather."""
+    return bool(weather_conditions) and _SEVERE_WEATHER_RE.search(weather_conditions) is not None
 
-    elif species == 'sheepshead':
-        # Can handle wind well
-        if wind_speed < 30:
-            score = 0.7
-        else:
-            score = 0.3
-
-    elif species == 'black_drum':
-        # Can handle wind well
-        if wind_speed < 20:
-            score = 0.75
-        elif wind_speed < 30:
-            score = 0.6
-        else:
-            score = 0.35
-
-    elif species == 'white_trout':
-        # Prefer calm to moderate
-        if wind_speed < 10:
-            score = 0.8
-        elif wind_speed < 20:
-            score = 0.55
-        else:
-            score = 0.35
 
-    elif species == 'croaker':
-        if wind_speed < 12:
-            score = 0.75
-        elif wind_speed < 20:
-            score = 0.55
-        else:
-            score = 0.3
-
-    elif species == 'tripletail':
-        # Calm to light wind is best for sight fishing
-        if wind_speed < 10:
-            score = 0.85
-        elif wind_speed < 20:
-            score = 0.45
-        else:
-            score = 0.25
-
-    elif species == 'blue_crab':
-        # Can handle moderate wind
-        if wind_speed < 15:
-            score = 0.75
-        elif wind_speed < 25:
-            score = 0.55
-        else:
-            score = 0.35
-
-    elif species == 'mullet':
-        # Moderate wind can stir surface
-        if 5 < wind_speed < 15:
-            score = 0.8
-        elif wind_speed < 5:
-            score = 0.6
-        elif wind_speed < 25:
-            score = 0.45
-        else:
-            score = 0.3
-
-    elif species == 'jack_crevalle':
-        # Can handle moderate wind, stirs bait
-        if 5 < wind_speed < 20:
-            score = 0.8
-        elif wind_speed < 5:
-            score = 0.6
-        elif wind_speed < 25:
-            score = 0.5
-        else:
-            score = 0.3
+def _calculate_wind_score(species: str, wind_speed: float, weather_conditions: str) -> float:
+    """Calculate wind sub-score (0-1). Wind speed is ALWAYS in MPH."""
+    # Penalize severe weather for all species
+    if is_severe_weather(weather_conditions):
+        return 0.1
+    return _wind_score(species_id(species), wind_speed)
 
-    elif species == 'mackerel':
-        if wind_speed < 15:
-            score = 0.8
-        elif wind_speed < 20:
-            score = 0.5
-        else:
-            score = 0.25
-
-    elif species == 'shark':
-        # Moderate wind can stir baitfish
-        if 5 < wind_speed < 20:
-            score = 0.75
-        elif wind_speed < 25:
-            score = 0.6
-        else:
-            score = 0.35
 
-    elif species == 'stingray':
-        # Not very sensitive
-        if wind_speed < 25:
-            score = 0.65
-        else:
-            score = 0.4
+def _wind_score(sid: int, wind_speed: float) -> float:
+    """Wind sub-score core keyed by integer species id (severe weather checked by caller)."""
+    if sid == UNKNOWN_SPECIES:
+        return 0.5
 
-    return score
+    # Species-specific wind preferences (wind in MPH)
+    return WIND_SCORES[sid][bisect_right(WIND_BREAKS[sid], wind_speed)]
 
 
 def _calculate_temp_score(species: str, temperature: float, water_temperature: float = None) -> float:
@@ -479,358 +337,91 @@ def _calculate_temp_score(species: str, temperature: float, water_temperature: f
     # Use water temp if available, otherwise fall back to air temp
     effective_temp = water_temperature if water_temperature is not None else temperature
 
-    score = 0.5
+    return _temp_score(species_id(species), effective_temp)
 
-    if species == 'speckled_trout':
-        if 60 <= effective_temp <= 80:
-            score = 0.9
-        elif 55 <= effective_temp <= 90:
-            score = 0.65
-        else:
-            score = 0.3
-
-    elif species == 'redfish':
-        if 55 <= effective_temp <= 85:
-            score = 0.85
-        elif effective_temp >= 50 and effective_temp <= 95:
-            score = 0.6
-        elif effective_temp < 50:
-            score = 0.3
-        else:
-            score = 0.4
 
-    elif species == 'flounder':
-        if 60 <= effective_temp <= 80:
-            score = 0.85
-        elif 55 <= effective_temp <= 90:
-            score = 0.65
-        else:
-            score = 0.35
-
-    elif species == 'sheepshead':
-        if effective_temp >= 50:
-            score = 0.75
-        elif effective_temp >= 45:
-            score = 0.55
-        else:
-            score = 0.3
-
-    elif species == 'black_drum':
-        # Tolerant of cold water
-        if 50 <= effective_temp <= 75:
-            score = 0.85
-        elif effective_temp >= 45 and effective_temp <= 85:
-            score = 0.65
-        else:
-            score = 0.4
-
-    elif species == 'white_trout':
-        if 55 <= effective_temp <= 85:
-            score = 0.8
-        elif effective_temp >= 50 and effective_temp <= 95:
-            score = 0.55
-        else:
-            score = 0.25
-
-    elif species == 'croaker':
-        # Like warm
-        if effective_temp > 70:
-            score = 0.85
-        elif effective_temp >= 60:
-            score = 0.65
-        else:
-            score = 0.3
-
-    elif species == 'tripletail':
-        # Warm water species
-        if effective_temp > 75:
-            score = 0.9
-        elif effective_temp > 70:
-            score = 0.75
-        elif effective_temp >= 65:
-            score = 0.5
-        else:
-            score = 0.2
-
-    elif species == 'blue_crab':
-        # Warm water species, very active in heat
-        if effective_temp > 75:
-            score = 0.95
-        elif effective_temp > 70:
-            score = 0.8
-        elif effective_temp >= 60:
-            score = 0.5
-        else:
-            score = 0.2
-
-    elif species == 'mullet':
-        # Love warm
-        if effective_temp > 75:
-            score = 0.9
-        elif effective_temp >= 60:
-            score = 0.65
-        else:
-            score = 0.25
-
-    elif species == 'jack_crevalle':
-        # Warm water
-        if effective_temp > 75:
-            score = 0.9
-        elif effective_temp > 70:
-            score = 0.75
-        elif effective_temp >= 65:
-            score = 0.5
-        else:
-            score = 0.25
-
-    elif species == 'mackerel':
-        if 65 <= effective_temp <= 85:
-            score = 0.8
-        elif effective_temp >= 60 and effective_temp <= 90:
-            score = 0.6
-        else:
-            score = 0.4
-
-    elif species == 'shark':
-        # Warm water species
-        if effective_temp > 75:
-            score = 0.9
-        elif effective_temp > 70:
-            score = 0.75
-        elif effective_temp >= 65:
-            score = 0.55
-        else:
-            score = 0.2
-
-    elif species == 'stingray':
-        # Very warm-water dependent
-        if effective_temp > 75:
-            score = 0.9
-        elif effective_temp >= 65:
-            score = 0.6
-        else:
-            score = 0.2
-
-    return score
+def _temp_score(sid: int, effective_temp: float) -> float:
+    """Temperature sub-score core keyed by integer species id."""
+    if sid == UNKNOWN_SPECIES:
+        return 0.5
+    return TEMP_SCORES[sid][bisect_right(TEMP_BREAKS[sid], effective_temp)]
 
 
 def _calculate_pressure_score(species: str, pressure_trend: str) -> float:
     """Calculate pressure sub-score (0-1)."""
-    score = 0.5
-
-    if species == 'speckled_trout':
-        # Falling (pre-front) is good
-        if pressure_trend == 'falling':
-            score = 0.85
-        elif pressure_trend == 'stable':
-            score = 0.6
-        else:  # rising
-            score = 0.45
-
-    elif species == 'redfish':
-        # Stable or falling is good
-        if pressure_trend in ['falling', 'stable']:
-            score = 0.75
-        else:
-            score = 0.55
-
-    elif species == 'flounder':
-        # Stable is best
-        if pressure_trend == 'stable':
-            score = 0.85
-        elif pressure_trend == 'falling':
-            score = 0.65
-        else:
-            score = 0.55
-
-    elif species == 'sheepshead':
-        # Not very sensitive
-        score = 0.6
-
-    elif species == 'black_drum':
-        # Stable or rising is good
-        if pressure_trend in ['stable', 'rising']:
-            score = 0.8
-        else:
-            score = 0.6
-
-    elif species == 'white_trout':
-        # Falling is excellent
-        if pressure_trend == 'falling':
-            score = 0.9
-        elif pressure_trend == 'stable':
-            score = 0.7
-        else:
-            score = 0.5
-
-    elif species == 'croaker':
-        # Stable is good
-        if pressure_trend == 'stable':
-            score = 0.75
-        else:
-            score = 0.6
-
-    elif species == 'tripletail':
-        # Stable is best
-        if pressure_trend == 'stable':
-            score = 0.8
-        elif pressure_trend == 'falling':
-            score = 0.65
-        else:
-            score = 0.55
+    return _pressure_score(species_id(species), PRESSURE_TRENDS.get(pressure_trend, 3))
 
-    elif species == 'blue_crab':
-        # Stable or rising is good
-        if pressure_trend in ['stable', 'rising']:
-            score = 0.75
-        else:
-            score = 0.45
-
-    elif species == 'mullet':
-        # Not very sensitive
-        score = 0.6
-
-    elif species == 'jack_crevalle':
-        # Falling (pre-front) is good
-        if pressure_trend == 'falling':
-            score = 0.8
-        elif pressure_trend == 'stable':
-            score = 0.65
-        else:
-            score = 0.55
-
-    elif species == 'mackerel':
-        # Stable is good
-        if pressure_trend == 'stable':
-            score = 0.75
-        elif pressure_trend == 'falling':
-            score = 0.65
-        else:
-            score = 0.6
 
-    elif species == 'shark':
-        # Less sensitive, slight preference for falling
-        if pressure_trend == 'falling':
-            score = 0.65
-        else:
-            score = 0.6
+def _pressure_score(sid: int, pressure_column: int) -> float:
+    """Pressure sub-score core keyed by integer species id and trend column."""
+    if sid == UNKNOWN_SPECIES:
+        return 0.5
+    return PRESSURE_SCORES[sid][pressure_column]
 
-    elif species == 'stingray':
-        # Stable is better
-        if pressure_trend == 'stable':
-            score = 0.7
-        else:
-            score = 0.55
 
-    return score
+# Moon sensitivity per species (1.0 = strong, 0.7 = moderate, default 0.5 = less sensitive)
+_MOON_SENSITIVITY = {
+    SPECKLED_TROUT: 1.0, REDFISH: 1.0, FLOUNDER: 1.0,
+    SHARK: 0.7, JACK_CREVALLE: 0.7, MACKEREL: 0.7,
+}
 
 
 def _calculate_moon_score(species: str, moon_phase: float) -> float:
     """Calculate moon phase sub-score (0-1).
     moon_phase: 0=new, 0.5=full, 1.0=new again
     """
-    # For most species, new and full moon are better (stronger tides)
-    # Distance from nearest new (0.0) or full (0.5) moon
-    distance_to_new = min(abs(moon_phase - 0.0), abs(moon_phase - 1.0))
-    distance_to_full = abs(moon_phase - 0.5)
-    distance_to_extreme = min(distance_to_new, distance_to_full)
-
-    # Convert to score (0 distance = 1.0 score, 0.25 distance = 0.5 score)
-    moon_score = 1.0 - (distance_to_extreme * 2.0)
-    moon_score = max(0.5, min(1.0, moon_score))  # Clamp between 0.5 and 1.0
-
-    # Species adjustments
-    if species in ['speckled_trout', 'redfish', 'flounder']:
-        # Strong moon sensitivity
-        return moon_score
-    elif species in ['shark', 'jack_crevalle', 'mackerel']:
-        # Moderate moon sensitivity
-        return 0.5 + (moon_score - 0.5) * 0.7
-    else:
-        # Less moon sensitive
-        return 0.5 + (moon_score - 0.5) * 0.5
+    return _moon_score(species_id(species), _base_moon_score(moon_phase))
 
 
-def _calculate_cloud_score(species: str, cloud_cover: str) -> float:
-    """Calculate cloud cover sub-score (0-1)."""
-    score = 0.5
-
-    if species == 'speckled_trout':
-        # Prefer overcast/partly cloudy
-        if cloud_cover == 'overcast':
-            score = 0.85
-        elif cloud_cover == 'partly_cloudy':
-            score = 0.75
-        else:
-            score = 0.55
+@lru_cache(maxsize=1024)
+def _base_moon_score(moon_phase: float) -> float:
+    """Species-independent moon score (0.5-1.0) before sensitivity blending.
 
-    elif species == 'redfish':
-        # Less picky
-        score = 0.65
+    Cached: a day of forecast windows only sees a handful of distinct phases.
+    """
+    # For most species, new and full moon are better (stronger tides)
+    # Distance from nearest new (0.0/1.0) or full (0.5) moon: snap the phase to
+    # the nearest half and measure the gap, no min() chain needed
+    nearest_extreme = round(moon_phase * 2.0) * 0.5
+    distance_to_extreme = fabs(moon_phase - nearest_extreme)
 
-    elif species == 'flounder':
-        # Less dependent
-        score = 0.6
+    # Convert to score (0 distance = 1.0 score, 0.25 distance = 0.5 score).
+    # The distance is never negative, so only the lower bound needs clamping.
+    moon_score = 1.0 - 2.0 * distance_to_extreme
+    if moon_score < 0.5:
+        moon_score = 0.5
+    return moon_score
 
-    elif species == 'sheepshead':
-        # Not very sensitive
-        score = 0.6
 
-    elif species == 'black_drum':
-        # Not very sensitive
-        score = 0.6
+def _moon_score(sid: int, moon_score: float) -> float:
+    """Moon sub-score core: blend the base moon score by species sensitivity."""
+    # Species adjustment: blend toward neutral by moon sensitivity
+    return 0.5 + (moon_score - 0.5) * _MOON_SENSITIVITY.get(sid, 0.5)
 
-    elif species == 'white_trout':
-        # Overcast is good
-        if cloud_cover in ['overcast', 'mostly_cloudy']:
-            score = 0.75
-        else:
-            score = 0.6
 
-    elif species == 'croaker':
-        # Overcast ok
-        score = 0.65
+def _calculate_cloud_score(species: str, cloud_cover: str) -> float:
+    """Calculate cloud cover sub-score (0-1)."""
+    return _cloud_score(species_id(species), CLOUD_COVERS.get(cloud_cover, 4))
 
-    elif species == 'tripletail':
-        # Clear to partly cloudy best for sight fishing
-        if cloud_cover in ['clear', 'partly_cloudy']:
-            score = 0.8
-        else:
-            score = 0.5
 
-    elif species == 'blue_crab':
-        # Not very sensitive
-        score = 0.6
+def _cloud_score(sid: int, cloud_column: int) -> float:
+    """Cloud cover sub-score core keyed by integer species id and cover column."""
+    if sid == UNKNOWN_SPECIES:
+        return 0.5
+    return CLOUD_SCORES[sid][cloud_column]
 
-    elif species == 'mullet':
-        # Not very sensitive
-        score = 0.6
 
-    elif species == 'jack_crevalle':
-        # Slightly prefer overcast
-        if cloud_cover == 'overcast':
-            score = 0.7
-        else:
-            score = 0.6
-
-    elif species == 'mackerel':
-        # Prefer clearer conditions
-        if cloud_cover == 'clear':
-            score = 0.75
-        elif cloud_cover == 'partly_cloudy':
-            score = 0.65
-        else:
-            score = 0.5
-
-    elif species == 'shark':
-        # Not very sensitive
-        score = 0.6
+def reload_penalties() -> None:
+    """Refresh the cached marine safety penalties from config."""
+    global _UNSAFE_PENALTY, _CAUTION_PENALTY
+    penalties = config.marine_bite_score_penalties
+    _UNSAFE_PENALTY = penalties['UNSAFE']
+    _CAUTION_PENALTY = penalties['CAUTION']
 
-    elif species == 'stingray':
-        # Not very sensitive
-        score = 0.6
 
-    return score
+# Marine safety penalties are cached at import (see reload_penalties)
+_CAUTION_SCALE = 1.0 / 30.0  # CAUTION band spans safety scores 50-80
+reload_penalties()
 
 
 def apply_safety_penalty(bite_score: float, safety_level: str, safety_score: int) -> float:
@@ -848,29 +439,22 @@ def apply_safety_penalty(bite_score: float, safety_level: str, safety_score: int
     Returns:
         Adjusted bite score with safety penalty applied
     """
-    from app.config import config
-
-    penalties = config.marine_bite_score_penalties
-
     if safety_level == 'UNSAFE':
         # Severe conditions - apply maximum penalty
-        penalty = penalties['UNSAFE']
-        return bite_score - penalty
+        return bite_score - _UNSAFE_PENALTY
 
-    elif safety_level == 'CAUTION':
-        # Moderate conditions - apply scaled penalty based on safety score
-        max_penalty = penalties['CAUTION']
-        # Scale penalty: lower safety score = higher penalty
+    if safety_level == 'CAUTION':
+        # Moderate conditions - scale penalty by safety score
         # Safety score 50-80 = CAUTION range
-        # At 50 (low caution), apply full penalty
-        # At 80 (high caution), apply minimal penalty
-        if safety_score < 50:
-            penalty = max_penalty
-        else:
-            # Linear scale from max_penalty at 50 to 0 at 80
-            penalty = max_penalty * (80 - safety_score) / 30
-        return bite_score - penalty
-
-    else:
-        # SAFE - no penalty
-        return bite_score
+        # At 50 (low caution) or below, apply full penalty
+        # At 80 (high caution) or above, apply no penalty
+        if safety_score >= 80:
+            fraction = 0.0
+        elif safety_score < 50:
+            fraction = 1.0
+        else:
+            fraction = (80 - safety_score) * _CAUTION_SCALE
+        return bite_score - _CAUTION_PENALTY * fraction
+
+    # SAFE - no penalty
+    return bite_score
@@ -4,7 +4,8 @@ This module detects cold north wind conditions and applies penalties to shallow
 fishing behavior, pushing fish deeper and adjusting zone recommendations.
 """
 
-from typing import Optional, Dict, Tuple
+from functools import lru_cache
+from typing import Optional, Dict, NamedTuple, Tuple
 
 
 # North-derived wind directions
@@ -13,9 +14,15 @@ NORTH_WIND_DIRECTIONS = ['N', 'NNE', 'NE', 'NNW', 'NW']
 # Cold temperature threshold
 COLD_TEMP_THRESHOLD_F = 60.0
 
+# Stand-in for a missing temperature reading (never cold)
+_NO_TEMP_F = 999.0
+
 # Shallow depth threshold
 SHALLOW_DEPTH_THRESHOLD_FT = 6.0
 
+# Deepest water in the dock area
+MAX_DOCK_DEPTH_FT = 7
+
 
 def is_north_wind(wind_direction: Optional[str]) -> bool:
     """Check if wind is from a north-derived direction.
@@ -41,11 +48,10 @@ def is_cold_temp(air_temp_f: Optional[float], water_temp_f: Optional[float]) ->
     Returns:
         True if either temp is <= 60°F
     """
-    if air_temp_f and air_temp_f <= COLD_TEMP_THRESHOLD_F:
-        return True
-    if water_temp_f and water_temp_f <= COLD_TEMP_THRESHOLD_F:
-        return True
-    return False
+    # Missing readings fall back to a sentinel that can never count as cold
+    air = _NO_TEMP_F if air_temp_f is None else air_temp_f
+    water = _NO_TEMP_F if water_temp_f is None else water_temp_f
+    return min(air, water) <= COLD_TEMP_THRESHOLD_F
 
 
 def is_shallow_location(average_depth_ft: float = 4.5) -> bool:
@@ -123,6 +129,19 @@ def has_moderate_north_wind_penalty(
     return True  # Any north wind in shallow water gets some penalty
 
 
+# Depth shift (ft) under the strong penalty: shallow species (trout, reds, mullet)
+# shift most, mid-depth species moderately, deep species 1 ft (already deep)
+_STRONG_PENALTY_SHIFT_FT = {
+    'speckled_trout': 3, 'redfish': 3, 'mullet': 3,
+    'white_trout': 2, 'croaker': 2, 'blue_crab': 2,
+}
+
+# Depth shift (ft) under the moderate penalty: only shallow species move
+_MODERATE_PENALTY_SHIFT_FT = {
+    'speckled_trout': 1, 'redfish': 1, 'mullet': 1,
+}
+
+
 def get_depth_shift(
     species: str,
     wind_direction: Optional[str],
@@ -142,28 +161,41 @@ def get_depth_shift(
     Returns:
         Depth shift in feet (0-3)
     """
-    # Strong penalty: shift 2-3 ft deeper
-    if has_strong_north_wind_penalty(wind_direction, wind_speed, air_temp_f, water_temp_f):
-        # Shallow species (trout, reds, mullet) shift more
-        if species in ['speckled_trout', 'redfish', 'mullet']:
-            return 3
-        # Mid-depth species shift moderately
-        elif species in ['white_trout', 'croaker', 'blue_crab']:
-            return 2
-        # Deep species shift less (already deep)
-        else:
-            return 1
-
-    # Moderate penalty: shift 1 ft deeper
-    elif has_moderate_north_wind_penalty(wind_direction, air_temp_f, water_temp_f):
-        if species in ['speckled_trout', 'redfish', 'mullet']:
-            return 1
-        return 0
+    # Reduce the numeric inputs to the exact thresholds the penalties test,
+    # so repeated conditions hit the cache
+    strong_wind = bool(wind_speed) and wind_speed >= 10.0
+    cold = is_cold_temp(air_temp_f, water_temp_f)
+    return _depth_shift_cached(species, wind_direction, strong_wind, cold)
+
+
+@lru_cache(maxsize=4096)
+def _depth_shift_cached(
+    species: str,
+    wind_direction: Optional[str],
+    strong_wind: bool,
+    cold: bool
+) -> int:
+    """Depth shift for pre-bucketed conditions (see get_depth_shift)."""
+    north = is_north_wind(wind_direction)
+
+    # Strong penalty: shift 1-3 ft deeper
+    if north and strong_wind and cold:
+        return _STRONG_PENALTY_SHIFT_FT.get(species, 1)
+
+    # Moderate penalty: shift shallow species 1 ft deeper
+    elif north and is_shallow_location():
+        return _MODERATE_PENALTY_SHIFT_FT.get(species, 0)
 
     return 0
 
 
-def apply_depth_shift(original_range: Tuple[int, int], shift_ft: int) -> Tuple[int, int]:
+class DepthRange(NamedTuple):
+    """Depth range in feet; unpacks like a plain (min_ft, max_ft) tuple."""
+    min_ft: int
+    max_ft: int
+
+
+def apply_depth_shift(original_range: Tuple[int, int], shift_ft: int) -> DepthRange:
     """Apply depth shift to original depth range.
 
     Args:
@@ -171,19 +203,28 @@ def apply_depth_shift(original_range: Tuple[int, int], shift_ft: int) -> Tuple[i
         shift_ft: Depth shift in feet
 
     Returns:
-        New depth range tuple
+        New depth range, capped at 7 ft (max dock area depth)
     """
     min_ft, max_ft = original_range
 
-    # Shift both min and max deeper
+    # Shift both min and max deeper, capped at MAX_DOCK_DEPTH_FT
     new_min = min_ft + shift_ft
     new_max = max_ft + shift_ft
+    return DepthRange(
+        new_min if new_min < MAX_DOCK_DEPTH_FT else MAX_DOCK_DEPTH_FT,
+        new_max if new_max < MAX_DOCK_DEPTH_FT else MAX_DOCK_DEPTH_FT,
+    )
 
-    # Cap at 7 ft (max dock area depth)
-    new_min = min(new_min, 7)
-    new_max = min(new_max, 7)
 
-    return (new_min, new_max)
+# Depth notes under the strong cold north wind penalty (others: "Holding deeper than normal")
+_STRONG_PENALTY_NOTES = {
+    'speckled_trout': "Holding deeper along edges; shallow bite may be slow",
+    'redfish': "Holding deeper along edges; shallow bite may be slow",
+    'black_drum': "Off the dock edge on the deeper side, not in skinniest water",
+    'flounder': "Off the dock edge on the deeper side, not in skinniest water",
+    'white_trout': "Pushed deeper by cold north wind",
+    'croaker': "Pushed deeper by cold north wind",
+}
 
 
 def get_cold_north_wind_depth_note(
@@ -203,14 +244,7 @@ def get_cold_north_wind_depth_note(
     """
     if strong_penalty:
         # Strong penalty: emphasize deeper holding
-        if species in ['speckled_trout', 'redfish']:
-            return "Holding deeper along edges; shallow bite may be slow"
-        elif species in ['black_drum', 'flounder']:
-            return "Off the dock edge on the deeper side, not in skinniest water"
-        elif species in ['white_trout', 'croaker']:
-            return "Pushed deeper by cold north wind"
-        else:
-            return "Holding deeper than normal"
-    else:
-        # Moderate penalty: slight modification
-        return f"{original_note.rstrip('.')} (pushed slightly deeper by north wind)"
+        return _STRONG_PENALTY_NOTES.get(species, "Holding deeper than normal")
+
+    # Moderate penalty: slight modification
+    return f"{original_note.rstrip('.')} (pushed slightly deeper by north wind)"
@@ -3,7 +3,9 @@
 This module generates human-readable two-sentence summaries of current
 fishing conditions based on environmental sub-scores and bite score tiers.
 """
-from typing import Dict, Any, Optional
+import heapq
+from itertools import product
+from typing import Dict, Any, Optional, Sequence
 from app.rules.cold_north_wind import has_strong_north_wind_penalty, is_north_wind, is_cold_temp
 
 
@@ -38,52 +40,43 @@ def generate_conditions_summary(
     Returns:
         Two-sentence summary string
     """
-    # Generate sentence 1 (conditions)
-    sentence1 = _generate_conditions_sentence(
-        tide_score, wind_score, temp_score, tide_state, wind_speed,
-        wind_direction, air_temp_f, water_temp_f
-    )
-
-    # Generate sentence 2 (fish behavior) based on bite tier
-    sentence2 = _generate_behavior_sentence(
-        bite_score, wind_direction, wind_speed, air_temp_f, water_temp_f
-    )
-
-    return f"{sentence1} {sentence2}"
-
+    # Check for cold north wind conditions once for both sentences
+    strong_penalty = has_strong_north_wind_penalty(wind_direction, wind_speed, air_temp_f, water_temp_f)
 
-def _generate_conditions_sentence(
-    tide_score: float,
-    wind_score: float,
-    temp_score: float,
-    tide_state: str = None,
-    wind_speed: float = None,
-    wind_direction: Optional[str] = None,
-    air_temp_f: Optional[float] = None,
-    water_temp_f: Optional[float] = None
+    # Level index per factor and bite tier: 0 = low/slow, 1 = mid/moderate, 2 = high/good
+    return _SUMMARIES[(
+        (tide_score >= 0.4) + (tide_score >= 0.7),
+        (wind_score >= 0.4) + (wind_score >= 0.7),
+        (temp_score >= 0.4) + (temp_score >= 0.7),
+        (bite_score >= 40) + (bite_score >= 70),
+        strong_penalty,
+        is_north_wind(wind_direction),
+        is_cold_temp(air_temp_f, water_temp_f),
+    )]
+
+
+def _build_conditions_sentence(
+    tide_level: int,
+    wind_level: int,
+    temp_level: int,
+    strong_penalty: bool,
+    north_wind: bool,
+    cold_temp: bool
 ) -> str:
     """
-    Generate first sentence describing current environmental conditions.
+    Build first sentence describing current environmental conditions.
 
-    Categorizes based on sub-score ranges:
-    - High: >= 0.7
-    - Mid: 0.4 - 0.69
-    - Low: < 0.4
+    Sub-score levels:
+    - High (2): >= 0.7
+    - Mid (1): 0.4 - 0.69
+    - Low (0): < 0.4
 
     Modified for cold north wind conditions.
     """
-    # Check for cold north wind penalty
-    strong_penalty = has_strong_north_wind_penalty(wind_direction, wind_speed, air_temp_f, water_temp_f)
-
-    # Categorize each factor
-    tide_level = _categorize_score(tide_score)
-    wind_level = _categorize_score(wind_score)
-    temp_level = _categorize_score(temp_score)
-
     # Build tide description
-    if tide_level == "high":
+    if tide_level == 2:
         tide_desc = "Strong moving tide"
-    elif tide_level == "mid":
+    elif tide_level == 1:
         tide_desc = "Steady tide flow"
     else:  # low
         tide_desc = "Weak or slack tide"
@@ -91,55 +84,47 @@ def _generate_conditions_sentence(
     # Build wind description - modified for north winds
     if strong_penalty:
         wind_desc = "cold north wind"
-    elif is_north_wind(wind_direction):
+    elif north_wind:
         wind_desc = "north wind"
-    elif wind_level == "high":
+    elif wind_level == 2:
         wind_desc = "good surface chop"
-    elif wind_level == "mid":
+    elif wind_level == 1:
         wind_desc = "moderate wind"
     else:  # low
         wind_desc = "calm water"
 
     # Build temperature description - temper for cold temps
-    if strong_penalty or is_cold_temp(air_temp_f, water_temp_f):
+    if strong_penalty or cold_temp:
         # Don't say "ideal" when it's cold
         temp_desc = "cold temperatures"
-    elif temp_level == "high":
+    elif temp_level == 2:
         temp_desc = "ideal temperatures"
-    elif temp_level == "mid":
+    elif temp_level == 1:
         temp_desc = "workable temperatures"
     else:  # low
         temp_desc = "a tough temperature range"
 
     # Use "mixed conditions" instead of overly positive framing when north wind + cold
-    if strong_penalty and tide_level == "high":
+    if strong_penalty and tide_level == 2:
         return f"{tide_desc}, but {wind_desc} and {temp_desc} create mixed conditions."
     else:
         return f"{tide_desc}, {wind_desc}, and {temp_desc}."
 
 
-def _generate_behavior_sentence(
-    bite_score: float,
-    wind_direction: Optional[str] = None,
-    wind_speed: Optional[float] = None,
-    air_temp_f: Optional[float] = None,
-    water_temp_f: Optional[float] = None
-) -> str:
+def _build_behavior_sentence(tier: int, strong_penalty: bool, north_wind: bool) -> str:
     """
-    Generate second sentence describing fish behavior based on bite tier.
+    Build second sentence describing fish behavior based on bite tier.
 
     Modified to account for cold north wind penalties.
 
     Tiers:
-    - Good: 70-100
-    - Moderate: 40-69
-    - Slow: 0-39
+    - Good (2): 70-100
+    - Moderate (1): 40-69
+    - Slow (0): 0-39
     """
-    # Check for cold north wind penalty
-    strong_penalty = has_strong_north_wind_penalty(wind_direction, wind_speed, air_temp_f, water_temp_f)
-    moderate_north = is_north_wind(wind_direction) and not strong_penalty
+    moderate_north = north_wind and not strong_penalty
 
-    if bite_score >= 70:
+    if tier == 2:
         # NEVER say "pushing shallow" under cold north wind penalty
         if strong_penalty:
             return "Cold north wind is pushing fish off the shallow flat. Expect them to hold deeper along edges; shallow bite may be slow."
@@ -148,7 +133,7 @@ def _generate_behavior_sentence(
         else:
             return "Fish are feeding and pushing shallow."
 
-    elif bite_score >= 40:
+    elif tier == 1:
         if strong_penalty:
             return "Fish are cautious and holding deeper due to cold north wind."
         elif moderate_north:
@@ -163,17 +148,43 @@ def _generate_behavior_sentence(
             return "Fish are cautious and slow to bite."
 
 
-def _categorize_score(score: float) -> str:
-    """Categorize a sub-score as high, mid, or low."""
-    if score >= 0.7:
-        return "high"
-    elif score >= 0.4:
-        return "mid"
-    else:
-        return "low"
+def _build_summary(
+    tide_level: int,
+    wind_level: int,
+    temp_level: int,
+    tier: int,
+    strong_penalty: bool,
+    north_wind: bool,
+    cold_temp: bool
+) -> str:
+    """Build the full two-sentence summary for one combination of inputs."""
+    sentence1 = _build_conditions_sentence(
+        tide_level, wind_level, temp_level, strong_penalty, north_wind, cold_temp
+    )
+    sentence2 = _build_behavior_sentence(tier, strong_penalty, north_wind)
+    return f"{sentence1} {sentence2}"
+
+
+# Every summary, built once at import and keyed by the categorized inputs:
+# (tide, wind, temp level, bite tier, strong penalty, north wind, cold temp)
+_LEVELS = (0, 1, 2)
+_FLAGS = (False, True)
+_SUMMARIES = {
+    key: _build_summary(*key)
+    for key in product(_LEVELS, _LEVELS, _LEVELS, _LEVELS, _FLAGS, _FLAGS, _FLAGS)
+}
+
+
+def _bite_score_key(species_forecast: dict) -> float:
+    """Sort key for species forecasts: bite score, 0 if missing."""
+    return species_forecast.get('bite_score', 0)
 
 
-def get_top_active_species(species_forecasts: list, limit: int = 2) -> list:
+# Shared result for an empty forecast list
+_NO_SPECIES: tuple = ()
+
+
+def get_top_active_species(species_forecasts: list, limit: int = 2) -> Sequence[dict]:
     """
     Get the top N most active species by bite score.
 
@@ -182,16 +193,11 @@ def get_top_active_species(species_forecasts: list, limit: int = 2) -> list:
         limit: Maximum number of species to return
 
     Returns:
-        List of species dicts sorted by bite score (highest first)
+        Species dicts sorted by bite score (highest first); a shared empty
+        tuple when there are no forecasts
     """
     if not species_forecasts:
-        return []
-
-    # Sort by bite score descending
-    sorted_species = sorted(
-        species_forecasts,
-        key=lambda x: x.get('bite_score', 0),
-        reverse=True
-    )
+        return _NO_SPECIES
 
-    return sorted_species[:limit]
+    # Partial selection: O(n log limit) instead of sorting every species
+    return heapq.nlargest(limit, species_forecasts, key=_bite_score_key)
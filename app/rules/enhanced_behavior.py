@@ -4,19 +4,161 @@ Enhanced Species Behavior Rules from 11-22-2025 Trip
 These rules override or enhance base model predictions based on observed patterns.
 """
 
-from typing import Dict, Optional
+from enum import IntEnum
+import math
+import sys
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class Adjustments(NamedTuple):
+    """Score adjustments produced by the enhanced behavior rules."""
+    score_adjustment: float = 0.0
+    confidence_boost: float = 0.0
+    min_tier: Optional[str] = None
+    max_tier: Optional[str] = None
+    explanation: str = ''
+
+
+class _RuleContext(NamedTuple):
+    """Inputs the behavior rule predicates are evaluated against."""
+    zone: str
+    tide_state: str
+    is_overcast: bool
+    time_of_day: str
+    hour: int
+
+
+# Zone groups the rules apply to
+_ZONES_2_3 = frozenset(('Zone 2', 'Zone 3'))
+_ZONES_3_4 = frozenset(('Zone 3', 'Zone 4'))
+_ZONES_1_4 = frozenset(('Zone 1', 'Zone 4'))
+
+
+# Behavior rules from the 11-22-2025 trip, in evaluation order. Each record is
+# (species, predicate, adjustments, log message). Every matching rule is
+# merged into the result, so later rules override earlier ones.
+_RULES: List[Tuple[str, Callable[[_RuleContext], bool], Dict, Optional[str]]] = [
+    # Redfish rule 1: Low tide + overcast + midday in Zones 2-3
+    ('redfish',
+     lambda c: (c.tide_state == 'low' and c.is_overcast and c.time_of_day == 'midday' and
+                c.zone in _ZONES_2_3),
+     {'min_tier': 'DECENT',  # Minimum GOOD (using DECENT as close match)
+      'confidence_boost': 0.15,
+      'explanation': 'Low tide overcast midday pattern - redfish often active'},
+     "Redfish rule triggered: low+overcast+midday in {zone}"),
+    # Redfish rule 2: Low to rising transition in Zones 2-3
+    # (treats all rising as potential rising_start for now)
+    ('redfish',
+     lambda c: c.tide_state == 'rising' and c.zone in _ZONES_2_3,
+     {'score_adjustment': 15.0,  # Bump one tier (~20 points)
+      'max_tier': 'HOT',  # Max EXCELLENT
+      'explanation': 'Rising tide in prime zones - redfish move shallow'},
+     "Redfish rule triggered: rising tide in {zone}"),
+    # Redfish rule 3: Zones 1 and 4 use Zone 3 baseline but reduced confidence
+    ('redfish',
+     lambda c: c.zone in _ZONES_1_4,
+     {'confidence_boost': -0.05,
+      'explanation': 'Adjacent zone - using similar patterns with lower confidence'},
+     None),
+
+    # Speckled trout rule 1: Low tide suppresses specks in Zone 3
+    ('speckled_trout',
+     lambda c: c.tide_state == 'low' and c.zone == 'Zone 3',
+     {'max_tier': 'SLOW',  # Max FAIR (using SLOW as close match)
+      'explanation': 'Low tide - specks avoid shallow Zone 3'},
+     "Speckled Trout rule triggered: low tide in {zone}"),
+    # Speckled trout rule 2: Rising tide in Zone 3
+    ('speckled_trout',
+     lambda c: c.tide_state == 'rising' and c.zone == 'Zone 3',
+     {'min_tier': 'DECENT',  # Minimum GOOD
+      'score_adjustment': 15.0,  # Bump one level
+      'max_tier': 'HOT',  # Max EXCELLENT
+      'confidence_boost': 0.25,
+      'explanation': 'Rising tide Zone 3 - prime speck conditions'},
+     "Speckled Trout rule triggered: rising tide in {zone}"),
+
+    # White trout rule 1: Low tide suppresses white trout
+    ('white_trout',
+     lambda c: c.tide_state == 'low',
+     {'max_tier': 'SLOW',  # Max FAIR
+      'explanation': 'Low tide - white trout less active'},
+     "White Trout rule triggered: low tide"),
+    # White trout rule 2: Rising + sunset window (17:00-18:30, i.e. hours 17 and 18) in Zone 3
+    ('white_trout',
+     lambda c: c.tide_state == 'rising' and 17 <= c.hour <= 18 and c.zone == 'Zone 3',
+     {'min_tier': 'DECENT',  # Minimum GOOD
+      'score_adjustment': 15.0,  # Bump one level
+      'max_tier': 'HOT',  # Max EXCELLENT
+      'confidence_boost': 0.3,
+      'explanation': 'Rising tide + sunset in Zone 3 - peak white trout time'},
+     "White Trout rule triggered: rising+sunset in {zone}"),
+
+    # Croaker rule 1: Low tide in Zones 3-4
+    ('croaker',
+     lambda c: c.tide_state == 'low' and c.zone in _ZONES_3_4,
+     {'max_tier': 'SLOW',  # Max FAIR
+      'explanation': 'Low tide - croakers less active in mid zones'},
+     "Croaker rule triggered: low tide in {zone}"),
+    # Croaker rule 2: Rising in Zones 3-4
+    ('croaker',
+     lambda c: c.tide_state == 'rising' and c.zone in _ZONES_3_4,
+     {'min_tier': 'DECENT',  # Minimum GOOD
+      'score_adjustment': 15.0,  # Bump one level
+      'max_tier': 'HOT',  # Max EXCELLENT
+      'confidence_boost': 0.25,
+      'explanation': 'Rising tide in Zones 3-4 - croakers feeding actively'},
+     "Croaker rule triggered: rising tide in {zone}"),
+]
+
+# Rules grouped by species, preserving evaluation order. Explanations are
+# interned so every Adjustments shares one object per explanation.
+_RULES_BY_SPECIES: Dict[str, List[Tuple[Callable[[_RuleContext], bool], Dict, Optional[str]]]] = {}
+for _species, _predicate, _adjustments, _message in _RULES:
+    _adjustments['explanation'] = sys.intern(_adjustments['explanation'])
+    _RULES_BY_SPECIES.setdefault(_species, []).append((_predicate, _adjustments, _message))
+
+
+# Shared result for species without enhanced rules
+_NO_ADJUSTMENTS = Adjustments()
+
+# Neutral field values every rule evaluation starts from
+_NEUTRAL_FIELDS = {
+    'score_adjustment': 0.0,
+    'confidence_boost': 0.0,
+    'min_tier': None,
+    'max_tier': None,
+    'explanation': ''
+}
+
+
+def _apply_rules(species: str, ctx: _RuleContext) -> Adjustments:
+    """Merge the adjustments of every rule for a species that matches ctx."""
+    rules = _RULES_BY_SPECIES.get(species)
+    if rules is None:
+        return _NO_ADJUSTMENTS
+
+    adjustments = _NEUTRAL_FIELDS.copy()
+
+    for predicate, rule_adjustments, message in rules:
+        if predicate(ctx):
+            adjustments.update(rule_adjustments)
+            # Only format the message if INFO records are actually emitted
+            if message and logger.isEnabledFor(logging.INFO):
+                logger.info(message.format(zone=ctx.zone))
+
+    return Adjustments(**adjustments)
+
+
 def apply_redfish_rules(
     base_score: float,
     zone: str,
     tide_state: str,
     is_overcast: bool,
     time_of_day: str
-) -> Dict:
+) -> Adjustments:
     """
     Apply Redfish-specific behavior rules from 11-22-2025 trip.
 
@@ -26,46 +168,16 @@ def apply_redfish_rules(
     - Zones 1 and 4: use Zone 3 base rating but lower confidence (-0.05)
 
     Returns:
-        Dict with adjusted score, confidence boost, min_tier, max_tier
+        Adjustments with score adjustment, confidence boost, min_tier, max_tier
     """
-    adjustments = {
-        'score_adjustment': 0.0,
-        'confidence_boost': 0.0,
-        'min_tier': None,
-        'max_tier': None,
-        'explanation': ''
-    }
-
-    # Rule 1: Low tide + overcast + midday in Zones 2-3
-    if (tide_state == 'low' and is_overcast and time_of_day == 'midday' and
-        zone in ['Zone 2', 'Zone 3']):
-        adjustments['min_tier'] = 'DECENT'  # Minimum GOOD (using DECENT as close match)
-        adjustments['confidence_boost'] = 0.15
-        adjustments['explanation'] = 'Low tide overcast midday pattern - redfish often active'
-        logger.info(f"Redfish rule triggered: low+overcast+midday in {zone}")
-
-    # Rule 2: Low to rising transition in Zones 2-3
-    if (tide_state == 'rising' and zone in ['Zone 2', 'Zone 3']):
-        # Check if this is early rising (rising_start)
-        # For now, treat all rising as potential
-        adjustments['score_adjustment'] = 15.0  # Bump one tier (~20 points)
-        adjustments['max_tier'] = 'HOT'  # Max EXCELLENT
-        adjustments['explanation'] = 'Rising tide in prime zones - redfish move shallow'
-        logger.info(f"Redfish rule triggered: rising tide in {zone}")
-
-    # Rule 3: Zones 1 and 4 use Zone 3 baseline but reduced confidence
-    if zone in ['Zone 1', 'Zone 4']:
-        adjustments['confidence_boost'] = -0.05
-        adjustments['explanation'] = 'Adjacent zone - using similar patterns with lower confidence'
-
-    return adjustments
+    return _apply_rules('redfish', _RuleContext(zone, tide_state, is_overcast, time_of_day, 0))
 
 
 def apply_speckled_trout_rules(
     base_score: float,
     zone: str,
     tide_state: str
-) -> Dict:
+) -> Adjustments:
     """
     Apply Speckled Trout-specific behavior rules from 11-22-2025 trip.
 
@@ -74,32 +186,9 @@ def apply_speckled_trout_rules(
     - Rising_start in Zone 3: minimum GOOD, bump one level, max EXCELLENT, confidence +0.25
 
     Returns:
-        Dict with adjusted score, confidence boost, min_tier, max_tier
+        Adjustments with score adjustment, confidence boost, min_tier, max_tier
     """
-    adjustments = {
-        'score_adjustment': 0.0,
-        'confidence_boost': 0.0,
-        'min_tier': None,
-        'max_tier': None,
-        'explanation': ''
-    }
-
-    # Rule 1: Low tide suppresses specks in Zone 3
-    if tide_state == 'low' and zone == 'Zone 3':
-        adjustments['max_tier'] = 'SLOW'  # Max FAIR (using SLOW as close match)
-        adjustments['explanation'] = 'Low tide - specks avoid shallow Zone 3'
-        logger.info(f"Speckled Trout rule triggered: low tide in {zone}")
-
-    # Rule 2: Rising tide in Zone 3
-    if tide_state == 'rising' and zone == 'Zone 3':
-        adjustments['min_tier'] = 'DECENT'  # Minimum GOOD
-        adjustments['score_adjustment'] = 15.0  # Bump one level
-        adjustments['max_tier'] = 'HOT'  # Max EXCELLENT
-        adjustments['confidence_boost'] = 0.25
-        adjustments['explanation'] = 'Rising tide Zone 3 - prime speck conditions'
-        logger.info(f"Speckled Trout rule triggered: rising tide in {zone}")
-
-    return adjustments
+    return _apply_rules('speckled_trout', _RuleContext(zone, tide_state, False, '', 0))
 
 
 def apply_white_trout_rules(
@@ -107,7 +196,7 @@ def apply_white_trout_rules(
     zone: str,
     tide_state: str,
     hour: int
-) -> Dict:
+) -> Adjustments:
     """
     Apply White Trout-specific behavior rules from 11-22-2025 trip.
 
@@ -116,40 +205,16 @@ def apply_white_trout_rules(
     - Rising_start + sunset window (17:00-18:30) in Zone 3: minimum GOOD, bump one level, max EXCELLENT, confidence +0.3
 
     Returns:
-        Dict with adjusted score, confidence boost, min_tier, max_tier
+        Adjustments with score adjustment, confidence boost, min_tier, max_tier
     """
-    adjustments = {
-        'score_adjustment': 0.0,
-        'confidence_boost': 0.0,
-        'min_tier': None,
-        'max_tier': None,
-        'explanation': ''
-    }
-
-    # Rule 1: Low tide suppresses white trout
-    if tide_state == 'low':
-        adjustments['max_tier'] = 'SLOW'  # Max FAIR
-        adjustments['explanation'] = 'Low tide - white trout less active'
-        logger.info(f"White Trout rule triggered: low tide")
-
-    # Rule 2: Rising + sunset in Zone 3
-    is_sunset_window = 17 <= hour <= 18.5
-    if (tide_state == 'rising' and is_sunset_window and zone == 'Zone 3'):
-        adjustments['min_tier'] = 'DECENT'  # Minimum GOOD
-        adjustments['score_adjustment'] = 15.0  # Bump one level
-        adjustments['max_tier'] = 'HOT'  # Max EXCELLENT
-        adjustments['confidence_boost'] = 0.3
-        adjustments['explanation'] = 'Rising tide + sunset in Zone 3 - peak white trout time'
-        logger.info(f"White Trout rule triggered: rising+sunset in {zone}")
-
-    return adjustments
+    return _apply_rules('white_trout', _RuleContext(zone, tide_state, False, '', hour))
 
 
 def apply_croaker_rules(
     base_score: float,
     zone: str,
     tide_state: str
-) -> Dict:
+) -> Adjustments:
     """
     Apply Croaker-specific behavior rules from 11-22-2025 trip.
 
@@ -158,32 +223,9 @@ def apply_croaker_rules(
     - Rising_start in Zones 3-4: minimum GOOD, bump one level, max EXCELLENT, confidence +0.25
 
     Returns:
-        Dict with adjusted score, confidence boost, min_tier, max_tier
+        Adjustments with score adjustment, confidence boost, min_tier, max_tier
     """
-    adjustments = {
-        'score_adjustment': 0.0,
-        'confidence_boost': 0.0,
-        'min_tier': None,
-        'max_tier': None,
-        'explanation': ''
-    }
-
-    # Rule 1: Low tide in Zones 3-4
-    if tide_state == 'low' and zone in ['Zone 3', 'Zone 4']:
-        adjustments['max_tier'] = 'SLOW'  # Max FAIR
-        adjustments['explanation'] = 'Low tide - croakers less active in mid zones'
-        logger.info(f"Croaker rule triggered: low tide in {zone}")
-
-    # Rule 2: Rising in Zones 3-4
-    if tide_state == 'rising' and zone in ['Zone 3', 'Zone 4']:
-        adjustments['min_tier'] = 'DECENT'  # Minimum GOOD
-        adjustments['score_adjustment'] = 15.0  # Bump one level
-        adjustments['max_tier'] = 'HOT'  # Max EXCELLENT
-        adjustments['confidence_boost'] = 0.25
-        adjustments['explanation'] = 'Rising tide in Zones 3-4 - croakers feeding actively'
-        logger.info(f"Croaker rule triggered: rising tide in {zone}")
-
-    return adjustments
+    return _apply_rules('croaker', _RuleContext(zone, tide_state, False, '', 0))
 
 
 def apply_enhanced_behavior_rules(
@@ -194,7 +236,7 @@ def apply_enhanced_behavior_rules(
     cloud_cover: str,
     time_of_day: str,
     hour: int
-) -> Dict:
+) -> Adjustments:
     """
     Apply all enhanced behavior rules for a species.
 
@@ -208,27 +250,38 @@ def apply_enhanced_behavior_rules(
         hour: Current hour (0-23)
 
     Returns:
-        Dictionary with all adjustments to apply
+        Adjustments to apply (neutral for species without enhanced rules)
     """
-    is_overcast = cloud_cover == 'overcast'
-
-    if species == 'redfish':
-        return apply_redfish_rules(base_score, zone, tide_state, is_overcast, time_of_day)
-    elif species == 'speckled_trout':
-        return apply_speckled_trout_rules(base_score, zone, tide_state)
-    elif species == 'white_trout':
-        return apply_white_trout_rules(base_score, zone, tide_state, hour)
-    elif species == 'croaker':
-        return apply_croaker_rules(base_score, zone, tide_state)
-    else:
-        # No enhanced rules for this species
-        return {
-            'score_adjustment': 0.0,
-            'confidence_boost': 0.0,
-            'min_tier': None,
-            'max_tier': None,
-            'explanation': ''
-        }
+    ctx = _RuleContext(zone, tide_state, cloud_cover == 'overcast', time_of_day, hour)
+    return _apply_rules(species, ctx)
+
+
+class Tier(IntEnum):
+    """Bite tiers, used to index the tier score bounds."""
+    HOT = 0
+    DECENT = 1
+    SLOW = 2
+    UNLIKELY = 3
+
+
+# Score range per tier, indexed by Tier
+_TIER_MIN_SCORES = (80, 50, 20, 0)
+_TIER_MAX_SCORES = (100, 79, 49, 19)
+
+# Tier name (as used in adjustments) to Tier
+_TIER_BY_NAME = {tier.name: tier for tier in Tier}
+
+# (floor, ceiling) for every (min_tier, max_tier) pair, resolved once at
+# import; a missing tier leaves that side unbounded
+_NO_TIER = (None, '')
+_TIER_BOUNDS = {
+    (min_tier, max_tier): (
+        _TIER_MIN_SCORES[_TIER_BY_NAME[min_tier]] if min_tier else -math.inf,
+        _TIER_MAX_SCORES[_TIER_BY_NAME[max_tier]] if max_tier else math.inf,
+    )
+    for min_tier in _NO_TIER + tuple(_TIER_BY_NAME)
+    for max_tier in _NO_TIER + tuple(_TIER_BY_NAME)
+}
 
 
 def apply_tier_constraints(score: float, min_tier: Optional[str], max_tier: Optional[str]) -> float:
@@ -243,34 +296,19 @@ def apply_tier_constraints(score: float, min_tier: Optional[str], max_tier: Opti
 
     Args:
         score: Current bite score
-        min_tier: Minimum allowed tier
-        max_tier: Maximum allowed tier
+        min_tier: Minimum allowed tier name
+        max_tier: Maximum allowed tier name
 
     Returns:
         Constrained score
     """
-    # Map tiers to score ranges
-    tier_min_scores = {
-        'HOT': 80,
-        'DECENT': 50,
-        'SLOW': 20,
-        'UNLIKELY': 0
-    }
-
-    tier_max_scores = {
-        'HOT': 100,
-        'DECENT': 79,
-        'SLOW': 49,
-        'UNLIKELY': 19
-    }
-
-    # Apply minimum constraint
-    if min_tier and score < tier_min_scores[min_tier]:
-        score = tier_min_scores[min_tier]
-
-    # Apply maximum constraint
-    if max_tier and score > tier_max_scores[max_tier]:
-        score = tier_max_scores[max_tier]
+    floor, ceiling = _TIER_BOUNDS[(min_tier, max_tier)]
+
+    # Apply minimum constraint, then maximum (maximum wins if they conflict)
+    if score < floor:
+        score = floor
+    if score > ceiling:
+        score = ceiling
 
     # Ensure score stays in valid range
     return max(0.0, min(100.0, score))
@@ -3,6 +3,7 @@
 Size and creel limits for recreational fishing in Alabama coastal waters.
 Data from Alabama Marine Resources Division official creel sheet.
 """
+from functools import lru_cache
 
 # Species regulations configuration
 SPECIES_REGULATIONS = {
@@ -217,6 +218,38 @@ SPECIES_REGULATIONS = {
 }
 
 
+def _format_size_limit(size: dict) -> str:
+    """Format a regulation's size block as a display string."""
+    min_size = size.get("min_inches")
+    max_size = size.get("max_inches")
+
+    if min_size is None and max_size is None:
+        return "N/A"
+
+    min_str = f'{min_size}"' if min_size is not None else "N/A"
+    max_str = f'{max_size}"' if max_size is not None else "N/A"
+
+    return min_str + "-" + max_str
+
+
+def _format_creel_limit(creel: dict) -> str:
+    """Format a regulation's creel block as a display string."""
+    per_person = creel.get("per_person")
+    per_vessel = creel.get("per_vessel")
+
+    if per_person is not None:
+        return f"{per_person} per person"
+    elif per_vessel is not None:
+        return f"{per_vessel} per vessel"
+    else:
+        return "N/A"
+
+
+# Display strings are fixed by the table above, so format them once at import
+_SIZE_DISPLAY = {key: _format_size_limit(reg["size"]) for key, reg in SPECIES_REGULATIONS.items()}
+_CREEL_DISPLAY = {key: _format_creel_limit(reg["creel"]) for key, reg in SPECIES_REGULATIONS.items()}
+
+
 def get_size_limit_display(species_key: str) -> str:
     """
     Get formatted size limit string for display.
@@ -227,22 +260,7 @@ def get_size_limit_display(species_key: str) -> str:
     Returns:
         Formatted string like "15\"-22\"" or "18\"-N/A" or "N/A"
     """
-    if species_key not in SPECIES_REGULATIONS:
-        return "N/A"
-
-    reg = SPECIES_REGULATIONS[species_key]
-    size = reg["size"]
-
-    min_size = size.get("min_inches")
-    max_size = size.get("max_inches")
-
-    if min_size is None and max_size is None:
-        return "N/A"
-
-    min_str = f'{min_size}"' if min_size is not None else "N/A"
-    max_str = f'{max_size}"' if max_size is not None else "N/A"
-
-    return f"{min_str}-{max_str}"
+    return _SIZE_DISPLAY.get(species_key, "N/A")
 
 
 def get_creel_limit_display(species_key: str) -> str:
@@ -255,27 +273,17 @@ def get_creel_limit_display(species_key: str) -> str:
     Returns:
         Formatted string like "6 per person" or "N/A"
     """
-    if species_key not in SPECIES_REGULATIONS:
-        return "N/A"
-
-    reg = SPECIES_REGULATIONS[species_key]
-    creel = reg["creel"]
-
-    per_person = creel.get("per_person")
-    per_vessel = creel.get("per_vessel")
-
-    if per_person is not None:
-        return f"{per_person} per person"
-    elif per_vessel is not None:
-        return f"{per_vessel} per vessel"
-    else:
-        return "N/A"
+    return _CREEL_DISPLAY.get(species_key, "N/A")
 
 
+@lru_cache(maxsize=32)
 def get_regulations(species_key: str) -> dict:
     """
     Get full regulations for a species.
 
+    Results are cached per species key, so callers must treat the returned
+    dict as read-only.
+
     Args:
         species_key: Species key (e.g., 'speckled_trout')
 
@@ -290,7 +298,7 @@ def get_regulations(species_key: str) -> dict:
         }
 
     return {
-        "size_display": get_size_limit_display(species_key),
-        "creel_display": get_creel_limit_display(species_key),
+        "size_display": _SIZE_DISPLAY[species_key],
+        "creel_display": _CREEL_DISPLAY[species_key],
         "regulations": SPECIES_REGULATIONS[species_key]
     }
@@ -6,8 +6,9 @@ Running factor scale:
 - 0.6 = Decent presence
 - 1.0 = Peak season
 """
-from datetime import datetime
-from typing import Dict
+from datetime import date as date_cls
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 # Month indices: 1=Jan, 2=Feb, ..., 12=Dec
 # Rating scale: 0.0=N/A, 0.2=poor, 0.4=fair, 0.6=good, 0.8=great, 1.0=excellent
@@ -213,37 +214,61 @@ SPECIES_SEASONALITY: Dict[str, Dict[int, float]] = {
 # List of all species tracked
 SPECIES_LIST = list(SPECIES_SEASONALITY.keys())
 
+# Running factors per species as a tuple indexed directly by month number
+# (index 0 unused), so a lookup is one hash plus one index
+_SEASON_TABLE: Dict[str, Tuple[float, ...]] = {
+    species: tuple([0.0] + [months.get(month, 0.0) for month in range(1, 13)])
+    for species, months in SPECIES_SEASONALITY.items()
+}
+
+
+@lru_cache(maxsize=128)
+def normalize_species_key(species: str) -> str:
+    """Convert a species name like 'Speckled Trout' to its key ('speckled_trout')."""
+    return species.lower().replace(' ', '_')
+
 
-def get_running_factor(species: str, date: datetime = None) -> float:
+def get_running_factor(species: str, date: Optional[date_cls] = None) -> float:
     """
     Get the seasonal running factor for a species on a given date.
 
     Args:
         species: Species name (use underscores, e.g., 'speckled_trout')
-        date: Date to check (defaults to today)
+        date: Date (or datetime) to check (defaults to today)
 
     Returns:
         Running factor from 0.0 to 1.0
     """
     if date is None:
-        date = datetime.now()
+        date = date_cls.today()
 
-    species_key = species.lower().replace(' ', '_')
+    return get_month_running_factor(species, date.month)
 
-    if species_key not in SPECIES_SEASONALITY:
-        return 0.0
 
-    month = date.month
-    return SPECIES_SEASONALITY[species_key].get(month, 0.0)
+def get_month_running_factor(species: str, month: int) -> float:
+    """
+    Get the seasonal running factor for a species in a given month.
 
+    Args:
+        species: Species name (use underscores, e.g., 'speckled_trout')
+        month: Month number (1-12)
 
-def is_species_running(species: str, date: datetime = None, threshold: float = 0.4) -> bool:
+    Returns:
+        Running factor from 0.0 to 1.0
+    """
+    months = _SEASON_TABLE.get(species)
+    if months is None:
+        months = _SEASON_TABLE.get(normalize_species_key(species))
+    return months[month] if months is not None else 0.0
+
+
+def is_species_running(species: str, date: Optional[date_cls] = None, threshold: float = 0.4) -> bool:
     """
     Check if a species is considered 'running' (seasonally present).
 
     Args:
         species: Species name
-        date: Date to check (defaults to today)
+        date: Date (or datetime) to check (defaults to today)
         threshold: Minimum running factor to be considered 'running' (default 0.4 = fair or better)
 
     Returns:
@@ -252,22 +277,28 @@ def is_species_running(species: str, date: datetime = None, threshold: float = 0
     return get_running_factor(species, date) >= threshold
 
 
+# Display names for species keys
+_DISPLAY_NAMES = {
+    "speckled_trout": "Speckled Trout",
+    "redfish": "Redfish",
+    "flounder": "Flounder",
+    "sheepshead": "Sheepshead",
+    "mullet": "Mullet",
+    "mackerel": "Mackerel",
+    "croaker": "Croaker",
+    "stingray": "Stingray",
+    "shark": "Shark",
+    "black_drum": "Black Drum",
+    "tripletail": "Tripletail (Blackfish)",
+    "jack_crevalle": "Jack Crevalle",
+    "white_trout": "White Trout",
+    "blue_crab": "Blue Crab"
+}
+
+
 def get_species_display_name(species: str) -> str:
     """Convert species key to display name."""
-    display_names = {
-        "speckled_trout": "Speckled Trout",
-        "redfish": "Redfish",
-        "flounder": "Flounder",
-        "sheepshead": "Sheepshead",
-        "mullet": "Mullet",
-        "mackerel": "Mackerel",
-        "croaker": "Croaker",
-        "stingray": "Stingray",
-        "shark": "Shark",
-        "black_drum": "Black Drum",
-        "tripletail": "Tripletail (Blackfish)",
-        "jack_crevalle": "Jack Crevalle",
-        "white_trout": "White Trout",
-        "blue_crab": "Blue Crab"
-    }
-    return display_names.get(species, species.replace('_', ' ').title())
+    display_name = _DISPLAY_NAMES.get(species)
+    if display_name is None:
+        display_name = species.replace('_', ' ').title()
+    return display_name
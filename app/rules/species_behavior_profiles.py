@@ -3,6 +3,8 @@
 Each Tier 1 species has comprehensive preferences for environmental conditions.
 Tier 2 species have simplified profiles.
 """
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # TIER 1 SPECIES PROFILES
 
@@ -590,7 +592,17 @@ BLUE_CRAB = {
     },
 }
 
-# Master dictionary
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Master dictionary (read-only: profiles are shared by every caller)
 SPECIES_PROFILES = {
     'speckled_trout': SPECKLED_TROUT,
     'redfish': REDFISH,
@@ -606,9 +618,13 @@ SPECIES_PROFILES = {
     'jack_crevalle': JACK_CREVALLE,
     'blue_crab': BLUE_CRAB,
 }
+SPECIES_PROFILES = _freeze(SPECIES_PROFILES)
+
+# Prey species (affected by predator penalties)
+_PREY_SPECIES = frozenset(['speckled_trout', 'white_trout', 'menhaden', 'mullet', 'live_shrimp'])
 
 
-def get_species_profile(species_key: str) -> dict:
+def get_species_profile(species_key: str) -> Mapping:
     """
     Get behavior profile for a species.
 
@@ -616,7 +632,7 @@ def get_species_profile(species_key: str) -> dict:
         species_key: Species identifier
 
     Returns:
-        Profile dictionary or empty dict if not found
+        Read-only profile mapping, or an empty dict if not found
     """
     return SPECIES_PROFILES.get(species_key, {})
 
@@ -627,5 +643,4 @@ def is_prey_species(species_key: str) -> bool:
 
     Prey species: trout, white trout, bait species
     """
-    prey_list = ['speckled_trout', 'white_trout', 'menhaden', 'mullet', 'live_shrimp']
-    return species_key in prey_list
+    return species_key in _PREY_SPECIES
@@ -0,0 +1,221 @@
+"""Per-species scoring parameters for bite logic.
+
+Species parameters are stored as tables indexed by integer species id, so the
+sub-score functions in bite_logic look up a row instead of walking a
+per-species block of if-statements.
+
+Piecewise parameters are stored as (breaks, scores) pairs for use with
+bisect.bisect_right: a value v scores scores[i], where i is the number of
+breaks <= v. A strict "v > x" bound is written as _above(x).
+"""
+import math
+import sys
+from enum import IntEnum
+
+
+class SpeciesId(IntEnum):
+    """Integer species ids, used to index the parameter tables."""
+    SPECKLED_TROUT = 0
+    REDFISH = 1
+    FLOUNDER = 2
+    SHEEPSHEAD = 3
+    BLACK_DRUM = 4
+    WHITE_TROUT = 5
+    CROAKER = 6
+    TRIPLETAIL = 7
+    BLUE_CRAB = 8
+    MULLET = 9
+    JACK_CREVALLE = 10
+    MACKEREL = 11
+    SHARK = 12
+    STINGRAY = 13
+
+
+(
+    SPECKLED_TROUT, REDFISH, FLOUNDER, SHEEPSHEAD, BLACK_DRUM, WHITE_TROUT, CROAKER,
+    TRIPLETAIL, BLUE_CRAB, MULLET, JACK_CREVALLE, MACKEREL, SHARK, STINGRAY
+) = SpeciesId
+UNKNOWN_SPECIES = -1
+
+# Species keys in id order (interned, e.g. 'speckled_trout')
+SPECIES = tuple(sys.intern(sid.name.lower()) for sid in SpeciesId)
+
+SPECIES_ID = {species: sid for species, sid in zip(SPECIES, SpeciesId)}
+
+
+def species_id(species: str) -> int:
+    """Map a species key to its SpeciesId, or UNKNOWN_SPECIES."""
+    return SPECIES_ID.get(species, UNKNOWN_SPECIES)
+
+
+def _above(x: float) -> float:
+    """Smallest float greater than x, for strict lower bounds in break lists."""
+    return math.nextafter(x, math.inf)
+
+
+# ============================================================================
+# TIDE
+# ============================================================================
+
+# Tide change rate above which moving water counts as "fast"
+# (0.0 for species that don't care how fast the tide runs)
+TIDE_RATE_THRESH = (
+    0.3, 0.2, 0.3, 0.0, 0.0, 0.25, 0.2, 0.0, 0.2, 0.2, 0.3, 0.3, 0.2, 0.0,
+)
+
+# Column index per tide state; a moving tide below its rate threshold uses the
+# next (slow) column, and anything else uses column 5
+TIDE_STATES = {'rising': 0, 'falling': 2, 'slack': 4}
+TIDE_OTHER = 5
+
+# Columns: rising fast, rising slow, falling fast, falling slow, slack, other
+TIDE_SCORES = (
+    (0.9, 0.7, 0.9, 0.7, 0.3, 0.5),         # speckled_trout: love moving water
+    (0.85, 0.65, 0.85, 0.65, 0.4, 0.5),     # redfish: moving water is key
+    (0.65, 0.5, 0.95, 0.75, 0.3, 0.5),      # flounder: LOVE falling tide
+    (0.55, 0.55, 0.55, 0.55, 0.7, 0.55),    # sheepshead: slack around structure
+    (0.65, 0.65, 0.65, 0.65, 0.55, 0.55),   # black_drum: less tide dependent
+    (0.8, 0.5, 0.8, 0.5, 0.4, 0.5),         # white_trout: prefer moving water
+    (0.75, 0.55, 0.75, 0.55, 0.55, 0.55),   # croaker: moderate movement
+    (0.6, 0.6, 0.6, 0.6, 0.5, 0.5),         # tripletail: not very tide dependent
+    (0.9, 0.5, 0.9, 0.5, 0.4, 0.5),         # blue_crab: crabs move with tide
+    (0.7, 0.5, 0.7, 0.5, 0.5, 0.5),         # mullet: like moving water
+    (0.85, 0.5, 0.85, 0.5, 0.35, 0.5),      # jack_crevalle: love moving water
+    (0.85, 0.5, 0.85, 0.5, 0.35, 0.5),      # mackerel: like moving water
+    (0.8, 0.5, 0.8, 0.5, 0.4, 0.5),         # shark: prefer moving water
+    (0.65, 0.65, 0.65, 0.65, 0.5, 0.5),     # stingray: like some movement
+)
+
+
+# ============================================================================
+# WIND (mph)
+# ============================================================================
+
+# Wind speed band edges per species
+WIND_BREAKS = (
+    (10.0, 15.0, 20.0),                 # speckled_trout
+    (15.0, 20.0, 25.0),                 # redfish: can handle more wind
+    (12.0, 20.0),                       # flounder
+    (30.0,),                            # sheepshead: can handle wind well
+    (20.0, 30.0),                       # black_drum: can handle wind well
+    (10.0, 20.0),                       # white_trout: prefer calm to moderate
+    (12.0, 20.0),                       # croaker
+    (10.0, 20.0),                       # tripletail: calm is best for sight fishing
+    (15.0, 25.0),                       # blue_crab: can handle moderate wind
+    (5.0, _above(5.0), 15.0, 25.0),     # mullet: moderate wind stirs surface
+    (5.0, _above(5.0), 20.0, 25.0),     # jack_crevalle: moderate wind stirs bait
+    (15.0, 20.0),                       # mackerel
+    (_above(5.0), 20.0, 25.0),          # shark: moderate wind stirs baitfish
+    (25.0,),                            # stingray: not very sensitive
+)
+
+# Score per wind band (one more entry than WIND_BREAKS)
+WIND_SCORES = (
+    (0.8, 0.6, 0.4, 0.2),
+    (0.75, 0.6, 0.45, 0.3),
+    (0.75, 0.55, 0.3),
+    (0.7, 0.3),
+    (0.75, 0.6, 0.35),
+    (0.8, 0.55, 0.35),
+    (0.75, 0.55, 0.3),
+    (0.85, 0.45, 0.25),
+    (0.75, 0.55, 0.35),
+    (0.6, 0.45, 0.8, 0.45, 0.3),
+    (0.6, 0.5, 0.8, 0.5, 0.3),
+    (0.8, 0.5, 0.25),
+    (0.6, 0.75, 0.6, 0.35),
+    (0.65, 0.4),
+)
+
+
+# ============================================================================
+# TEMPERATURE (°F, water temperature when available)
+# ============================================================================
+
+# Temperature band edges per species (inclusive upper bounds use _above)
+TEMP_BREAKS = (
+    (55.0, 60.0, _above(80.0), _above(90.0)),   # speckled_trout
+    (50.0, 55.0, _above(85.0), _above(95.0)),   # redfish
+    (55.0, 60.0, _above(80.0), _above(90.0)),   # flounder
+    (45.0, 50.0),                               # sheepshead
+    (45.0, 50.0, _above(75.0), _above(85.0)),   # black_drum: tolerant of cold water
+    (50.0, 55.0, _above(85.0), _above(95.0)),   # white_trout
+    (60.0, _above(70.0)),                       # croaker: like warm
+    (65.0, _above(70.0), _above(75.0)),         # tripletail: warm water species
+    (60.0, _above(70.0), _above(75.0)),         # blue_crab: very active in heat
+    (60.0, _above(75.0)),                       # mullet: love warm
+    (65.0, _above(70.0), _above(75.0)),         # jack_crevalle: warm water
+    (60.0, 65.0, _above(85.0), _above(90.0)),   # mackerel
+    (65.0, _above(70.0), _above(75.0)),         # shark: warm water species
+    (65.0, _above(75.0)),                       # stingray: very warm-water dependent
+)
+
+# Score per temperature band (one more entry than TEMP_BREAKS)
+TEMP_SCORES = (
+    (0.3, 0.65, 0.9, 0.65, 0.3),
+    (0.3, 0.6, 0.85, 0.6, 0.4),
+    (0.35, 0.65, 0.85, 0.65, 0.35),
+    (0.3, 0.55, 0.75),
+    (0.4, 0.65, 0.85, 0.65, 0.4),
+    (0.25, 0.55, 0.8, 0.55, 0.25),
+    (0.3, 0.65, 0.85),
+    (0.2, 0.5, 0.75, 0.9),
+    (0.2, 0.5, 0.8, 0.95),
+    (0.25, 0.65, 0.9),
+    (0.25, 0.5, 0.75, 0.9),
+    (0.4, 0.6, 0.8, 0.6, 0.4),
+    (0.2, 0.55, 0.75, 0.9),
+    (0.2, 0.6, 0.9),
+)
+
+
+# ============================================================================
+# PRESSURE
+# ============================================================================
+
+# Column index per pressure trend; anything else uses column 3
+PRESSURE_TRENDS = {'falling': 0, 'stable': 1, 'rising': 2}
+
+# Columns: falling, stable, rising, other
+PRESSURE_SCORES = (
+    (0.85, 0.6, 0.45, 0.45),    # speckled_trout: falling (pre-front) is good
+    (0.75, 0.75, 0.55, 0.55),   # redfish: stable or falling is good
+    (0.65, 0.85, 0.55, 0.55),   # flounder: stable is best
+    (0.6, 0.6, 0.6, 0.6),       # sheepshead: not very sensitive
+    (0.6, 0.8, 0.8, 0.6),       # black_drum: stable or rising is good
+    (0.9, 0.7, 0.5, 0.5),       # white_trout: falling is excellent
+    (0.6, 0.75, 0.6, 0.6),      # croaker: stable is good
+    (0.65, 0.8, 0.55, 0.55),    # tripletail: stable is best
+    (0.45, 0.75, 0.75, 0.45),   # blue_crab: stable or rising is good
+    (0.6, 0.6, 0.6, 0.6),       # mullet: not very sensitive
+    (0.8, 0.65, 0.55, 0.55),    # jack_crevalle: falling (pre-front) is good
+    (0.65, 0.75, 0.6, 0.6),     # mackerel: stable is good
+    (0.65, 0.6, 0.6, 0.6),      # shark: slight preference for falling
+    (0.55, 0.7, 0.55, 0.55),    # stingray: stable is better
+)
+
+
+# ============================================================================
+# CLOUD COVER
+# ============================================================================
+
+# Column index per cloud cover; anything else uses column 4
+CLOUD_COVERS = {'clear': 0, 'partly_cloudy': 1, 'mostly_cloudy': 2, 'overcast': 3}
+
+# Columns: clear, partly_cloudy, mostly_cloudy, overcast, other
+CLOUD_SCORES = (
+    (0.55, 0.75, 0.55, 0.85, 0.55),   # speckled_trout: prefer overcast/partly cloudy
+    (0.65, 0.65, 0.65, 0.65, 0.65),   # redfish: less picky
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # flounder: less dependent
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # sheepshead: not very sensitive
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # black_drum: not very sensitive
+    (0.6, 0.6, 0.75, 0.75, 0.6),      # white_trout: overcast is good
+    (0.65, 0.65, 0.65, 0.65, 0.65),   # croaker: overcast ok
+    (0.8, 0.8, 0.5, 0.5, 0.5),        # tripletail: clear to partly cloudy for sight fishing
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # blue_crab: not very sensitive
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # mullet: not very sensitive
+    (0.6, 0.6, 0.6, 0.7, 0.6),        # jack_crevalle: slightly prefer overcast
+    (0.75, 0.65, 0.5, 0.5, 0.5),      # mackerel: prefer clearer conditions
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # shark: not very sensitive
+    (0.6, 0.6, 0.6, 0.6, 0.6),        # stingray: not very sensitive
+)
@@ -30,6 +30,16 @@ BAIT_SPECIES = [
     'fiddler_crab',
 ]
 
+# Bait-only species (should NOT appear in the fish forecast). Mullet is used
+# as bait but is also forecast as a fish, so it is not listed here.
+BAIT_ONLY_SPECIES = [
+    'live_shrimp',      # Live Shrimp
+    'menhaden',         # Menhaden / Pogies
+    'live_bait_fish',   # Generic live bait fish
+    'pinfish',          # Pinfish
+    'fiddler_crab',     # Fiddler Crabs
+]
+
 # Predator species that trigger bite penalties for prey
 PREDATOR_SPECIES = [
     'jack_crevalle',
@@ -37,6 +47,14 @@ PREDATOR_SPECIES = [
     # Dolphins and bull reds logged via PredatorLog table
 ]
 
+# Hashed sets for membership tests (the lists above keep display order)
+_BAIT_SET = frozenset(BAIT_SPECIES)
+_PREDATOR_SET = frozenset(PREDATOR_SPECIES)
+
+# Species key to tier number
+_TIER_MAP = {species: 2 for species in TIER_2_SPECIES}
+_TIER_MAP.update((species, 1) for species in TIER_1_SPECIES)
+
 
 def get_species_tier(species_key: str) -> int:
     """
@@ -48,23 +66,18 @@ def get_species_tier(species_key: str) -> int:
     Returns:
         1 for Tier 1 (full analytics), 2 for Tier 2 (simplified)
     """
-    if species_key in TIER_1_SPECIES:
-        return 1
-    elif species_key in TIER_2_SPECIES:
-        return 2
-    else:
-        # Default to Tier 2 for unknown species
-        return 2
+    # Default to Tier 2 for unknown species
+    return _TIER_MAP.get(species_key, 2)
 
 
 def is_bait_species(species_key: str) -> bool:
     """Check if species is primarily a bait species."""
-    return species_key in BAIT_SPECIES
+    return species_key in _BAIT_SET
 
 
 def is_predator_species(species_key: str) -> bool:
     """Check if species triggers predator penalties."""
-    return species_key in PREDATOR_SPECIES
+    return species_key in _PREDATOR_SET
 
 
 def should_use_full_scoring(species_key: str) -> bool:
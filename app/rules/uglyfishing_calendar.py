@@ -10,31 +10,40 @@ This module maps the existing 0-1.0 seasonal ratings to the UglyFishing scale:
 
 These become the seasonal baseline scores that environmental factors modify.
 """
-from datetime import datetime
-from typing import Dict
+from bisect import bisect_left
+from datetime import date as date_cls
+from functools import lru_cache
+from typing import Dict, Optional
 
+from app.rules.seasonality import SPECIES_LIST, get_month_running_factor, normalize_species_key
+from app.rules.species_tiers import TIER_1_SPECIES, TIER_2_SPECIES, BAIT_ONLY_SPECIES
 
-def get_seasonal_baseline_score(species: str, date: datetime = None) -> float:
+
+def get_seasonal_baseline_score(species: str, date: Optional[date_cls] = None) -> float:
     """
     Get the seasonal baseline score (0-100) for a species using UglyFishing scale.
 
     Args:
         species: Species name (use underscores, e.g., 'speckled_trout')
-        date: Date to check (defaults to today)
+        date: Date (or datetime) to check (defaults to today)
 
     Returns:
         Baseline score from 0-90 based on seasonal rating
     """
-    from app.rules.seasonality import get_running_factor
-
     if date is None:
-        date = datetime.now()
+        date = date_cls.today()
+
+    # Callers almost always pass canonical keys; only normalize on a miss
+    months = _BASELINE_TABLE.get(species)
+    if months is None:
+        months = _BASELINE_TABLE.get(normalize_species_key(species))
+    return months[date.month] if months is not None else 0.0
 
-    # Get the 0-1.0 running factor
-    running_factor = get_running_factor(species, date)
 
-    # Convert to UglyFishing scale
-    return running_factor_to_baseline(running_factor)
+# Upper edge (inclusive) of each running factor band, and the baseline score
+# for each band (one more entry than _RUNNING_FACTOR_EDGES)
+_RUNNING_FACTOR_EDGES = (0.0, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+_BASELINE_SCORES = (0.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 85.0, 90.0)
 
 
 def running_factor_to_baseline(running_factor: float) -> float:
@@ -53,26 +62,23 @@ def running_factor_to_baseline(running_factor: float) -> float:
     - 0.9 → 85
     - 1.0 (Excellent) → 90
     """
-    if running_factor <= 0.0:
-        return 0.0
-    elif running_factor <= 0.2:
-        return 20.0
-    elif running_factor <= 0.3:
-        return 30.0
-    elif running_factor <= 0.4:
-        return 40.0
-    elif running_factor <= 0.5:
-        return 50.0
-    elif running_factor <= 0.6:
-        return 60.0
-    elif running_factor <= 0.7:
-        return 70.0
-    elif running_factor <= 0.8:
-        return 80.0
-    elif running_factor <= 0.9:
-        return 85.0
-    else:  # 1.0
-        return 90.0
+    # Number of band edges strictly below the factor picks the score
+    return _BASELINE_SCORES[bisect_left(_RUNNING_FACTOR_EDGES, running_factor)]
+
+
+# Baseline score per species as a tuple indexed by month number (index 0
+# unused), precomputed from the seasonality table
+_BASELINE_TABLE = {
+    species: tuple(
+        [0.0] + [running_factor_to_baseline(get_month_running_factor(species, month)) for month in range(1, 13)]
+    )
+    for species in SPECIES_LIST
+}
+
+
+# Upper edge (inclusive) of each rating band, and the label for each band
+_RATING_EDGES = (0, 20, 40, 60, 80)
+_RATING_LABELS = ("N/A", "Poor", "Fair", "Good", "Great", "Excellent")
 
 
 def baseline_to_rating_label(baseline: float) -> str:
@@ -85,49 +91,27 @@ def baseline_to_rating_label(baseline: float) -> str:
     Returns:
         Rating label: N/A, Poor, Fair, Good, Great, Excellent
     """
-    if baseline <= 0:
-        return "N/A"
-    elif baseline <= 20:
-        return "Poor"
-    elif baseline <= 40:
-        return "Fair"
-    elif baseline <= 60:
-        return "Good"
-    elif baseline <= 80:
-        return "Great"
-    else:
-        return "Excellent"
-
-
-# Priority species tiers (for UI display)
-TIER_1_SPECIES = [
-    "speckled_trout",
-    "redfish",
-    "flounder",
-    "sheepshead",
-    "black_drum"
-]
-
-TIER_2_SPECIES = [
-    "croaker",
-    "white_trout",
-    "jack_crevalle",
-    "mullet"
-]
-
-# Bait species (should NOT appear in fish forecast)
-BAIT_SPECIES = [
-    "live_shrimp",      # Live Shrimp
-    "menhaden",         # Menhaden / Pogies
-    "live_bait_fish",   # Generic live bait fish
-    "pinfish",          # Pinfish
-    "fiddler_crab",     # Fiddler Crabs
-]
+    return _RATING_LABELS[bisect_left(_RATING_EDGES, baseline)]
+
+
+# Species tiers and bait species are defined once in species_tiers; this
+# module's BAIT_SPECIES are the bait-only species kept out of the fish forecast
+BAIT_SPECIES = BAIT_ONLY_SPECIES
+
+# Hashed set for bait membership tests
+_BAIT_SET = frozenset(BAIT_SPECIES)
+
+# Species to tier number (bait species are tier 0). Tier 1 overrides bait,
+# which overrides tier 2, so menhaden (tier 2 in species_tiers) stays tier 0.
+_TIER_MAP = {species: 2 for species in TIER_2_SPECIES}
+_TIER_MAP.update((species, 0) for species in BAIT_SPECIES)
+_TIER_MAP.update((species, 1) for species in TIER_1_SPECIES)
 
 
+@lru_cache(maxsize=128)
 def is_bait_species(species: str) -> bool:
     """Check if a species is a bait species (should not appear in fish forecast)."""
-    return species.lower() in BAIT_SPECIES
+    return species.lower() in _BAIT_SET
 
 
 def is_fish_species(species: str) -> bool:
@@ -145,11 +129,4 @@ def get_species_tier(species: str) -> int:
     Returns:
         1 for priority species, 2 for tier 2, 0 for bait species
     """
-    if species in TIER_1_SPECIES:
-        return 1
-    elif species in TIER_2_SPECIES:
-        return 2
-    elif species in BAIT_SPECIES:
-        return 0  # Bait species
-    else:
-        return 2  # Default to tier 2
+    return _TIER_MAP.get(species, 2)  # Default to tier 2
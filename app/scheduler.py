@@ -1,66 +1,235 @@
 """Background scheduler for periodic data fetching and forecast updates."""
+from apscheduler.executors.pool import ThreadPoolExecutor as APSThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
-from datetime import datetime
-from app.database import SessionLocal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func, literal, null, select, union_all
+from app.database import scheduler_session
+from app.models.schemas import Catch, PredatorLog, SchedulerState
 from app.services import (
     fetch_tide_data,
     fetch_weather_data,
     fetch_astronomical_data,
     compute_forecasts
 )
+from app.services.environment_snapshot import capture_environment_snapshot
+from app.services.score_cache_service import load_conditions, recalculate_bite_scores_bulk
+from app.services.tip_generation_service import update_species_zone_tips_bulk
 from app.services.watertemp_service import update_water_temperature_cache
 from app.services.weather_observations import update_weather_observations_cache
 from app.config import config
+from app.rules.species_tiers import TIER_1_SPECIES
+from app.utils.logging_config import setup_logging
 import logging
+import multiprocessing
+import queue
 
 logger = logging.getLogger(__name__)
 
-scheduler = BackgroundScheduler()
+# Few enough worker threads that concurrent jobs can't exhaust the DB pool
+# (see app.database.POOL_SIZE)
+SCHEDULER_MAX_WORKERS = 4
 
+scheduler = BackgroundScheduler(
+    executors={'default': APSThreadPoolExecutor(max_workers=SCHEDULER_MAX_WORKERS)},
+    job_defaults={'coalesce': True, 'max_instances': 1}
+)
+
+ZONES = ('Zone 1', 'Zone 2', 'Zone 3', 'Zone 4', 'Zone 5')
+
+# Pairs recalculated when there has been no recent activity
+_FALLBACK_PAIRS = frozenset(
+    (species, zone) for species in TIER_1_SPECIES for zone in ZONES
+)
+
+# Species whose scores a predator sighting affects
+PREY_SPECIES = ('speckled_trout', 'white_trout', 'menhaden', 'mullet')
+
+# PREY_SPECIES as a one-column table for the recent-activity query
+_PREY_TABLE = union_all(
+    *(select(literal(species).label('species')) for species in PREY_SPECIES)
+).cte('prey')
+
+# How long a species+zone pair keeps getting periodic recalculation after activity
+RECENT_ACTIVITY_WINDOW = timedelta(hours=6)
+
+# Minutes between periodic score recalculations
+RECALC_INTERVAL_MINUTES = 30
+
+# Delay before the first score recalculation when the cache needs warming
+RECALC_WARMUP_DELAY = timedelta(seconds=30)
+
+# (species, zone, logged_at) entries from the write endpoints
+INVALIDATION_Q = queue.Queue(maxsize=10_000)
 
-def fetch_water_temperature():
-    """Fetch water temperature from NOAA (independent of main data fetch)."""
+# Last activity time per species+zone pair, maintained by periodic_score_recalculation
+_recent_pairs: Dict[Tuple[str, str], datetime] = {}
+_recent_pairs_seeded = False
+
+# Hour the stored forecast windows start from (None until a successful compute)
+_last_forecast_hour: Optional[datetime] = None
+
+
+def fetch_water_temperature() -> Tuple[bool, bool]:
+    """
+    Fetch water temperature from NOAA (independent of main data fetch).
+
+    Returns:
+        (success, changed) tuple
+    """
     logger.info("Fetching water temperature from NOAA...")
     try:
-        success = update_water_temperature_cache()
+        success, changed = update_water_temperature_cache()
         if success:
             logger.info("Water temperature updated successfully")
         else:
             logger.warning("Failed to update water temperature")
+        return success, changed
     except Exception as e:
         logger.error(f"Error fetching water temperature: {e}")
+        return False, False
+
 
+def fetch_weather_observations() -> Tuple[bool, bool]:
+    """
+    Fetch weather observations from NOAA (air temp, wind, pressure).
 
-def fetch_weather_observations():
-    """Fetch weather observations from NOAA (air temp, wind, pressure)."""
+    Returns:
+        (success, changed) tuple
+    """
     logger.info("Fetching weather observations from NOAA...")
     try:
-        success = update_weather_observations_cache()
+        success, changed = update_weather_observations_cache()
         if success:
             logger.info("Weather observations updated successfully")
         else:
             logger.warning("Failed to update weather observations")
+        return success, changed
     except Exception as e:
         logger.error(f"Error fetching weather observations: {e}")
+        return False, False
 
 
 def capture_environment():
     """Capture environment snapshot - NEW HYPERLOCAL SPEC."""
     logger.info("Capturing environment snapshot...")
-    db = SessionLocal()
     try:
-        from app.services.environment_snapshot import capture_environment_snapshot
-
-        success = capture_environment_snapshot(db)
-        if success:
-            logger.info("Environment snapshot captured successfully")
-        else:
-            logger.warning("Failed to capture environment snapshot")
+        with scheduler_session() as db:
+            success = capture_environment_snapshot(db)
+            if success:
+                logger.info("Environment snapshot captured successfully")
+            else:
+                logger.warning("Failed to capture environment snapshot")
     except Exception as e:
         logger.error(f"Error capturing environment snapshot: {e}")
-    finally:
-        db.close()
+
+
+def enqueue_invalidation(species: str, zone: str) -> None:
+    """
+    Record new activity for a species+zone pair.
+
+    Called by the catch and predator write endpoints; the pair keeps getting
+    periodic recalculation (decay) for RECENT_ACTIVITY_WINDOW afterwards.
+
+    Args:
+        species: Species key (e.g., 'speckled_trout')
+        zone: Zone identifier (e.g., 'Zone 3')
+    """
+    try:
+        INVALIDATION_Q.put_nowait((species, zone, datetime.utcnow()))
+    except queue.Full:
+        logger.warning(f"Invalidation queue full, dropping {species} {zone}")
+
+
+def _load_recent_pairs(db, cutoff: datetime) -> Dict[Tuple[str, str], datetime]:
+    """
+    Scan the catch and predator logs for species+zone pairs active since cutoff.
+
+    Only used to seed _recent_pairs after a restart; afterwards new activity
+    arrives through INVALIDATION_Q.
+
+    Returns:
+        Dictionary of (species, zone) -> most recent activity time
+    """
+    # Catch and predator activity (predator rows have no species)
+    recent = union_all(
+        select(
+            Catch.species.label('species'), Catch.zone_id.label('zone'),
+            func.max(Catch.timestamp).label('last_seen')
+        ).where(Catch.timestamp >= cutoff).group_by(Catch.species, Catch.zone_id),
+        select(
+            null(), PredatorLog.zone, func.max(PredatorLog.time)
+        ).where(PredatorLog.time >= cutoff).group_by(PredatorLog.zone),
+    ).cte('recent')
+
+    # Dedupe on the server so only the final pairs come back; predator-affected
+    # zones fan out to the prey species
+    prey = _PREY_TABLE
+    pair_species = func.coalesce(recent.c.species, prey.c.species)
+    query = select(
+        pair_species, recent.c.zone, func.max(recent.c.last_seen)
+    ).select_from(
+        recent.outerjoin(prey, recent.c.species.is_(None))
+    ).group_by(pair_species, recent.c.zone)
+
+    return {(species, zone): last_seen for species, zone, last_seen in db.execute(query)}
+
+
+def _recalculate_pairs(pairs: List[Tuple[str, str]], run_ts: datetime, conditions: Dict) -> int:
+    """
+    Recalculate bite scores and tips for species+zone pairs as of run_ts.
+
+    Runs in _score_executor's worker process, with its own database session.
+    Conditions are loaded by the parent, since the worker's water temperature
+    and observation caches are never refreshed.
+
+    Returns:
+        Number of pairs updated
+    """
+    with scheduler_session() as db:
+        results = recalculate_bite_scores_bulk(db, pairs, now=run_ts, conditions=conditions)
+        count = update_species_zone_tips_bulk(
+            db, [(result['species'], result['zone_id']) for result in results], now=run_ts
+        )
+
+    return count
+
+
+def _new_score_executor() -> ProcessPoolExecutor:
+    """
+    Create the single-worker process pool used for score recalculation.
+
+    The worker is spawned rather than forked: it starts on first submit from a
+    scheduler thread, when other threads may hold locks (logging, the DB pool)
+    that a forked child would inherit locked. A spawned child doesn't import
+    app.main, so it sets up logging itself.
+    """
+    return ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=setup_logging
+    )
+
+
+def _run_score_job(*args) -> int:
+    """Run _recalculate_pairs in the worker, restarting the pool once if the worker died."""
+    global _score_executor
+
+    try:
+        return _score_executor.submit(_recalculate_pairs, *args).result()
+    except BrokenProcessPool:
+        logger.warning("Score worker process died, restarting it")
+        _score_executor.shutdown(wait=False)
+        _score_executor = _new_score_executor()
+        return _score_executor.submit(_recalculate_pairs, *args).result()
+
+
+# Score recalculation is CPU bound and would hold the GIL while the fetch jobs
+# wait, so it runs in a separate process
+_score_executor = _new_score_executor()
 
 
 def periodic_score_recalculation():
@@ -71,167 +240,213 @@ def periodic_score_recalculation():
     - Apply decay to recent activity bonuses
     - Apply decay to predator penalties
     - Reflect changing environmental conditions
+
+    Recent activity comes from INVALIDATION_Q rather than rescanning the log
+    tables each run; the tables are only scanned once after startup.
     """
+    global _recent_pairs_seeded
+
     logger.info("Running periodic score recalculation...")
-    db = SessionLocal()
     try:
-        from datetime import timedelta
-        from app.models.schemas import Catch, BaitLog, PredatorLog, BiteScore
-        from app.services.score_cache_service import recalculate_bite_score
-        from app.services.tip_generation_service import update_species_zone_tip
-        from app.rules.species_tiers import TIER_1_SPECIES
+        # One as-of time for the whole run
+        run_ts = datetime.utcnow()
 
         # Get species+zone pairs with recent activity (last 6 hours)
-        cutoff = datetime.utcnow() - timedelta(hours=6)
-
-        # Find zones with recent catches
-        recent_catches = db.query(Catch.species, Catch.zone_id).filter(
-            Catch.timestamp >= cutoff
-        ).distinct().all()
+        cutoff = run_ts - RECENT_ACTIVITY_WINDOW
 
-        # Find zones with recent bait activity
-        recent_bait = db.query(BaitLog.zone_id).filter(
-            BaitLog.timestamp >= cutoff
-        ).distinct().all()
+        if not _recent_pairs_seeded:
+            with scheduler_session() as db:
+                _recent_pairs.update(_load_recent_pairs(db, cutoff))
+            _recent_pairs_seeded = True
 
-        # Find zones with recent predator activity
-        recent_predators = db.query(PredatorLog.zone).filter(
-            PredatorLog.time >= cutoff
-        ).distinct().all()
-
-        # Collect unique species+zone pairs
-        pairs_to_recalc = set()
+        # Drain activity logged since the last run
+        while True:
+            try:
+                species, zone, logged_at = INVALIDATION_Q.get_nowait()
+            except queue.Empty:
+                break
+            _recent_pairs[(species, zone)] = logged_at
 
-        # Add from catches
-        for species, zone in recent_catches:
-            pairs_to_recalc.add((species, zone))
+        # Drop pairs whose activity has aged out
+        for pair, last_seen in list(_recent_pairs.items()):
+            if last_seen < cutoff:
+                del _recent_pairs[pair]
 
-        # Add predator-affected zones (prey species)
-        prey_species = ['speckled_trout', 'white_trout', 'menhaden', 'mullet']
-        for (zone,) in recent_predators:
-            for prey in prey_species:
-                pairs_to_recalc.add((prey, zone))
+        pairs_to_recalc = set(_recent_pairs)
 
         # If no recent activity, still recalculate all Tier 1 species periodically
         # to reflect environmental changes
         if not pairs_to_recalc:
-            zones = ['Zone 1', 'Zone 2', 'Zone 3', 'Zone 4', 'Zone 5']
-            for species in TIER_1_SPECIES:
-                for zone in zones:
-                    pairs_to_recalc.add((species, zone))
-
-        # Recalculate scores
-        count = 0
-        for species, zone in pairs_to_recalc:
-            try:
-                recalculate_bite_score(db, species, zone)
-                update_species_zone_tip(db, species, zone)
-                count += 1
-            except Exception as e:
-                logger.error(f"Error recalculating {species} {zone}: {e}")
+            pairs_to_recalc = set(_FALLBACK_PAIRS)
+
+        with scheduler_session() as db:
+            conditions = load_conditions(db)
+
+        # Scoring is CPU bound, so run it in the worker process
+        count = _run_score_job(sorted(pairs_to_recalc), run_ts, conditions)
+
+        # Remember when this run happened so a restart resumes the cadence
+        with scheduler_session() as db:
+            db.merge(SchedulerState(key='last_recalc_at', value=run_ts))
 
         logger.info(f"Periodic recalculation complete: {count} species+zone pairs updated")
 
     except Exception as e:
         logger.error(f"Error in periodic score recalculation: {e}")
-    finally:
-        db.close()
 
 
-def fetch_all_data():
-    """Fetch all external data and compute forecasts."""
-    logger.info("Starting scheduled data fetch...")
-    db = SessionLocal()
+def _get_last_recalc_at() -> Optional[datetime]:
+    """Get when periodic score recalculation last ran (UTC), if ever."""
     try:
-        # Fetch tide data
-        logger.info("Fetching tide data...")
-        tide_success = fetch_tide_data(db, hours_ahead=48)
+        with scheduler_session() as db:
+            state = db.get(SchedulerState, 'last_recalc_at')
+            return state.value if state else None
+    except Exception as e:
+        logger.warning(f"Could not read last recalculation time: {e}")
+        return None
 
-        # Fetch weather data
-        logger.info("Fetching weather data...")
-        weather_success = fetch_weather_data(db)
 
-        # Fetch astronomical data
-        logger.info("Fetching astronomical data...")
-        astro_success = fetch_astronomical_data(db, days_ahead=7)
+def _run_db_fetch(fetch, **kwargs) -> Tuple[bool, bool]:
+    """Run a fetch function with its own database session (one per thread)."""
+    with scheduler_session() as db:
+        return fetch(db, **kwargs)
 
-        # Fetch water temperature (updates cache for forecast computation)
-        fetch_water_temperature()
 
-        # Fetch weather observations (air temp, wind, pressure)
-        fetch_weather_observations()
+def fetch_all_data():
+    """
+    Fetch all external data and compute forecasts.
 
-        # Compute forecasts
-        logger.info("Computing forecasts...")
-        forecast_success = compute_forecasts(db, hours_ahead=24)
+    Forecasts are only recomputed when a forecast input changed or the hourly
+    window grid has moved on since the last computation.
+    """
+    global _last_forecast_hour
 
-        if all([tide_success, weather_success, astro_success, forecast_success]):
-            logger.info("Data fetch and forecast computation completed successfully")
-        else:
-            logger.warning(
-                f"Data fetch completed with issues: "
-                f"tide={tide_success}, weather={weather_success}, "
-                f"astro={astro_success}, forecast={forecast_success}"
-            )
+    logger.info("Starting scheduled data fetch...")
+    try:
+        with scheduler_session() as db:
+            # The fetches are independent and I/O bound, so run them concurrently.
+            # Each DB-backed fetch gets its own session; sessions aren't thread-safe.
+            logger.info("Fetching tide, weather, astronomical and NOAA observation data...")
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                futures = {
+                    executor.submit(_run_db_fetch, fetch_tide_data, hours_ahead=48): 'tide',
+                    executor.submit(_run_db_fetch, fetch_weather_data): 'weather',
+                    executor.submit(_run_db_fetch, fetch_astronomical_data, days_ahead=7): 'astro',
+                    # Water temperature and observations update caches used by forecasts
+                    executor.submit(fetch_water_temperature): 'water_temp',
+                    executor.submit(fetch_weather_observations): 'observations',
+                }
+                # A failing source is logged and marked unsuccessful without
+                # stopping the other fetches or the forecast computation
+                results = {}
+                for future in as_completed(futures):
+                    source = futures[future]
+                    error = future.exception()
+                    if error is not None:
+                        logger.error(f"Error fetching {source} data: {error}")
+                        results[source] = (False, False)
+                    else:
+                        results[source] = future.result()
+
+            tide_success, tide_changed = results['tide']
+            weather_success, weather_changed = results['weather']
+            astro_success, astro_changed = results['astro']
+
+            water_temp_changed = results['water_temp'][1]
+
+            # Observations aren't a forecast input, so they don't count here
+            inputs_changed = any([tide_changed, weather_changed, astro_changed, water_temp_changed])
+
+            # Forecast windows start on the hour
+            forecast_hour = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+
+            # Compute forecasts (needs all fetched data)
+            if inputs_changed or forecast_hour != _last_forecast_hour:
+                logger.info("Computing forecasts...")
+                try:
+                    forecast_success = compute_forecasts(db, hours_ahead=24)
+                except Exception as e:
+                    logger.error(f"Error computing forecasts: {e}")
+                    db.rollback()
+                    forecast_success = False
+                _last_forecast_hour = forecast_hour if forecast_success else None
+            else:
+                logger.info("No upstream changes; skipping forecast recompute")
+                forecast_success = True
+
+            if all([tide_success, weather_success, astro_success, forecast_success]):
+                logger.info("Data fetch and forecast computation completed successfully")
+            else:
+                logger.warning(
+                    f"Data fetch completed with issues: "
+                    f"tide={tide_success}, weather={weather_success}, "
+                    f"astro={astro_success}, forecast={forecast_success}"
+                )
 
     except Exception as e:
         logger.error(f"Error in scheduled data fetch: {e}")
-    finally:
-        db.close()
 
 
 def start_scheduler():
     """Start the background scheduler."""
-    # Add job to fetch data periodically
+    # Jobs coalesce missed runs into one and never overlap (job_defaults), so a
+    # slow run (e.g. NOAA timing out) can't queue up a burst of catch-up runs.
+    # Misfires are dropped once they are more than half an interval late.
+    # next_run_time (scheduler-local time) makes a job also fire on startup.
+    now = datetime.now()
+
+    # Add job to fetch data periodically, starting immediately
     scheduler.add_job(
         fetch_all_data,
         trigger=IntervalTrigger(minutes=config.fetch_interval_minutes),
         id='fetch_data',
         name='Fetch tide, weather, and compute forecasts',
-        replace_existing=True
+        replace_existing=True,
+        misfire_grace_time=config.fetch_interval_minutes * 60 // 2,
+        next_run_time=now
     )
 
-    # Add job to capture environment snapshots every 10 minutes (NEW HYPERLOCAL SPEC)
+    # Add job to capture environment snapshots every 10 minutes, starting
+    # immediately (NEW HYPERLOCAL SPEC)
     scheduler.add_job(
         capture_environment,
         trigger=IntervalTrigger(minutes=10),
         id='capture_environment',
         name='Capture environment snapshot',
-        replace_existing=True
+        replace_existing=True,
+        misfire_grace_time=5 * 60,
+        next_run_time=now
     )
 
-    # Add job to recalculate scores periodically (decay & condition changes)
+    # Add job to recalculate scores periodically (decay & condition changes).
+    # After a restart, pick up the cadence from the last run instead of
+    # starting a fresh interval; with no previous run (or an overdue one),
+    # warm the bite score cache once the startup fetch and snapshot have had
+    # a head start
+    recalc_interval = timedelta(minutes=RECALC_INTERVAL_MINUTES)
+    last_recalc_at = _get_last_recalc_at()
+    if last_recalc_at:
+        recalc_delay = max(RECALC_WARMUP_DELAY, last_recalc_at + recalc_interval - datetime.utcnow())
+    else:
+        recalc_delay = RECALC_WARMUP_DELAY
     scheduler.add_job(
         periodic_score_recalculation,
-        trigger=IntervalTrigger(minutes=30),
+        trigger=IntervalTrigger(minutes=RECALC_INTERVAL_MINUTES),
         id='periodic_score_recalc',
         name='Periodic score recalculation for decay',
-        replace_existing=True
-    )
-
-    # Run immediately on startup
-    scheduler.add_job(
-        fetch_all_data,
-        id='fetch_data_startup',
-        name='Initial data fetch on startup',
-        replace_existing=True
-    )
-
-    # Capture environment snapshot immediately on startup
-    scheduler.add_job(
-        capture_environment,
-        id='capture_environment_startup',
-        name='Initial environment snapshot on startup',
-        replace_existing=True
+        replace_existing=True,
+        misfire_grace_time=RECALC_INTERVAL_MINUTES * 60 // 2,
+        next_run_time=now + recalc_delay
     )
 
     scheduler.start()
     logger.info(f"Scheduler started. Data will be fetched every {config.fetch_interval_minutes} minutes.")
     logger.info("Environment snapshots will be captured every 10 minutes.")
-    logger.info("Score recalculation will run every 30 minutes for decay and condition changes.")
+    logger.info(f"Score recalculation will run every {RECALC_INTERVAL_MINUTES} minutes for decay and condition changes.")
 
 
 def stop_scheduler():
     """Stop the background scheduler."""
     scheduler.shutdown()
+    _score_executor.shutdown()
     logger.info("Scheduler stopped.")
@@ -9,63 +9,383 @@ This module provides:
 - Species behavior cheat sheets
 """
 
-from datetime import datetime
-from typing import Dict, List, Tuple, Optional
-import random
-from app.rules.behavior import DOCK_DEPTH_BEHAVIOR, format_depth_range
+import heapq
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, NamedTuple, Tuple, Optional, Sequence, Union
+from app.rules.cold_north_wind import has_strong_north_wind_penalty
 
 
 # Zone mapping - CANONICAL GEOMETRY (Final Spec)
 # Walkway runs EAST-WEST dividing north/south
 # Zones 1,3 = NORTH of walkway | Zones 2,4 = SOUTH of walkway | Zone 5 = EAST spanning full width
-DOCK_ZONES = {
-    1: {
+# Read-only: shared with hyperlocal_scoring
+DOCK_ZONES = MappingProxyType({
+    1: MappingProxyType({
         "name": "Zone 1",
         "description": "Northwest quadrant - above walkway",
         "depth_range": (2, 4),
         "position": "north",
         "structure": "old_pilings_north_edge",  # East-west piling line on north border
-        "features": ["concrete_rubble"],  # Small rubble piles inside zone
+        "features": ("concrete_rubble",),  # Small rubble piles inside zone
         "lights": False
-    },
-    2: {
+    }),
+    2: MappingProxyType({
         "name": "Zone 2",
         "description": "Southwest quadrant - below walkway",
         "depth_range": (2, 4),
         "position": "south",
         "structure": "none",  # NO pilings
-        "features": [],
+        "features": (),
         "lights": False
-    },
-    3: {
+    }),
+    3: MappingProxyType({
         "name": "Zone 3",
         "description": "Northeast quadrant - above walkway",
         "depth_range": (3, 6),
         "position": "north",
         "structure": "old_pilings_north_edge",  # East-west piling line on north border
-        "features": [],
+        "features": (),
         "lights": False
-    },
-    4: {
+    }),
+    4: MappingProxyType({
         "name": "Zone 4",
         "description": "Southeast quadrant - below walkway",
         "depth_range": (3, 6),
         "position": "south",
         "structure": "green_light_only",  # Single underwater green light at SE dock edge
-        "features": ["green_underwater_light"],
+        "features": ("green_underwater_light",),
         "lights": True
-    },
-    5: {
+    }),
+    5: MappingProxyType({
         "name": "Zone 5",
         "description": "Eastern zone - full width beyond zones 3&4",
         "depth_range": (5, 7),
         "position": "east",
         "structure": "dual_pilings",  # North edge piling line + center piling line (strongest structure)
-        "features": ["north_piling_line", "center_piling_line"],
+        "features": ("north_piling_line", "center_piling_line"),
         "lights": False
-    },
+    }),
+})
+
+# Struct-of-arrays view of DOCK_ZONES for scoring code, indexed by zone number - 1
+ZONE_DEPTH_MIN = tuple(zone["depth_range"][0] for zone in DOCK_ZONES.values())
+ZONE_DEPTH_MAX = tuple(zone["depth_range"][1] for zone in DOCK_ZONES.values())
+ZONE_STRUCTURE = tuple(zone["structure"] for zone in DOCK_ZONES.values())
+ZONE_HAS_PILINGS = tuple("pilings" in structure for structure in ZONE_STRUCTURE)
+ZONE_HAS_LIGHTS = tuple(zone["lights"] for zone in DOCK_ZONES.values())
+
+# Category labels returned by this module, interned so equality checks and
+# dict lookups on them hit the identity fast path
+HOT, DECENT, SLOW, UNLIKELY = map(sys.intern, ("HOT", "DECENT", "SLOW", "UNLIKELY"))
+CLEAR, LIGHTLY_STAINED, MUDDY = map(sys.intern, ("Clear", "Lightly Stained", "Muddy"))
+HIGH, MEDIUM, LOW = map(sys.intern, ("HIGH", "MEDIUM", "LOW"))
+WEAK, MODERATE, STRONG = map(sys.intern, ("Weak", "Moderate", "Strong"))
+
+
+class SpeciesEntry(NamedTuple):
+    """A ranked species passed to get_best_zones_now."""
+    key: str
+    tier: str
+    bite_score: float = 0.0
+
+
+# Per-species zone score deltas (per unit of tier weight), zones 1-5 in order
+SPECIES_ZONE_WEIGHTS = {
+    # Structure-dependent species: Zones 1, 3, 5 (all have pilings);
+    # Zone 5 dual pilings are the strongest structure
+    "sheepshead": (2, 0, 3, 0, 4),
+    "tripletail": (2, 0, 3, 0, 4),
+    # Bottom feeders: Prefer rubble (Zone 1) or deeper zones
+    "flounder": (3, 0, 0, 2, 2),
+    "black_drum": (3, 0, 0, 2, 2),
+    # Edges and light structure: Zones 2, 3, 4
+    "speckled_trout": (0, 1, 3, 2, 0),
+    # Shallow structure and shoreline: Zones 1, 2, 3
+    "redfish": (3, 2, 2, 0, 0),
+    # Deeper water species: Zones 4, 5
+    "white_trout": (0, 0, 0, 2, 3),
+    "croaker": (0, 0, 0, 2, 3),
+    "jack_crevalle": (0, 0, 0, 2, 3),
+    "mackerel": (0, 0, 0, 2, 3),
+    "shark": (0, 0, 0, 2, 3),
+    # Shallow open water: Zones 1, 2
+    "mullet": (2, 3, 0, 0, 0),
+    # Structure and pilings: Zones 1, 3, 5
+    "blue_crab": (2, 0, 3, 0, 2),
 }
 
+# Default for other species: mid-depth zones
+DEFAULT_SPECIES_WEIGHTS = (0, 0, 2, 2, 0)
+
+# Tide direction codes (slack covers any state that is neither rising nor falling)
+_TIDE_SLACK, _TIDE_RISING, _TIDE_FALLING = 0, 1, 2
+
+# Clarity codes for zone scoring (other clarities add nothing)
+_CLARITY_OTHER, _CLARITY_CLEAR, _CLARITY_MUDDY = 0, 1, 2
+_CLARITY_CODES = {CLEAR: _CLARITY_CLEAR, MUDDY: _CLARITY_MUDDY}
+
+# Times of day when the Zone 4 green light draws bait
+_GREEN_LIGHT_TIMES = frozenset(("evening", "night"))
+
+# Zone score adjustments (zones 1-5 in order), looked up by condition code
+# Base confidence: Zones 3 & 4 are most fished (higher baseline)
+_BASE_ZONE_SCORES = (0, 0, 2, 2, 0)
+
+# Species weight by bite tier (anything below DECENT counts once)
+_TIER_WEIGHTS = {HOT: 3, DECENT: 2}
+
+# Tide: incoming pushes fish shallow, falling moves them deeper
+_TIDE_ZONE_DELTAS = (
+    (0, 0, 0, 0, 0),    # slack
+    (3, 3, 1, 0, 0),    # rising: shallow north and south
+    (0, 0, 0, 2, 2),    # falling
+)
+
+# Clarity: clear water = deeper/more cautious, muddy = shallow structure
+_CLARITY_ZONE_DELTAS = (
+    (0, 0, 0, 0, 0),    # other
+    (0, 0, 0, 1, 2),    # Clear: deep water advantage
+    (1, 0, 1, 0, 0),    # Muddy: structure advantage
+)
+
+# Nighttime bonus for Zone 4: the green light attracts bait and fish
+_GREEN_LIGHT_ZONE_DELTAS = ((0, 0, 0, 0, 0), (0, 0, 0, 4, 0))
+
+# Cold north wind: fish avoid the skinniest water (zones 1 & 2) and move to
+# deeper zones and edges (4 & 5); Zone 3 stays neutral
+_COLD_NORTH_ZONE_DELTAS = ((0, 0, 0, 0, 0), (-3, -4, 0, 2, 3))
+
+# Sort key for (zone, score) pairs
+_ZONE_SCORE = itemgetter(1)
+
+
+@lru_cache(maxsize=64)
+def _tide_code(tide_state: str) -> int:
+    """Classify a tide state (e.g. 'rising', 'Falling fast') by direction."""
+    tide_lower = tide_state.lower()
+    if "rising" in tide_lower:
+        return _TIDE_RISING
+    elif "falling" in tide_lower:
+        return _TIDE_FALLING
+    return _TIDE_SLACK
+
+
+# Labels indexed by the number of thresholds a value meets
+_BITE_TIERS = (UNLIKELY, SLOW, DECENT, HOT)
+_CONFIDENCE_LEVELS = (LOW, MEDIUM, HIGH)
+
+# Current strength by absolute tide rate (ft/hr): < 0.5 weak, < 1.2 moderate
+_CURRENT_STRENGTH_BREAKS = (0.5, 1.2)
+_CURRENT_STRENGTHS = (WEAK, MODERATE, STRONG)
+
+# Clarity penalties by band; the bounds are strict (> 5 mph, > 0.8 ft/hr),
+# so bands are found with bisect_left
+_CLARITY_WIND_BREAKS = (5, 10, 15)
+_CLARITY_WIND_PENALTIES = (0, 1, 2, 4)
+_CLARITY_TIDE_BREAKS = (0.8, 1.5)
+_CLARITY_TIDE_PENALTIES = (0, 1, 3)
+
+# Water clarity category per clarity score (0-10, higher = clearer)
+_CLARITY_BY_SCORE = (MUDDY,) * 4 + (LIGHTLY_STAINED,) * 3 + (CLEAR,) * 4
+
+# Actionable tips per water clarity (see get_clarity_tip)
+_CLARITY_TIPS = MappingProxyType({
+    CLEAR: "Downsize leader and lures.",
+    LIGHTLY_STAINED: "Balanced visibility - natural colors work well.",
+    MUDDY: "Use scent or noise-based baits."
+})
+
+# Species-specific base rigs
+_SPECIES_RIGS = MappingProxyType({
+    "speckled_trout": {
+        "shallow": "popping cork at 18-24 inches with live shrimp",
+        "mid": "slow-sink plastic on 1/8oz jighead",
+        "deep": "Carolina rig with live bait"
+    },
+    "redfish": {
+        "shallow": "weedless gold spoon or soft plastic",
+        "mid": "1/4oz jig with paddle tail",
+        "deep": "cut bait on slip sinker rig"
+    },
+    "flounder": {
+        "shallow": "slow drag with live finger mullet",
+        "mid": "Carolina rig with mud minnow",
+        "deep": "knocker rig with live shrimp"
+    },
+    "sheepshead": {
+        "shallow": "sliding sinker rig with fiddler crab",
+        "mid": "drop shot with shrimp near pilings",
+        "deep": "tight-line rig at structure"
+    },
+    "black_drum": {
+        "shallow": "slip float with blue crab",
+        "mid": "bottom rig with peeled shrimp",
+        "deep": "fishfinder rig with cut bait"
+    }
+})
+
+# Fallback rig for species without their own entries
+_DEFAULT_RIG = "1/4oz jig with soft plastic"
+
+# Depth categories by how many shallow/mid bounds the depth meets
+_RIG_DEPTHS = ("deep", "mid", "shallow")
+
+# Clarities that change the rig recommendation
+_RIG_CLARITIES = (MUDDY, CLEAR)
+
+# Pro tip decision table (see get_pro_tip)
+# HOT bite: indexed by whether the tide is moving
+_HOT_TIPS = (
+    "Even in slack, active fish will hit. Focus on structure.",
+    "Fish are aggressive - cover water fast and target edges.",
+)
+
+# DECENT bite: keyed by water clarity
+_DECENT_TIPS = MappingProxyType({
+    CLEAR: "Fish can see well - use natural colors and light leaders.",
+    MUDDY: "Compensate for low visibility with vibration and scent.",
+})
+
+# Slower bites: indexed by wind band (calm < 4 mph, moderate, windy > 10 mph);
+# moderate wind falls through to the time-of-day tips
+_SLOW_WIND_TIPS = (
+    "Stealth is key - long casts and quiet presentations.",
+    None,
+    "Choppy water can trigger bites - be patient and vary retrieve.",
+)
+_TIME_OF_DAY_TIPS = MappingProxyType({
+    "morning": "First light often brings a feeding window - be ready early.",
+    "evening": "Last light can turn on the bite - stay through dusk.",
+})
+
+_DEFAULT_PRO_TIP = "Stay persistent and adjust based on what you're seeing."
+
+# Species-specific behavior data
+_SPECIES_BEHAVIORS = MappingProxyType({
+    "speckled_trout": {
+        "best_baits": ["Live shrimp", "Soft plastics (paddle tail)", "Popping cork w/ shrimp", "Small topwater plugs"],
+        "best_tide": "Moving tide (rising or falling), especially first 2 hours",
+        "best_zones": [2, 3, 4],
+        "behavior_summary": "Speckled trout are aggressive feeders during moving tides. Target shallow edges during good bites, deeper structure when slow. Use natural presentations in clear water."
+    },
+    "redfish": {
+        "best_baits": ["Live shrimp", "Cut mullet", "Gold spoons", "Paddle tail jigs"],
+        "best_tide": "Rising tide pushing into shallows, or high slack",
+        "best_zones": [1, 2, 3],
+        "behavior_summary": "Redfish prefer shallow water and structure. They're less tide-dependent than trout. Target shorelines, rocks, and flooded grass. Aggressive hitters in stained water."
+    },
+    "flounder": {
+        "best_baits": ["Live finger mullet", "Mud minnows", "Gulp shrimp", "Slow jigs"],
+        "best_tide": "Falling tide or low slack, ambush points",
+        "best_zones": [3, 4, 5],
+        "behavior_summary": "Flounder are ambush predators that lay on the bottom. Slow presentations work best. Target edges, drop-offs, and dock shadows. Most active when tide is falling."
+    },
+    "sheepshead": {
+        "best_baits": ["Fiddler crabs", "Live shrimp", "Barnacles", "Sand fleas"],
+        "best_tide": "Any tide - less tide-dependent, structure-focused",
+        "best_zones": [3],
+        "behavior_summary": "Sheepshead stay tight to structure (pilings, rocks). They pick at baits delicately - use light line and small hooks. Active year-round but peak in winter."
+    },
+    "black_drum": {
+        "best_baits": ["Blue crab (peeled)", "Cut shrimp", "Clams", "Heavy bottom rigs"],
+        "best_tide": "Slack tide, either high or low",
+        "best_zones": [4, 5],
+        "behavior_summary": "Black drum are bottom feeders that cruise slowly. Less affected by tides and conditions. Target deeper soft bottoms. Patient fishing pays off."
+    },
+    "white_trout": {
+        "best_baits": ["Small jigs", "Shrimp (live or cut)", "Soft plastics", "Spoons"],
+        "best_tide": "Moving tide, especially outgoing",
+        "best_zones": [4, 5],
+        "behavior_summary": "White trout school in deeper water off the dock. Fast strikers - work lures quickly. Most active during strong tidal movement and low light."
+    },
+    "croaker": {
+        "best_baits": ["Shrimp (fresh or frozen)", "Bloodworms", "Small cut bait", "Bottom rigs"],
+        "best_tide": "Any tide - steady feeders",
+        "best_zones": [3, 4, 5],
+        "behavior_summary": "Croaker are reliable bottom feeders. They're less sensitive to conditions. Target sandy/muddy bottoms. Great for beginners - easy to catch."
+    },
+    "tripletail": {
+        "best_baits": ["Live shrimp", "Jigs", "Slow-sinking lures", "Crabs"],
+        "best_tide": "Less tide-dependent - focus on structure",
+        "best_zones": [3, 4],
+        "behavior_summary": "Tripletail suspend near floating debris and structure. Look for them near the surface around pilings. Sight fishing works well. Peak in summer."
+    },
+    "blue_crab": {
+        "best_baits": ["Chicken necks", "Fish heads", "Cast net", "Crab traps"],
+        "best_tide": "Rising tide - crabs become more active",
+        "best_zones": [2, 3, 4],
+        "behavior_summary": "Blue crabs are most active during incoming tides. Use traps or hand lines with bait. Check regulations for size and egg-bearing females."
+    },
+    "mullet": {
+        "best_baits": ["Cast net (no bait needed)", "Small bread balls", "Dough balls"],
+        "best_tide": "Any tide - schools move with bait",
+        "best_zones": [1, 2],
+        "behavior_summary": "Mullet school in shallow water. They're filter feeders, not predators. Cast net is the primary method. Great for bait. Watch for visual schools."
+    },
+    "jack_crevalle": {
+        "best_baits": ["Live bait fish", "Fast-moving lures", "Spoons", "Topwater plugs"],
+        "best_tide": "Moving tide with baitfish activity",
+        "best_zones": [3, 4, 5],
+        "behavior_summary": "Jacks are aggressive predators that chase bait. They appear when baitfish stack up. Fast, powerful fighters. Work lures quickly across the water column."
+    },
+    "mackerel": {
+        "best_baits": ["Small spoons", "Gotcha plugs", "Live bait", "Fast retrieves"],
+        "best_tide": "Moving tide with clear water",
+        "best_zones": [4, 5],
+        "behavior_summary": "Mackerel are fast surface feeders. They run in schools and hit aggressively. Look for diving birds. Fast retrieves and shiny lures work best."
+    },
+    "shark": {
+        "best_baits": ["Large cut bait", "Live fish", "Heavy tackle", "Wire leaders"],
+        "best_tide": "Outgoing tide or dusk/night",
+        "best_zones": [4, 5],
+        "behavior_summary": "Sharks follow bait and scent trails. Use heavy gear and wire leaders. Most active at night or dusk. Know species regulations - many are protected."
+    },
+    "stingray": {
+        "best_baits": ["Cut bait", "Shrimp", "Bottom rigs", "Heavy tackle"],
+        "best_tide": "Any tide - consistent bottom dwellers",
+        "best_zones": [4, 5],
+        "behavior_summary": "Stingrays are bottom feeders that glide over mud/sand. Often bycatch. Strong fighters. Handle carefully - venomous barb in tail. Check regulations."
+    }
+})
+
+
+def _build_depth_info(species_key: str) -> Dict:
+    """Depth info per behavior tier for a species, from DOCK_DEPTH_BEHAVIOR."""
+    # Only needed while _CHEATSHEETS is built, so not bound at module level
+    from app.rules.behavior import DOCK_DEPTH_BEHAVIOR, format_depth_range
+
+    depth_info = {}
+    if species_key in DOCK_DEPTH_BEHAVIOR:
+        for tier in ["good", "moderate", "slow"]:
+            depth_data = DOCK_DEPTH_BEHAVIOR[species_key].get(tier)
+            if depth_data:
+                depth_info[tier] = {
+                    "depth": depth_data["depth"],
+                    "range": format_depth_range(depth_data["range_ft"]),
+                    "note": depth_data["note"]
+                }
+    return depth_info
+
+
+# Complete cheat sheets (behavior data plus depth info), assembled once
+_CHEATSHEETS = MappingProxyType({
+    species_key: MappingProxyType({**behavior, "best_depth": _build_depth_info(species_key)})
+    for species_key, behavior in _SPECIES_BEHAVIORS.items()
+})
+
+# Cheat sheet for species without behavior data
+_DEFAULT_CHEATSHEET = MappingProxyType({
+    "best_baits": ["Live shrimp", "Cut bait", "Artificial lures"],
+    "best_tide": "Moving tide",
+    "best_zones": [3, 4],
+    "behavior_summary": "General behavior data not available for this species.",
+    "best_depth": {}
+})
+
 
 def get_bite_tier_from_score(bite_score: float) -> str:
     """
@@ -82,14 +402,8 @@ def get_bite_tier_from_score(bite_score: float) -> str:
     Returns:
         Tier string: "HOT", "DECENT", "SLOW", or "UNLIKELY"
     """
-    if bite_score >= 80:
-        return "HOT"
-    elif bite_score >= 50:
-        return "DECENT"
-    elif bite_score >= 20:
-        return "SLOW"
-    else:
-        return "UNLIKELY"
+    # Each threshold met moves one tier up
+    return _BITE_TIERS[(bite_score >= 20) + (bite_score >= 50) + (bite_score >= 80)]
 
 
 def get_behavior_tier_from_bite_tier(bite_tier: str) -> str:
@@ -104,9 +418,9 @@ def get_behavior_tier_from_bite_tier(bite_tier: str) -> str:
     Returns:
         Behavior tier: "good", "moderate", or "slow"
     """
-    if bite_tier == "HOT":
+    if bite_tier == HOT:
         return "good"
-    elif bite_tier == "DECENT":
+    elif bite_tier == DECENT:
         return "moderate"
     else:  # SLOW or UNLIKELY
         return "slow"
@@ -124,44 +438,31 @@ def predict_water_clarity(wind_speed_mph: float, tide_rate: float, recent_rain:
     Returns:
         "Clear", "Lightly Stained", or "Muddy"
     """
+    return _clarity_for_rate(wind_speed_mph, abs(tide_rate), recent_rain)
+
+
+def _clarity_for_rate(wind_speed_mph: float, abs_rate: float, recent_rain: bool) -> str:
+    """Water clarity for an absolute tide rate (see predict_water_clarity)."""
     # Start with base clarity
     clarity_score = 10  # 0-10 scale, higher = clearer
 
     # Wind degrades clarity
-    if wind_speed_mph > 15:
-        clarity_score -= 4
-    elif wind_speed_mph > 10:
-        clarity_score -= 2
-    elif wind_speed_mph > 5:
-        clarity_score -= 1
+    clarity_score -= _CLARITY_WIND_PENALTIES[bisect_left(_CLARITY_WIND_BREAKS, wind_speed_mph)]
 
     # Strong tidal movement stirs up bottom
-    if abs(tide_rate) > 1.5:
-        clarity_score -= 3
-    elif abs(tide_rate) > 0.8:
-        clarity_score -= 1
+    clarity_score -= _CLARITY_TIDE_PENALTIES[bisect_left(_CLARITY_TIDE_BREAKS, abs_rate)]
 
     # Recent rain adds runoff
     if recent_rain:
         clarity_score -= 3
 
     # Convert score to category
-    if clarity_score >= 7:
-        return "Clear"
-    elif clarity_score >= 4:
-        return "Lightly Stained"
-    else:
-        return "Muddy"
+    return _CLARITY_BY_SCORE[clarity_score]
 
 
 def get_clarity_tip(clarity: str) -> str:
     """Get actionable tip based on water clarity."""
-    tips = {
-        "Clear": "Downsize leader and lures.",
-        "Lightly Stained": "Balanced visibility - natural colors work well.",
-        "Muddy": "Use scent or noise-based baits."
-    }
-    return tips.get(clarity, "Normal conditions.")
+    return _CLARITY_TIPS.get(clarity, "Normal conditions.")
 
 
 def calculate_confidence_score(
@@ -182,12 +483,7 @@ def calculate_confidence_score(
     """
     avg_stability = (pressure_stability + wind_stability + tide_predictability) / 3
 
-    if avg_stability >= 0.7:
-        return "HIGH"
-    elif avg_stability >= 0.4:
-        return "MEDIUM"
-    else:
-        return "LOW"
+    return _CONFIDENCE_LEVELS[(avg_stability >= 0.4) + (avg_stability >= 0.7)]
 
 
 def get_rig_of_moment(
@@ -212,60 +508,37 @@ def get_rig_of_moment(
     Returns:
         Rig recommendation string
     """
-    # Determine chop level
-    chop = "heavy" if wind_mph > 12 else "moderate" if wind_mph > 6 else "light"
-
     # Determine if tide is moving
-    moving_tide = abs(tide_speed) > 0.5
-
-    # Species-specific base rigs
-    species_rigs = {
-        "speckled_trout": {
-            "shallow": "popping cork at 18-24 inches with live shrimp",
-            "mid": "slow-sink plastic on 1/8oz jighead",
-            "deep": "Carolina rig with live bait"
-        },
-        "redfish": {
-            "shallow": "weedless gold spoon or soft plastic",
-            "mid": "1/4oz jig with paddle tail",
-            "deep": "cut bait on slip sinker rig"
-        },
-        "flounder": {
-            "shallow": "slow drag with live finger mullet",
-            "mid": "Carolina rig with mud minnow",
-            "deep": "knocker rig with live shrimp"
-        },
-        "sheepshead": {
-            "shallow": "sliding sinker rig with fiddler crab",
-            "mid": "drop shot with shrimp near pilings",
-            "deep": "tight-line rig at structure"
-        },
-        "black_drum": {
-            "shallow": "slip float with blue crab",
-            "mid": "bottom rig with peeled shrimp",
-            "deep": "fishfinder rig with cut bait"
-        }
-    }
+    return _rig_for(clarity, abs(tide_speed) > 0.5, top_species, depth_range)
 
-    # Determine depth category
-    avg_depth = sum(depth_range) / 2
-    if avg_depth <= 3:
-        depth_cat = "shallow"
-    elif avg_depth <= 5:
-        depth_cat = "mid"
-    else:
-        depth_cat = "deep"
 
-    # Get base rig
-    if top_species in species_rigs:
-        base_rig = species_rigs[top_species].get(depth_cat, "1/4oz jig with soft plastic")
-    else:
-        base_rig = "1/4oz jig with soft plastic"
+def _rig_for(
+    clarity: str,
+    moving_tide: bool,
+    top_species: str,
+    depth_range: Tuple[int, int]
+) -> str:
+    """Rig recommendation for a known tide movement (see get_rig_of_moment)."""
+    # Determine depth category from the range total (average depth <= 3 ft
+    # is shallow, <= 5 ft is mid), counted from the deep end
+    depth_total = sum(depth_range)
+    depth_cat = _RIG_DEPTHS[(depth_total <= 10) + (depth_total <= 6)]
+
+    # Species and clarities without their own entries share one
+    if top_species not in _SPECIES_RIGS:
+        top_species = None
+    if clarity not in _RIG_CLARITIES:
+        clarity = None
 
+    return _RIG_TABLE[top_species, depth_cat, clarity, moving_tide]
+
+
+def _compose_rig(base_rig: str, clarity: Optional[str], moving_tide: bool) -> str:
+    """Build a rig recommendation string (see get_rig_of_moment)."""
     # Adjust for clarity
-    if clarity == "Muddy" and "shrimp" not in base_rig.lower():
+    if clarity == MUDDY and "shrimp" not in base_rig.lower():
         clarity_mod = " (add scent)"
-    elif clarity == "Clear":
+    elif clarity == CLEAR:
         clarity_mod = " (downsize if needed)"
     else:
         clarity_mod = ""
@@ -279,8 +552,23 @@ def get_rig_of_moment(
     return f"{action} {base_rig}{clarity_mod}."
 
 
+# Every rig recommendation, keyed by (species, depth category, clarity,
+# moving tide); None stands for any other species or clarity
+_RIG_TABLE = {
+    (species, depth_cat, clarity, moving_tide): _compose_rig(
+        _SPECIES_RIGS[species].get(depth_cat, _DEFAULT_RIG) if species else _DEFAULT_RIG,
+        clarity,
+        moving_tide
+    )
+    for species in (*_SPECIES_RIGS, None)
+    for depth_cat in _RIG_DEPTHS
+    for clarity in (*_RIG_CLARITIES, None)
+    for moving_tide in (False, True)
+}
+
+
 def get_best_zones_now(
-    top_species_list: List[Dict],
+    top_species_list: Sequence[Union[SpeciesEntry, Dict]],
     tide_state: str,
     clarity: str,
     time_of_day: str = "midday",
@@ -300,7 +588,8 @@ def get_best_zones_now(
     - Zone 5 (E): Dual pilings (strongest structure), deep, 5-7 ft
 
     Args:
-        top_species_list: List of top species with bite scores/tiers
+        top_species_list: Top species as SpeciesEntry records or dicts with
+            'key' and 'tier', best first
         tide_state: Current tide state
         clarity: Water clarity
         time_of_day: Time of day (for light bonus)
@@ -312,108 +601,64 @@ def get_best_zones_now(
     Returns:
         List of zone numbers (1-5) in priority order
     """
-    from app.rules.cold_north_wind import has_strong_north_wind_penalty
-
-    zone_scores = {1: 0, 2: 0, 3: 0, 4: 0, 5: 0}
-
     # Check for cold north wind penalty
     cold_north_penalty = has_strong_north_wind_penalty(wind_direction, wind_speed, air_temp_f, water_temp_f)
 
-    # Base confidence: Zones 3 & 4 are most fished (higher baseline)
-    zone_scores[3] += 2
-    zone_scores[4] += 2
+    # Wind and temperatures only matter through the penalty flag, and only the
+    # top 3 species count, so repeated conditions hit the cache
+    species_tiers = tuple(
+        (species_data.key, species_data.tier) if isinstance(species_data, SpeciesEntry)
+        else (species_data.get('key', ''), species_data.get('tier', SLOW))
+        for species_data in top_species_list[:3]
+    )
+
+    return list(_best_zones_cached(
+        species_tiers,
+        _tide_code(tide_state),
+        _CLARITY_CODES.get(clarity, _CLARITY_OTHER),
+        time_of_day in _GREEN_LIGHT_TIMES,
+        cold_north_penalty
+    ))
+
+
+@lru_cache(maxsize=1024)
+def _best_zones_cached(
+    species_tiers: Tuple[Tuple[str, str], ...],
+    tide: int,
+    clarity: int,
+    green_light: bool,
+    cold_north_penalty: bool
+) -> Tuple[int, ...]:
+    """Top zones for pre-reduced conditions (see get_best_zones_now)."""
+    # Scores for zones 1-5, indexed 0-4
+    zone_scores = list(_BASE_ZONE_SCORES)
 
     # Score zones based on top species and structure match
-    for species_data in top_species_list[:3]:  # Top 3 species
-        species = species_data.get('key', '')
-        tier = species_data.get('tier', 'SLOW')
-
-        # Weight by tier
-        weight = 3 if tier == "HOT" else 2 if tier == "DECENT" else 1
-
-        # Species zone preferences based on structure needs
-        if species in ['sheepshead', 'tripletail']:
-            # Structure-dependent species: Zones 1, 3, 5 (all have pilings)
-            zone_scores[1] += weight * 2  # Pilings + rubble
-            zone_scores[3] += weight * 3  # Pilings + most fished
-            zone_scores[5] += weight * 4  # Dual pilings (strongest)
-
-        elif species in ['flounder', 'black_drum']:
-            # Bottom feeders: Prefer rubble (Zone 1) or deeper zones
-            zone_scores[1] += weight * 3  # Rubble bonus
-            zone_scores[4] += weight * 2
-            zone_scores[5] += weight * 2
-
-        elif species == 'speckled_trout':
-            # Edges and light structure: Zones 2, 3, 4
-            zone_scores[2] += weight * 1  # Open water
-            zone_scores[3] += weight * 3  # Structure + most fished
-            zone_scores[4] += weight * 2
-
-        elif species == 'redfish':
-            # Shallow structure and shoreline: Zones 1, 2, 3
-            zone_scores[1] += weight * 3  # Shallow + structure + rubble
-            zone_scores[2] += weight * 2  # Shallow
-            zone_scores[3] += weight * 2
-
-        elif species in ['white_trout', 'croaker', 'jack_crevalle', 'mackerel', 'shark']:
-            # Deeper water species: Zones 4, 5
-            zone_scores[4] += weight * 2
-            zone_scores[5] += weight * 3  # Deepest + strongest structure
-
-        elif species == 'mullet':
-            # Shallow open water: Zones 1, 2
-            zone_scores[1] += weight * 2
-            zone_scores[2] += weight * 3  # Open water, no structure
-
-        elif species == 'blue_crab':
-            # Structure and pilings: Zones 1, 3, 5
-            zone_scores[1] += weight * 2
-            zone_scores[3] += weight * 3
-            zone_scores[5] += weight * 2
-
-        else:
-            # Default: mid-depth zones
-            zone_scores[3] += weight * 2
-            zone_scores[4] += weight * 2
-
-    # Adjust for tide - incoming pushes shallow
-    if "rising" in tide_state.lower():
-        zone_scores[1] += 3  # Shallow north
-        zone_scores[2] += 3  # Shallow south
-        zone_scores[3] += 1
-    elif "falling" in tide_state.lower():
-        zone_scores[4] += 2
-        zone_scores[5] += 2  # Fish move deeper
-
-    # Adjust for clarity - clear water = deeper/more cautious
-    if clarity == "Clear":
-        zone_scores[4] += 1
-        zone_scores[5] += 2  # Deep water advantage
-    elif clarity == "Muddy":
-        zone_scores[1] += 1  # Shallow structure
-        zone_scores[3] += 1  # Structure advantage
-
-    # Nighttime bonus for Zone 4 (green light)
-    if time_of_day in ["evening", "night"]:
-        zone_scores[4] += 4  # Light attracts bait and fish
-
-    # Cold north wind penalty: down-rank shallow zones, up-rank deeper zones
-    if cold_north_penalty:
-        # Penalize shallow zones (1 & 2) - fish avoid the skinniest water
-        zone_scores[1] -= 3  # Shallow zone penalty
-        zone_scores[2] -= 4  # Shallowest open water zone penalty
-
-        # Bonus to deeper zones and edges (4 & 5)
-        zone_scores[4] += 2  # Mid-depth with good edges
-        zone_scores[5] += 3  # Deepest zone with strongest structure
-
-        # Zone 3 stays neutral (mid-depth with structure)
-
-    # Sort zones by score
-    sorted_zones = sorted(zone_scores.items(), key=lambda x: x[1], reverse=True)
-
-    return [zone for zone, score in sorted_zones if score > 0][:3]  # Top 3 zones
+    for species, tier in species_tiers:
+        weight = _TIER_WEIGHTS.get(tier, 1)
+        deltas = SPECIES_ZONE_WEIGHTS.get(species, DEFAULT_SPECIES_WEIGHTS)
+        for i, delta in enumerate(deltas):
+            zone_scores[i] += weight * delta
+
+    # Add the tide, clarity, light and cold north wind adjustments
+    zone_scores = [
+        sum(column) for column in zip(
+            zone_scores,
+            _TIDE_ZONE_DELTAS[tide],
+            _CLARITY_ZONE_DELTAS[clarity],
+            _GREEN_LIGHT_ZONE_DELTAS[green_light],
+            _COLD_NORTH_ZONE_DELTAS[cold_north_penalty],
+        )
+    ]
+
+    # Top 3 zones by score (ties keep zone order)
+    top_zones = heapq.nlargest(
+        3,
+        ((zone, score) for zone, score in enumerate(zone_scores, 1) if score > 0),
+        key=_ZONE_SCORE
+    )
+
+    return tuple(zone for zone, score in top_zones)
 
 
 def get_pro_tip(
@@ -436,33 +681,21 @@ def get_pro_tip(
     Returns:
         Pro tip string
     """
-    tips = {
-        "HOT_moving_tide": "Fish are aggressive - cover water fast and target edges.",
-        "HOT_slack": "Even in slack, active fish will hit. Focus on structure.",
-        "DECENT_clear": "Fish can see well - use natural colors and light leaders.",
-        "DECENT_muddy": "Compensate for low visibility with vibration and scent.",
-        "SLOW_wind": "Choppy water can trigger bites - be patient and vary retrieve.",
-        "SLOW_calm": "Stealth is key - long casts and quiet presentations.",
-        "morning": "First light often brings a feeding window - be ready early.",
-        "evening": "Last light can turn on the bite - stay through dusk.",
-    }
+    return _pro_tip_for(bite_tier, clarity, _tide_code(tide_state), wind_mph, time_of_day)
 
-    # Build context key
-    if bite_tier == "HOT":
-        moving = "moving_tide" if "rising" in tide_state or "falling" in tide_state else "slack"
-        key = f"HOT_{moving}"
-    elif bite_tier == "DECENT":
-        key = f"DECENT_{clarity.lower().replace(' ', '_')}"
-    elif wind_mph > 10:
-        key = "SLOW_wind"
-    elif wind_mph < 4:
-        key = "SLOW_calm"
-    elif time_of_day in ["morning", "evening"]:
-        key = time_of_day
-    else:
-        key = None
 
-    return tips.get(key, "Stay persistent and adjust based on what you're seeing.")
+def _pro_tip_for(bite_tier: str, clarity: str, tide: int, wind_mph: float, time_of_day: str) -> str:
+    """Pro tip for a classified tide direction (see get_pro_tip)."""
+    if bite_tier == HOT:
+        return _HOT_TIPS[tide != _TIDE_SLACK]
+    elif bite_tier == DECENT:
+        return _DECENT_TIPS.get(clarity, _DEFAULT_PRO_TIP)
+
+    # Moderate wind (band 1) also covers a NaN reading, as before
+    wind_tip = _SLOW_WIND_TIPS[1 + (wind_mph > 10) - (wind_mph < 4)]
+    if wind_tip:
+        return wind_tip
+    return _TIME_OF_DAY_TIPS.get(time_of_day, _DEFAULT_PRO_TIP)
 
 
 def get_current_strength(tide_rate: float) -> str:
@@ -475,14 +708,13 @@ def get_current_strength(tide_rate: float) -> str:
     Returns:
         "Weak", "Moderate", or "Strong"
     """
-    abs_rate = abs(tide_rate)
+    return _strength_for_rate(abs(tide_rate))
 
-    if abs_rate < 0.5:
-        return "Weak"
-    elif abs_rate < 1.2:
-        return "Moderate"
-    else:
-        return "Strong"
+
+def _strength_for_rate(abs_rate: float) -> str:
+    """Current strength for an absolute tide rate (see get_current_strength)."""
+    # bisect_right puts a NaN rate past every break, so it still reads "Strong"
+    return _CURRENT_STRENGTHS[bisect_right(_CURRENT_STRENGTH_BREAKS, abs_rate)]
 
 
 def get_moon_tide_window(moon_phase: str, tide_state: str, time_of_day: str) -> str:
@@ -520,119 +752,84 @@ def get_species_behavior_cheatsheet(species_key: str) -> Dict:
         - best_baits: List of best baits
         - best_tide: Description of ideal tide conditions
         - behavior_summary: Plain-language summary
-    """
-    # Species-specific behavior data
-    species_behaviors = {
-        "speckled_trout": {
-            "best_baits": ["Live shrimp", "Soft plastics (paddle tail)", "Popping cork w/ shrimp", "Small topwater plugs"],
-            "best_tide": "Moving tide (rising or falling), especially first 2 hours",
-            "best_zones": [2, 3, 4],
-            "behavior_summary": "Speckled trout are aggressive feeders during moving tides. Target shallow edges during good bites, deeper structure when slow. Use natural presentations in clear water."
-        },
-        "redfish": {
-            "best_baits": ["Live shrimp", "Cut mullet", "Gold spoons", "Paddle tail jigs"],
-            "best_tide": "Rising tide pushing into shallows, or high slack",
-            "best_zones": [1, 2, 3],
-            "behavior_summary": "Redfish prefer shallow water and structure. They're less tide-dependent than trout. Target shorelines, rocks, and flooded grass. Aggressive hitters in stained water."
-        },
-        "flounder": {
-            "best_baits": ["Live finger mullet", "Mud minnows", "Gulp shrimp", "Slow jigs"],
-            "best_tide": "Falling tide or low slack, ambush points",
-            "best_zones": [3, 4, 5],
-            "behavior_summary": "Flounder are ambush predators that lay on the bottom. Slow presentations work best. Target edges, drop-offs, and dock shadows. Most active when tide is falling."
-        },
-        "sheepshead": {
-            "best_baits": ["Fiddler crabs", "Live shrimp", "Barnacles", "Sand fleas"],
-            "best_tide": "Any tide - less tide-dependent, structure-focused",
-            "best_zones": [3],
-            "behavior_summary": "Sheepshead stay tight to structure (pilings, rocks). They pick at baits delicately - use light line and small hooks. Active year-round but peak in winter."
-        },
-        "black_drum": {
-            "best_baits": ["Blue crab (peeled)", "Cut shrimp", "Clams", "Heavy bottom rigs"],
-            "best_tide": "Slack tide, either high or low",
-            "best_zones": [4, 5],
-            "behavior_summary": "Black drum are bottom feeders that cruise slowly. Less affected by tides and conditions. Target deeper soft bottoms. Patient fishing pays off."
-        },
-        "white_trout": {
-            "best_baits": ["Small jigs", "Shrimp (live or cut)", "Soft plastics", "Spoons"],
-            "best_tide": "Moving tide, especially outgoing",
-            "best_zones": [4, 5],
-            "behavior_summary": "White trout school in deeper water off the dock. Fast strikers - work lures quickly. Most active during strong tidal movement and low light."
-        },
-        "croaker": {
-            "best_baits": ["Shrimp (fresh or frozen)", "Bloodworms", "Small cut bait", "Bottom rigs"],
-            "best_tide": "Any tide - steady feeders",
-            "best_zones": [3, 4, 5],
-            "behavior_summary": "Croaker are reliable bottom feeders. They're less sensitive to conditions. Target sandy/muddy bottoms. Great for beginners - easy to catch."
-        },
-        "tripletail": {
-            "best_baits": ["Live shrimp", "Jigs", "Slow-sinking lures", "Crabs"],
-            "best_tide": "Less tide-dependent - focus on structure",
-            "best_zones": [3, 4],
-            "behavior_summary": "Tripletail suspend near floating debris and structure. Look for them near the surface around pilings. Sight fishing works well. Peak in summer."
-        },
-        "blue_crab": {
-            "best_baits": ["Chicken necks", "Fish heads", "Cast net", "Crab traps"],
-            "best_tide": "Rising tide - crabs become more active",
-            "best_zones": [2, 3, 4],
-            "behavior_summary": "Blue crabs are most active during incoming tides. Use traps or hand lines with bait. Check regulations for size and egg-bearing females."
-        },
-        "mullet": {
-            "best_baits": ["Cast net (no bait needed)", "Small bread balls", "Dough balls"],
-            "best_tide": "Any tide - schools move with bait",
-            "best_zones": [1, 2],
-            "behavior_summary": "Mullet school in shallow water. They're filter feeders, not predators. Cast net is the primary method. Great for bait. Watch for visual schools."
-        },
-        "jack_crevalle": {
-            "best_baits": ["Live bait fish", "Fast-moving lures", "Spoons", "Topwater plugs"],
-            "best_tide": "Moving tide with baitfish activity",
-            "best_zones": [3, 4, 5],
-            "behavior_summary": "Jacks are aggressive predators that chase bait. They appear when baitfish stack up. Fast, powerful fighters. Work lures quickly across the water column."
-        },
-        "mackerel": {
-            "best_baits": ["Small spoons", "Gotcha plugs", "Live bait", "Fast retrieves"],
-            "best_tide": "Moving tide with clear water",
-            "best_zones": [4, 5],
-            "behavior_summary": "Mackerel are fast surface feeders. They run in schools and hit aggressively. Look for diving birds. Fast retrieves and shiny lures work best."
-        },
-        "shark": {
-            "best_baits": ["Large cut bait", "Live fish", "Heavy tackle", "Wire leaders"],
-            "best_tide": "Outgoing tide or dusk/night",
-            "best_zones": [4, 5],
-            "behavior_summary": "Sharks follow bait and scent trails. Use heavy gear and wire leaders. Most active at night or dusk. Know species regulations - many are protected."
-        },
-        "stingray": {
-            "best_baits": ["Cut bait", "Shrimp", "Bottom rigs", "Heavy tackle"],
-            "best_tide": "Any tide - consistent bottom dwellers",
-            "best_zones": [4, 5],
-            "behavior_summary": "Stingrays are bottom feeders that glide over mud/sand. Often bycatch. Strong fighters. Handle carefully - venomous barb in tail. Check regulations."
-        }
-    }
 
+        The dict is a fresh copy, but its values are shared with the
+        precomputed table and must not be mutated.
+    """
     # Get behavior data or return defaults
-    if species_key not in species_behaviors:
-        return {
-            "best_baits": ["Live shrimp", "Cut bait", "Artificial lures"],
-            "best_tide": "Moving tide",
-            "best_zones": [3, 4],
-            "behavior_summary": "General behavior data not available for this species.",
-            "best_depth": {}
-        }
-
-    behavior_data = species_behaviors[species_key]
-
-    # Add depth information from DOCK_DEPTH_BEHAVIOR
-    depth_info = {}
-    if species_key in DOCK_DEPTH_BEHAVIOR:
-        for tier in ["good", "moderate", "slow"]:
-            depth_data = DOCK_DEPTH_BEHAVIOR[species_key].get(tier)
-            if depth_data:
-                depth_info[tier] = {
-                    "depth": depth_data["depth"],
-                    "range": format_depth_range(depth_data["range_ft"]),
-                    "note": depth_data["note"]
-                }
+    return dict(_CHEATSHEETS.get(species_key, _DEFAULT_CHEATSHEET))
+
+
+def build_forecast_bundle(
+    wind_mph: float,
+    tide_rate: float,
+    tide_state: str,
+    time_of_day: str,
+    moon_phase: str,
+    top_species: str,
+    top_tier: str,
+    depth_range: Tuple[int, int],
+    species_with_tiers: Sequence[Union[SpeciesEntry, Dict]],
+    pressure_stability: float,
+    wind_stability: float,
+    tide_predictability: float,
+    wind_direction: Optional[str] = None,
+    wind_speed: Optional[float] = None,
+    air_temp_f: Optional[float] = None,
+    water_temp_f: Optional[float] = None,
+    recent_rain: bool = False
+) -> Dict:
+    """
+    Build every advanced forecast feature for one window in a single pass.
+
+    Values several features depend on (the absolute tide rate and the tide
+    direction) are derived once and shared, instead of being recomputed by
+    each public helper.
 
-    behavior_data["best_depth"] = depth_info
+    Args:
+        wind_mph: Forecast wind speed in MPH (clarity, rig, pro tip)
+        tide_rate: Tide change rate in ft/hr (can be negative)
+        tide_state: Current tide state
+        time_of_day: Time of day
+        moon_phase: Moon phase description
+        top_species: Most active species slug
+        top_tier: Bite tier of the most active species
+        depth_range: Depth range tuple (min, max) in feet for the top species
+        species_with_tiers: Species entries (or dicts) with key and tier, best first
+        pressure_stability: 0-1, how stable barometric pressure is
+        wind_stability: 0-1, how consistent wind is
+        tide_predictability: 0-1, how normal tidal patterns are
+        wind_direction: Optional wind direction for north wind penalty
+        wind_speed: Optional observed wind speed for north wind penalty
+        air_temp_f: Optional air temperature for cold temp check
+        water_temp_f: Optional water temperature for cold temp check
+        recent_rain: Whether there's been recent rain
 
-    return behavior_data
+    Returns:
+        Dictionary with clarity, clarity_tip, confidence, rig_of_moment,
+        best_zones, pro_tip, current_strength, and moon_tide_window
+    """
+    abs_rate = abs(tide_rate)
+    tide = _tide_code(tide_state)
+
+    clarity = _clarity_for_rate(wind_mph, abs_rate, recent_rain)
+
+    return {
+        'clarity': clarity,
+        'clarity_tip': get_clarity_tip(clarity),
+        'confidence': calculate_confidence_score(pressure_stability, wind_stability, tide_predictability),
+        'rig_of_moment': _rig_for(clarity, abs_rate > 0.5, top_species, depth_range),
+        'best_zones': get_best_zones_now(
+            top_species_list=species_with_tiers,
+            tide_state=tide_state,
+            clarity=clarity,
+            time_of_day=time_of_day,
+            wind_direction=wind_direction,
+            wind_speed=wind_speed,
+            air_temp_f=air_temp_f,
+            water_temp_f=water_temp_f
+        ),
+        'pro_tip': _pro_tip_for(top_tier, clarity, tide, wind_mph, time_of_day),
+        'current_strength': _strength_for_rate(abs_rate),
+        'moon_tide_window': get_moon_tide_window(moon_phase, tide_state, time_of_day),
+    }
@@ -1,16 +1,34 @@
 """Service for astronomical data: sunrise, sunset, moon phase."""
+from bisect import bisect_right
 from datetime import datetime, timedelta, date as dt_date
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
 from sqlalchemy.orm import Session
 from app.config import config
 from app.models.schemas import AstronomicalData
 import logging
 import math
+from math import acos, asin, atan, cos, floor, sin, tan
 
 logger = logging.getLogger(__name__)
 
+# Same factors math.radians/math.degrees multiply by
+_DEG_TO_RAD = math.pi / 180.0
+_RAD_TO_DEG = 180.0 / math.pi
 
-def fetch_astronomical_data(db: Session, days_ahead: int = 7) -> bool:
+# Cosine of the official sunrise/sunset zenith (90.833 degrees)
+_COS_ZENITH = math.cos(math.radians(90.833))
+
+# Moon phase name bands: a phase p is named _MOON_NAMES[i], where i is the
+# number of bounds <= p (so each band includes its lower bound)
+_MOON_BOUNDS = (0.0625, 0.1875, 0.3125, 0.4375, 0.5625, 0.6875, 0.8125, 0.9375)
+_MOON_NAMES = (
+    "New", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full", "Waning Gibbous", "Last Quarter", "Waning Crescent", "New",
+)
+
+
+def fetch_astronomical_data(db: Session, days_ahead: int = 7) -> Tuple[bool, bool]:
     """
     Calculate and store astronomical data (sunrise, sunset, moon phase).
 
@@ -19,26 +37,38 @@ def fetch_astronomical_data(db: Session, days_ahead: int = 7) -> bool:
         days_ahead: Number of days to compute (default 7)
 
     Returns:
-        True if successful, False otherwise
+        (success, changed) tuple; changed is True if a day was added or revised
     """
     try:
         today = datetime.utcnow().date()
+        changed = False
 
-        for i in range(days_ahead):
-            target_date = today + timedelta(days=i)
+        # Calculate sunrise and sunset for the whole run at once
+        dates = [today + timedelta(days=i) for i in range(days_ahead)]
+        sun_times = _calculate_sun_times_for_dates(dates)
 
-            # Calculate sunrise and sunset
-            sunrise, sunset = _calculate_sun_times(target_date)
+        # Load the rows we already have for these dates in one query
+        # (date is unique, so there is at most one row per day)
+        day_starts = [datetime.combine(target_date, datetime.min.time()) for target_date in dates]
+        existing_rows = {
+            row.date: row
+            for row in db.query(AstronomicalData).filter(AstronomicalData.date.in_(day_starts))
+        }
 
+        for target_date, day_start, (sunrise, sunset) in zip(dates, day_starts, sun_times):
             # Calculate moon phase
             moon_phase, moon_phase_name = _calculate_moon_phase(target_date)
 
             # Check if we already have data for this date
-            existing = db.query(AstronomicalData).filter(
-                AstronomicalData.date == datetime.combine(target_date, datetime.min.time())
-            ).first()
+            existing = existing_rows.get(day_start)
 
             if existing:
+                changed = changed or (
+                    existing.sunrise != sunrise or existing.sunset != sunset
+                    or existing.moon_phase != moon_phase
+                    or existing.moon_phase_name != moon_phase_name
+                )
+
                 # Update existing
                 existing.sunrise = sunrise
                 existing.sunset = sunset
@@ -48,7 +78,7 @@ def fetch_astronomical_data(db: Session, days_ahead: int = 7) -> bool:
             else:
                 # Create new
                 astro_entry = AstronomicalData(
-                    date=datetime.combine(target_date, datetime.min.time()),
+                    date=day_start,
                     sunrise=sunrise,
                     sunset=sunset,
                     moon_phase=moon_phase,
@@ -56,123 +86,117 @@ def fetch_astronomical_data(db: Session, days_ahead: int = 7) -> bool:
                     fetched_at=datetime.utcnow()
                 )
                 db.add(astro_entry)
+                changed = True
 
         db.commit()
         logger.info(f"Stored astronomical data for {days_ahead} days")
-        return True
+        return True, changed
 
     except Exception as e:
         logger.error(f"Error fetching astronomical data: {e}")
         db.rollback()
-        return False
+        return False, False
 
 
 def _calculate_sun_times(target_date: dt_date) -> tuple:
+    """Calculate sunrise and sunset times for one date (see _calculate_sun_times_for_dates)."""
+    return _calculate_sun_times_for_dates([target_date])[0]
+
+
+def _calculate_sun_times_for_dates(dates: Sequence[dt_date]) -> List[Tuple[datetime, datetime]]:
     """
-    Calculate sunrise and sunset times using simplified algorithm.
+    Calculate sunrise and sunset times for several dates using simplified algorithm.
+
+    Results are cached per (date, latitude, longitude), since overlapping
+    fetch runs recompute the same days.
 
     This uses a simplified calculation. For production, consider using
     a library like ephem or astral for more accuracy.
     """
     lat = config.latitude
     lon = config.longitude
+    return [_sun_times_cached(target_date.toordinal(), lat, lon) for target_date in dates]
 
-    # Julian day
-    year = target_date.year
-    month = target_date.month
-    day = target_date.day
 
+@lru_cache(maxsize=4096)
+def _sun_times_cached(ordinal: int, lat: float, lon: float) -> Tuple[datetime, datetime]:
+    """Sunrise and sunset for a date given as an ordinal (see _calculate_sun_times_for_dates)."""
     # Simplified sunrise/sunset calculation
     # Using approximate formulas - good enough for fishing app
+    lngHour, sin_lat, cos_lat = _location_terms(lat, lon)
 
     # Day of year
+    target_date = dt_date.fromordinal(ordinal)
     N = target_date.timetuple().tm_yday
 
+    # Rising and setting times
+    UT_rise = _sun_event_utc_hour(N + ((6 - lngHour) / 24), lngHour, sin_lat, cos_lat, rising=True)
+    UT_set = _sun_event_utc_hour(N + ((18 - lngHour) / 24), lngHour, sin_lat, cos_lat, rising=False)
+
+    midnight = datetime.combine(target_date, datetime.min.time())
+    return _at_utc_hour(midnight, UT_rise), _at_utc_hour(midnight, UT_set)
+
+
+@lru_cache(maxsize=8)
+def _location_terms(lat: float, lon: float) -> Tuple[float, float, float]:
+    """Longitude in hours plus sine and cosine of latitude, shared by every day."""
     # Convert longitude to hour value and calculate approximate time
     lngHour = lon / 15.0
+    return lngHour, math.sin(math.radians(lat)), math.cos(math.radians(lat))
 
-    # Rising time
-    t_rise = N + ((6 - lngHour) / 24)
-    t_set = N + ((18 - lngHour) / 24)
 
-    # Sun's mean anomaly
-    M_rise = (0.9856 * t_rise) - 3.289
-    M_set = (0.9856 * t_set) - 3.289
+def _sun_event_utc_hour(t: float, lngHour: float, sin_lat: float, cos_lat: float, rising: bool) -> float:
+    """UTC hour (0-24) of sunrise or sunset for approximate day-of-year time t.
 
-    # Sun's true longitude
-    L_rise = M_rise + (1.916 * math.sin(math.radians(M_rise))) + (0.020 * math.sin(math.radians(2 * M_rise))) + 282.634
-    L_set = M_set + (1.916 * math.sin(math.radians(M_set))) + (0.020 * math.sin(math.radians(2 * M_set))) + 282.634
+    Pure float arithmetic: degree/radian conversions multiply by the same
+    constants math.radians/math.degrees use, and the math functions are bound
+    at module level, so the hot loop makes no attribute lookups.
+    """
+    # Sun's mean anomaly
+    M = (0.9856 * t) - 3.289
 
-    # Normalize to 0-360
-    L_rise = L_rise % 360
-    L_set = L_set % 360
+    # Sun's true longitude, normalized to 0-360
+    L = M + (1.916 * sin(M * _DEG_TO_RAD)) + (0.020 * sin((2 * M) * _DEG_TO_RAD)) + 282.634
+    L = L % 360
+    L_rad = L * _DEG_TO_RAD
 
     # Sun's right ascension
-    RA_rise = math.degrees(math.atan(0.91764 * math.tan(math.radians(L_rise))))
-    RA_rise = RA_rise % 360
-    RA_set = math.degrees(math.atan(0.91764 * math.tan(math.radians(L_set))))
-    RA_set = RA_set % 360
+    RA = atan(0.91764 * tan(L_rad)) * _RAD_TO_DEG
+    RA = RA % 360
 
     # Right ascension value needs to be in same quadrant as L
-    Lquadrant_rise = (math.floor(L_rise / 90)) * 90
-    RAquadrant_rise = (math.floor(RA_rise / 90)) * 90
-    RA_rise = RA_rise + (Lquadrant_rise - RAquadrant_rise)
-
-    Lquadrant_set = (math.floor(L_set / 90)) * 90
-    RAquadrant_set = (math.floor(RA_set / 90)) * 90
-    RA_set = RA_set + (Lquadrant_set - RAquadrant_set)
+    Lquadrant = (floor(L / 90)) * 90
+    RAquadrant = (floor(RA / 90)) * 90
+    RA = RA + (Lquadrant - RAquadrant)
 
     # Right ascension to hours
-    RA_rise = RA_rise / 15
-    RA_set = RA_set / 15
+    RA = RA / 15
 
     # Sun's declination
-    sinDec_rise = 0.39782 * math.sin(math.radians(L_rise))
-    cosDec_rise = math.cos(math.asin(sinDec_rise))
-    sinDec_set = 0.39782 * math.sin(math.radians(L_set))
-    cosDec_set = math.cos(math.asin(sinDec_set))
+    sinDec = 0.39782 * sin(L_rad)
+    cosDec = cos(asin(sinDec))
 
-    # Sun's local hour angle
-    zenith = math.radians(90.833)  # Official zenith
-    cosH_rise = (math.cos(zenith) - (sinDec_rise * math.sin(math.radians(lat)))) / (cosDec_rise * math.cos(math.radians(lat)))
-    cosH_set = (math.cos(zenith) - (sinDec_set * math.sin(math.radians(lat)))) / (cosDec_set * math.cos(math.radians(lat)))
+    # Sun's local hour angle, clamped to valid range
+    cosH = (_COS_ZENITH - (sinDec * sin_lat)) / (cosDec * cos_lat)
+    cosH = max(-1, min(1, cosH))
 
-    # Clamp to valid range
-    cosH_rise = max(-1, min(1, cosH_rise))
-    cosH_set = max(-1, min(1, cosH_set))
-
-    H_rise = 360 - math.degrees(math.acos(cosH_rise))
-    H_set = math.degrees(math.acos(cosH_set))
-
-    H_rise = H_rise / 15
-    H_set = H_set / 15
+    H = acos(cosH) * _RAD_TO_DEG
+    if rising:
+        H = 360 - H
+    H = H / 15
 
     # Local mean time of rising/setting
-    T_rise = H_rise + RA_rise - (0.06571 * t_rise) - 6.622
-    T_set = H_set + RA_set - (0.06571 * t_set) - 6.622
-
-    # Adjust to UTC
-    UT_rise = T_rise - lngHour
-    UT_set = T_set - lngHour
+    T = H + RA - (0.06571 * t) - 6.622
 
-    # Normalize to 0-24
-    UT_rise = UT_rise % 24
-    UT_set = UT_set % 24
+    # Adjust to UTC and normalize to 0-24
+    return (T - lngHour) % 24
 
-    # Convert to datetime
-    sunrise_hour = int(UT_rise)
-    sunrise_minute = int((UT_rise - sunrise_hour) * 60)
-    sunset_hour = int(UT_set)
-    sunset_minute = int((UT_set - sunset_hour) * 60)
 
-    sunrise = datetime.combine(target_date, datetime.min.time()).replace(
-        hour=sunrise_hour, minute=sunrise_minute
-    )
-    sunset = datetime.combine(target_date, datetime.min.time()).replace(
-        hour=sunset_hour, minute=sunset_minute
-    )
-
-    return sunrise, sunset
+def _at_utc_hour(midnight: datetime, ut_hour: float) -> datetime:
+    """Datetime on midnight's date at a fractional hour (truncated to the minute)."""
+    hour = int(ut_hour)
+    minute = int((ut_hour - hour) * 60)
+    return midnight.replace(hour=hour, minute=minute)
 
 
 def _calculate_moon_phase(target_date: dt_date) -> tuple:
@@ -182,11 +206,20 @@ def _calculate_moon_phase(target_date: dt_date) -> tuple:
     Returns:
         (phase_value, phase_name) where phase_value is 0-1
     """
+    return _moon_phase_cached(target_date.toordinal())
+
+
+@lru_cache(maxsize=8192)
+def _moon_phase_cached(ordinal: int) -> Tuple[float, str]:
+    """Moon phase for a date given as an ordinal (see _calculate_moon_phase).
+
+    The phase is location-independent, so the date alone is the cache key.
+    """
     # Known new moon date
     known_new_moon = datetime(2000, 1, 6, 18, 14)
 
     # Calculate days since known new moon
-    date_dt = datetime.combine(target_date, datetime.min.time())
+    date_dt = datetime.combine(dt_date.fromordinal(ordinal), datetime.min.time())
     days_since = (date_dt - known_new_moon).days
 
     # Lunar cycle is approximately 29.53059 days
@@ -196,24 +229,7 @@ def _calculate_moon_phase(target_date: dt_date) -> tuple:
     phase = (days_since % lunar_cycle) / lunar_cycle
 
     # Determine phase name
-    if phase < 0.0625:
-        phase_name = "New"
-    elif phase < 0.1875:
-        phase_name = "Waxing Crescent"
-    elif phase < 0.3125:
-        phase_name = "First Quarter"
-    elif phase < 0.4375:
-        phase_name = "Waxing Gibbous"
-    elif phase < 0.5625:
-        phase_name = "Full"
-    elif phase < 0.6875:
-        phase_name = "Waning Gibbous"
-    elif phase < 0.8125:
-        phase_name = "Last Quarter"
-    elif phase < 0.9375:
-        phase_name = "Waning Crescent"
-    else:
-        phase_name = "New"
+    phase_name = _MOON_NAMES[bisect_right(_MOON_BOUNDS, phase)]
 
     return round(phase, 3), phase_name
 
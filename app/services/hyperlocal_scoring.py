@@ -22,7 +22,7 @@ from app.rules.uglyfishing_calendar import get_seasonal_baseline_score
 from app.rules.species_tiers import should_use_full_scoring, get_species_tier
 from app.rules.species_behavior_profiles import get_species_profile, is_prey_species
 from app.services.confidence_scoring import calculate_species_zone_confidence
-from app.services.advanced_features import DOCK_ZONES
+from app.services.advanced_features import ZONE_HAS_PILINGS
 import logging
 
 logger = logging.getLogger(__name__)
@@ -250,7 +250,6 @@ def calculate_structure_match(species: str, zone_id: str, conditions: Dict[str,
     except:
         zone_num = 3
 
-    zone_info = DOCK_ZONES.get(zone_num, {})
     score = 0.0
     structure_prefs = profile.get('structure', {})
 
@@ -301,7 +300,8 @@ def calculate_structure_match(species: str, zone_id: str, conditions: Dict[str,
     # CURRENT + STRUCTURE BONUS (redfish, sheepshead)
     if 'current_structure_bonus' in profile:
         current_speed = conditions.get('current_speed', 0)
-        if current_speed > 0.3 and zone_num in [1, 3, 5]:  # Structure zones with current
+        # Structure zones (pilings) with current
+        if current_speed > 0.3 and 1 <= zone_num <= len(ZONE_HAS_PILINGS) and ZONE_HAS_PILINGS[zone_num - 1]:
             score += profile['current_structure_bonus']
 
     return score
@@ -10,9 +10,9 @@ This service provides the core recalculateBiteScore() function that:
 All UI/API should read from bite_scores, never compute on the fly.
 """
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func
+from sqlalchemy import and_, func, tuple_
 import logging
 import math
 
@@ -124,6 +124,136 @@ def build_reason_summary(
     return "; ".join(reasons).capitalize()
 
 
+def load_conditions(db: Session) -> Dict[str, Any]:
+    """Load current conditions from the latest environment snapshot.
+
+    Without a snapshot this falls back to get_current_conditions, which reads
+    the in-process water temperature and observation caches.
+    """
+    # Get latest environment snapshot
+    snapshot = get_latest_snapshot(db)
+    conditions = get_snapshot_as_dict(snapshot) if snapshot else {}
+
+    # Fallback to basic conditions if no snapshot
+    if not conditions:
+        current_cond = get_current_conditions(db)
+        conditions = {
+            'water_temperature': current_cond.get('water_temp_f'),
+            'tide_stage': current_cond.get('tide_state'),
+            'wind_speed': current_cond.get('wind_speed'),
+            'wind_direction': current_cond.get('wind_direction'),
+            'time_of_day': current_cond.get('time_of_day'),
+            'barometric_pressure': None,
+            'clarity': 'clean'  # Default
+        }
+
+    return conditions
+
+
+def _apply_bite_score(
+    db: Session,
+    species: str,
+    zone_id: str,
+    conditions: Dict[str, Any],
+    total_catches: int,
+    old_bite_score: Optional[BiteScore],
+    now: datetime,
+    force_recalc: bool = False
+) -> Dict[str, Any]:
+    """
+    Compute a smoothed bite score and stage it in the session (no commit).
+
+    Args:
+        db: Database session
+        species: Species key
+        zone_id: Zone identifier
+        conditions: Current conditions (see load_conditions)
+        total_catches: Total catches logged for this species+zone
+        old_bite_score: Cached BiteScore row, or None if not yet scored
+        now: Timestamp for last_updated and seasonal lookups
+        force_recalc: If True, skip smoothing and use raw score directly
+
+    Returns:
+        Dictionary with updated score information
+    """
+    # STEP C & D: Compute raw_score using existing hyperlocal_scoring
+    raw_result = calculate_zone_bite_score(
+        db=db,
+        species=species,
+        zone_id=zone_id,
+        conditions=conditions,
+        date=now
+    )
+
+    raw_score = raw_result['bite_score']
+    seasonal_baseline = raw_result.get('seasonal_baseline', 50)
+    condition_match = raw_result.get('condition_match', 0)
+    recent_activity = raw_result.get('recent_activity', 0)
+    predator_penalty = raw_result.get('predator_penalty', 0)
+
+    # STEP E: Apply smoothing
+    if old_bite_score and not force_recalc:
+        # Exponential smoothing
+        old_score = old_bite_score.score
+        w = get_smoothing_weight(total_catches)
+        new_score = old_score * (1 - w) + raw_score * w
+        logger.info(f"Smoothing {species} {zone_id}: {old_score:.1f} -> {new_score:.1f} (w={w:.2f}, raw={raw_score:.1f})")
+    else:
+        # First calculation or forced recalc - use seasonal baseline as starting point
+        new_score = raw_score
+        logger.info(f"Initial score {species} {zone_id}: {new_score:.1f} (raw={raw_score:.1f})")
+
+    # Clamp to 0-100
+    new_score = max(0.0, min(100.0, new_score))
+
+    # STEP F: Derive rating and confidence
+    rating = get_score_rating(new_score)
+    confidence = get_confidence_level(total_catches)
+
+    # STEP G: Build reason summary
+    reason_summary = build_reason_summary(
+        conditions=conditions,
+        seasonal_baseline=seasonal_baseline,
+        condition_match=condition_match,
+        recent_activity=recent_activity,
+        predator_penalty=predator_penalty,
+        species=species,
+        zone_id=zone_id
+    )
+
+    # STEP H: Upsert into bite_scores
+    if old_bite_score:
+        old_bite_score.score = new_score
+        old_bite_score.rating = rating
+        old_bite_score.confidence = confidence
+        old_bite_score.reason_summary = reason_summary
+        old_bite_score.last_updated = now
+    else:
+        new_bite_score = BiteScore(
+            species=species,
+            zone_id=zone_id,
+            score=new_score,
+            rating=rating,
+            confidence=confidence,
+            reason_summary=reason_summary,
+            last_updated=now
+        )
+        db.add(new_bite_score)
+
+    logger.info(f"Updated bite_score: {species} {zone_id} = {new_score:.1f} ({rating}, {confidence} confidence)")
+
+    return {
+        'species': species,
+        'zone_id': zone_id,
+        'score': round(new_score, 1),
+        'rating': rating,
+        'confidence': confidence,
+        'reason_summary': reason_summary,
+        'total_catches': total_catches,
+        'raw_score': round(raw_score, 1)
+    }
+
+
 def recalculate_bite_score(
     db: Session,
     species: str,
@@ -154,23 +284,7 @@ def recalculate_bite_score(
     try:
         # STEP A: Load context
         now = datetime.utcnow()
-
-        # Get latest environment snapshot
-        snapshot = get_latest_snapshot(db)
-        conditions = get_snapshot_as_dict(snapshot) if snapshot else {}
-
-        # Fallback to basic conditions if no snapshot
-        if not conditions:
-            current_cond = get_current_conditions(db)
-            conditions = {
-                'water_temperature': current_cond.get('water_temp_f'),
-                'tide_stage': current_cond.get('tide_state'),
-                'wind_speed': current_cond.get('wind_speed'),
-                'wind_direction': current_cond.get('wind_direction'),
-                'time_of_day': current_cond.get('time_of_day'),
-                'barometric_pressure': None,
-                'clarity': 'clean'  # Default
-            }
+        conditions = load_conditions(db)
 
         # STEP B: Load recent activity for confidence
         total_catches = db.query(func.count(Catch.id)).filter(
@@ -180,22 +294,6 @@ def recalculate_bite_score(
             )
         ).scalar() or 0
 
-        # STEP C & D: Compute raw_score using existing hyperlocal_scoring
-        raw_result = calculate_zone_bite_score(
-            db=db,
-            species=species,
-            zone_id=zone_id,
-            conditions=conditions,
-            date=now
-        )
-
-        raw_score = raw_result['bite_score']
-        seasonal_baseline = raw_result.get('seasonal_baseline', 50)
-        condition_match = raw_result.get('condition_match', 0)
-        recent_activity = raw_result.get('recent_activity', 0)
-        predator_penalty = raw_result.get('predator_penalty', 0)
-
-        # STEP E: Apply smoothing
         old_bite_score = db.query(BiteScore).filter(
             and_(
                 BiteScore.species == species,
@@ -203,71 +301,87 @@ def recalculate_bite_score(
             )
         ).first()
 
-        if old_bite_score and not force_recalc:
-            # Exponential smoothing
-            old_score = old_bite_score.score
-            w = get_smoothing_weight(total_catches)
-            new_score = old_score * (1 - w) + raw_score * w
-            logger.info(f"Smoothing {species} {zone_id}: {old_score:.1f} -> {new_score:.1f} (w={w:.2f}, raw={raw_score:.1f})")
-        else:
-            # First calculation or forced recalc - use seasonal baseline as starting point
-            new_score = raw_score
-            logger.info(f"Initial score {species} {zone_id}: {new_score:.1f} (raw={raw_score:.1f})")
-
-        # Clamp to 0-100
-        new_score = max(0.0, min(100.0, new_score))
-
-        # STEP F: Derive rating and confidence
-        rating = get_score_rating(new_score)
-        confidence = get_confidence_level(total_catches)
-
-        # STEP G: Build reason summary
-        reason_summary = build_reason_summary(
-            conditions=conditions,
-            seasonal_baseline=seasonal_baseline,
-            condition_match=condition_match,
-            recent_activity=recent_activity,
-            predator_penalty=predator_penalty,
-            species=species,
-            zone_id=zone_id
+        result = _apply_bite_score(
+            db, species, zone_id, conditions, total_catches,
+            old_bite_score, now, force_recalc
         )
 
-        # STEP H: Upsert into bite_scores
-        if old_bite_score:
-            old_bite_score.score = new_score
-            old_bite_score.rating = rating
-            old_bite_score.confidence = confidence
-            old_bite_score.reason_summary = reason_summary
-            old_bite_score.last_updated = now
-        else:
-            new_bite_score = BiteScore(
-                species=species,
-                zone_id=zone_id,
-                score=new_score,
-                rating=rating,
-                confidence=confidence,
-                reason_summary=reason_summary,
-                last_updated=now
-            )
-            db.add(new_bite_score)
-
         db.commit()
 
-        logger.info(f"Updated bite_score: {species} {zone_id} = {new_score:.1f} ({rating}, {confidence} confidence)")
+        return result
 
-        return {
-            'species': species,
-            'zone_id': zone_id,
-            'score': round(new_score, 1),
-            'rating': rating,
-            'confidence': confidence,
-            'reason_summary': reason_summary,
-            'total_catches': total_catches,
-            'raw_score': round(raw_score, 1)
+    except Exception as e:
+        logger.error(f"Error recalculating bite score for {species} {zone_id}: {e}")
+        db.rollback()
+        raise
+
+
+def recalculate_bite_scores_bulk(
+    db: Session,
+    pairs: Iterable[Tuple[str, str]],
+    force_recalc: bool = False,
+    now: Optional[datetime] = None,
+    conditions: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Recalculate and cache bite scores for many species+zone pairs at once.
+
+    Same scoring as recalculate_bite_score, but conditions, catch counts and
+    cached rows are loaded with one query each, and all updates are written
+    in a single commit. A pair that fails to score is logged and skipped.
+
+    Args:
+        db: Database session
+        pairs: (species, zone_id) pairs to recalculate
+        force_recalc: If True, skip smoothing and use raw scores directly
+        now: As-of time for every updated row (default: current UTC time)
+        conditions: Conditions to score against (default: load_conditions(db))
+
+    Returns:
+        List of updated score dictionaries (one per successfully scored pair)
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return []
+
+    try:
+        if now is None:
+            now = datetime.utcnow()
+        if conditions is None:
+            conditions = load_conditions(db)
+
+        total_catches = {
+            (species, zone_id): count
+            for species, zone_id, count in db.query(
+                Catch.species, Catch.zone_id, func.count(Catch.id)
+            ).filter(
+                tuple_(Catch.species, Catch.zone_id).in_(pairs)
+            ).group_by(Catch.species, Catch.zone_id)
         }
 
+        old_bite_scores = {}
+        for bite_score in db.query(BiteScore).filter(
+            tuple_(BiteScore.species, BiteScore.zone_id).in_(pairs)
+        ).order_by(BiteScore.id):
+            old_bite_scores.setdefault((bite_score.species, bite_score.zone_id), bite_score)
+
+        results = []
+        for pair in pairs:
+            species, zone_id = pair
+            try:
+                results.append(_apply_bite_score(
+                    db, species, zone_id, conditions, total_catches.get(pair, 0),
+                    old_bite_scores.get(pair), now, force_recalc
+                ))
+            except Exception as e:
+                logger.error(f"Error recalculating bite score for {species} {zone_id}: {e}")
+
+        db.commit()
+
+        return results
+
     except Exception as e:
-        logger.error(f"Error recalculating bite score for {species} {zone_id}: {e}")
+        logger.error(f"Error in bulk bite score recalculation: {e}")
         db.rollback()
         raise
 
@@ -6,7 +6,7 @@ from sqlalchemy import func
 from app.config import config
 from app.models.schemas import ForecastWindow, SpeciesForecast, Alert
 from app.rules import SPECIES_LIST, get_running_factor, is_species_running, calculate_bite_score, get_bite_label
-from app.rules.bite_logic import get_bite_tier, _get_species_environmental_score, _calculate_tide_score, _calculate_wind_score, _calculate_temp_score, clamp
+from app.rules.bite_logic import get_bite_tier, score_all_species, _get_species_environmental_score, _calculate_tide_score, _calculate_wind_score, _calculate_temp_score, clamp
 from app.rules.behavior import get_depth_behavior, format_depth_range
 from app.rules.conditions_summary import generate_conditions_summary, get_top_active_species
 from app.services.tide_service import get_tide_for_time
@@ -17,14 +17,8 @@ from app.services.weather_observations import get_weather_observations
 from app.services.advanced_features import (
     get_bite_tier_from_score,
     get_behavior_tier_from_bite_tier,
-    predict_water_clarity,
-    get_clarity_tip,
-    calculate_confidence_score,
-    get_rig_of_moment,
-    get_best_zones_now,
-    get_pro_tip,
-    get_current_strength,
-    get_moon_tide_window
+    build_forecast_bundle,
+    SpeciesEntry
 )
 import logging
 
@@ -108,12 +102,15 @@ def compute_forecasts(db: Session, hours_ahead: int = 24) -> bool:
             )
 
             # Compute per-species forecasts
+            env_scores = score_all_species(conditions)
             species_scores = []
             for species in SPECIES_LIST:
                 running_factor = get_running_factor(species, window_mid)
                 is_running_bool = is_species_running(species, window_mid)
 
-                bite_score = calculate_bite_score(species, running_factor, conditions)
+                bite_score = calculate_bite_score(
+                    species, running_factor, conditions, env_score=env_scores.get(species)
+                )
                 bite_label = get_bite_label(bite_score)
 
                 species_forecast = SpeciesForecast(
@@ -392,20 +389,11 @@ def get_current_conditions(db: Session) -> Dict:
 
             # === ADVANCED FEATURES ===
 
-            # Water clarity
-            clarity = predict_water_clarity(
-                wind_speed_mph=current_window.wind_speed,
-                tide_rate=conditions['tide_change_rate'],
-                recent_rain=False  # TODO: integrate rain data if available
-            )
-            clarity_tip = get_clarity_tip(clarity)
-
-            # Confidence score
+            # Confidence score inputs
             # Simple approximations based on available data
             pressure_stability = 0.8 if current_window.pressure_trend == 'steady' else 0.5
             wind_stability = 0.9 if current_window.wind_speed < 10 else 0.6 if current_window.wind_speed < 15 else 0.3
             tide_predictability = 0.8  # Tides are generally predictable
-            confidence = calculate_confidence_score(pressure_stability, wind_stability, tide_predictability)
 
             # Rig of the moment
             # Parse depth_range if it's a string like "2-4 ft"
@@ -416,53 +404,39 @@ def get_current_conditions(db: Session) -> Dict:
             except:
                 depth_range_tuple = (3, 5)
 
-            rig_recommendation = get_rig_of_moment(
-                clarity=clarity,
-                wind_mph=current_window.wind_speed,
-                tide_speed=conditions['tide_change_rate'],
-                top_species=top_species_key,
-                depth_range=depth_range_tuple,
-                time_of_day=current_window.time_of_day
-            )
-
             # Best zones
             # Convert species list to have tier info
-            species_with_tiers = []
-            for s in species_list[:5]:
-                species_with_tiers.append({
-                    'key': s['key'],
-                    'tier': get_bite_tier_from_score(s['bite_score'])
-                })
-            best_zones = get_best_zones_now(
-                top_species_list=species_with_tiers,
+            species_with_tiers = [
+                SpeciesEntry(s['key'], get_bite_tier_from_score(s['bite_score']), s['bite_score'])
+                for s in species_list[:3]
+            ]
+            features = build_forecast_bundle(
+                wind_mph=current_window.wind_speed,
+                tide_rate=conditions['tide_change_rate'],
                 tide_state=current_window.tide_state,
-                clarity=clarity,
                 time_of_day=current_window.time_of_day,
+                moon_phase=moon_phase_name,
+                top_species=top_species_key,
+                top_tier=get_bite_tier_from_score(top_species[0]['bite_score']),
+                depth_range=depth_range_tuple,
+                species_with_tiers=species_with_tiers,
+                pressure_stability=pressure_stability,
+                wind_stability=wind_stability,
+                tide_predictability=tide_predictability,
                 wind_direction=wind_direction,
                 wind_speed=wind_speed,
                 air_temp_f=air_temp,
-                water_temp_f=current_window.water_temperature
-            )
-
-            # Pro tip
-            top_tier = get_bite_tier_from_score(top_species[0]['bite_score'])
-            pro_tip = get_pro_tip(
-                bite_tier=top_tier,
-                clarity=clarity,
-                tide_state=current_window.tide_state,
-                wind_mph=current_window.wind_speed,
-                time_of_day=current_window.time_of_day
-            )
-
-            # Current strength
-            current_strength = get_current_strength(conditions['tide_change_rate'])
-
-            # Moon/tide window
-            moon_tide_info = get_moon_tide_window(
-                moon_phase=moon_phase_name,
-                tide_state=current_window.tide_state,
-                time_of_day=current_window.time_of_day
+                water_temp_f=current_window.water_temperature,
+                recent_rain=False  # TODO: integrate rain data if available
             )
+            clarity = features['clarity']
+            clarity_tip = features['clarity_tip']
+            confidence = features['confidence']
+            rig_recommendation = features['rig_of_moment']
+            best_zones = features['best_zones']
+            pro_tip = features['pro_tip']
+            current_strength = features['current_strength']
+            moon_tide_info = features['moon_tide_window']
 
         else:
             conditions_summary = "Conditions data unavailable."
@@ -39,30 +39,51 @@ def _get_tide_station_id() -> str:
     return config.tide_station_id
 
 
-def fetch_tide_data(db: Session, hours_ahead: int = 48) -> bool:
+def fetch_tide_data(db: Session, hours_ahead: int = 48) -> Tuple[bool, bool]:
     """
     Fetch tide predictions from NOAA CO-OPS API and store in database.
 
+    Predictions only count as changed if a stored value was revised, or the
+    stored predictions no longer reached halfway through the fetch window;
+    extending the far end of the window is not a change.
+
     Args:
         db: Database session
         hours_ahead: Hours of tide data to fetch (default 48)
 
     Returns:
-        True if successful, False otherwise
+        (success, changed) tuple
     """
     try:
         # Fetch predictions
         predictions = _fetch_predictions(hours_ahead)
         if not predictions:
             logger.error("No tide predictions received")
-            return False
+            return False, False
 
         # Fetch high/low tide times
         hi_low = _fetch_high_low_tides(hours_ahead)
 
-        # Clear old predictions for the time range
         start_time = datetime.utcnow()
         end_time = start_time + timedelta(hours=hours_ahead)
+
+        # Compare with the stored predictions before replacing them
+        stored = dict(db.query(TideData.timestamp, TideData.height).filter(
+            TideData.timestamp >= start_time,
+            TideData.timestamp <= end_time,
+            TideData.is_prediction == True,
+            TideData.tide_type.is_(None)
+        ).all())
+        changed = (
+            not stored
+            or max(stored) < start_time + timedelta(hours=hours_ahead / 2)
+            or any(
+                stored.get(pred['timestamp'], pred['height']) != pred['height']
+                for pred in predictions
+            )
+        )
+
+        # Clear old predictions for the time range
         db.query(TideData).filter(
             TideData.timestamp >= start_time,
             TideData.timestamp <= end_time,
@@ -102,12 +123,12 @@ def fetch_tide_data(db: Session, hours_ahead: int = 48) -> bool:
 
         db.commit()
         logger.info(f"Stored {len(predictions)} tide predictions and {len(hi_low)} high/low markers")
-        return True
+        return True, changed
 
     except Exception as e:
         logger.error(f"Error fetching tide data: {e}")
         db.rollback()
-        return False
+        return False, False
 
 
 def _fetch_predictions(hours_ahead: int) -> List[Dict]:
@@ -9,9 +9,9 @@ Generates human-readable tips based on:
 - Learned condition preferences
 """
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
+from sqlalchemy import and_, func, desc, tuple_
 import logging
 
 from app.models.schemas import (
@@ -278,6 +278,78 @@ def update_species_zone_tip(
         raise
 
 
+def update_species_zone_tips_bulk(
+    db: Session,
+    pairs: Iterable[Tuple[str, str]],
+    now: Optional[datetime] = None
+) -> int:
+    """
+    Generate and save/update tips for many species+zone pairs in one commit.
+
+    Same rules as update_species_zone_tip, but existing tips are loaded with a
+    single query and all inserts, updates and deletes are committed together.
+    A pair whose tip fails to generate is logged and skipped.
+
+    Args:
+        db: Database session
+        pairs: (species, zone_id) pairs to update
+        now: As-of time for every updated tip (default: current UTC time)
+
+    Returns:
+        Number of pairs processed
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return 0
+
+    try:
+        existing_tips = {}
+        for tip in db.query(SpeciesZoneTip).filter(
+            tuple_(SpeciesZoneTip.species, SpeciesZoneTip.zone_id).in_(pairs)
+        ).order_by(SpeciesZoneTip.id):
+            existing_tips.setdefault((tip.species, tip.zone_id), tip)
+
+        if now is None:
+            now = datetime.utcnow()
+        count = 0
+        for pair in pairs:
+            species, zone_id = pair
+            try:
+                tip_text = generate_tip(db, species, zone_id)
+            except Exception as e:
+                logger.error(f"Error updating tip for {species} {zone_id}: {e}")
+                continue
+
+            tip = existing_tips.get(pair)
+            if not tip_text:
+                # No tip - delete if exists
+                if tip:
+                    db.delete(tip)
+                    logger.info(f"Deleted tip for {species} {zone_id} (score too low)")
+            elif tip:
+                tip.tip_text = tip_text
+                tip.last_updated = now
+            else:
+                db.add(SpeciesZoneTip(
+                    species=species,
+                    zone_id=zone_id,
+                    tip_text=tip_text,
+                    last_updated=now
+                ))
+            count += 1
+
+        db.commit()
+
+        logger.info(f"Updated tips for {count} species+zone pairs")
+
+        return count
+
+    except Exception as e:
+        logger.error(f"Error in bulk tip update: {e}")
+        db.rollback()
+        raise
+
+
 def get_tip_for_zone(
     db: Session,
     species: str,
@@ -10,8 +10,9 @@ repeated API calls during forecast generation.
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import requests
 from sqlalchemy.orm import Session
 from app.config import config
@@ -25,8 +26,18 @@ NOAA_COOPS_BASE_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter
 
 # Cache settings
 CACHE_DURATION_MINUTES = 30  # Refresh water temp every 30 minutes
+
+# Stale-while-revalidate windows for the scheduled update: data younger than
+# SWR_FRESH_MINUTES isn't refetched, and data younger than SWR_STALE_MINUTES is
+# served while it refreshes in the background
+SWR_FRESH_MINUTES = 5
+SWR_STALE_MINUTES = 60
+
 _cached_water_temp: Optional[Dict] = None
 _cache_timestamp: Optional[datetime] = None
+_refresh_lock = threading.Lock()
+_unreported_change = False  # A background refresh changed the data since the last update call
+_change_lock = threading.Lock()  # Guards _unreported_change between refresh and scheduler threads
 
 
 def _get_primary_station() -> str:
@@ -191,15 +202,8 @@ def get_water_temperature() -> Optional[Dict]:
     return result
 
 
-def update_water_temperature_cache() -> bool:
-    """
-    Force update of water temperature cache.
-
-    Called by scheduler to periodically refresh water temp.
-
-    Returns:
-        True if successfully updated, False otherwise
-    """
+def _refresh_water_temperature_cache() -> Tuple[bool, bool]:
+    """Fetch fresh water temperature from NOAA into the cache (blocking)."""
     global _cached_water_temp, _cache_timestamp
 
     logger.info("Scheduled water temperature update...")
@@ -214,13 +218,66 @@ def update_water_temperature_cache() -> bool:
         result = fetch_water_temperature_from_noaa(backup_station)
 
     if result:
+        # The reading timestamp moves every few minutes even when the temperature
+        # doesn't, and forecasts only use water_temp_f, so compare just that
+        changed = _cached_water_temp is None or result['water_temp_f'] != _cached_water_temp.get('water_temp_f')
         _cached_water_temp = result
         _cache_timestamp = datetime.utcnow()
         logger.info(f"Water temperature updated: {result['water_temp_f']:.1f}°F")
-        return True
+        return True, changed
     else:
         logger.error("Failed to update water temperature cache")
-        return False
+        return False, False
+
+
+def _refresh_in_background():
+    """Refresh the cache on a daemon thread, unless a refresh is already running."""
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    def run():
+        global _unreported_change
+        try:
+            success, changed = _refresh_water_temperature_cache()
+            if changed:
+                with _change_lock:
+                    _unreported_change = True
+        except Exception as e:
+            logger.error(f"Error refreshing water temperature in background: {e}")
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name='watertemp-refresh', daemon=True).start()
+
+
+def update_water_temperature_cache() -> Tuple[bool, bool]:
+    """
+    Update the water temperature cache (stale-while-revalidate).
+
+    Called by scheduler to periodically refresh water temperature. Data younger
+    than SWR_FRESH_MINUTES is kept as is, data younger than SWR_STALE_MINUTES
+    is returned while a background thread refreshes it, and anything older is
+    refreshed before returning.
+
+    Returns:
+        (success, changed) tuple; changed is True if the data differs from what
+        was last reported, including changes picked up by a background refresh
+    """
+    global _unreported_change
+
+    if _cached_water_temp and _cache_timestamp:
+        age = datetime.utcnow() - _cache_timestamp
+        if age < timedelta(minutes=SWR_STALE_MINUTES):
+            if age >= timedelta(minutes=SWR_FRESH_MINUTES):
+                _refresh_in_background()
+            with _change_lock:
+                changed, _unreported_change = _unreported_change, False
+            return True, changed
+
+    success, changed = _refresh_water_temperature_cache()
+    with _change_lock:
+        changed, _unreported_change = changed or _unreported_change, False
+    return success, changed
 
 
 def clear_cache():
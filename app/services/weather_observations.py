@@ -9,8 +9,9 @@ Backup: 8735180 (Bayou La Batre, AL) - Tide prediction station
 """
 
 import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 import requests
 from app.config import config
 from app.utils.location_manager import get_current_location
@@ -22,8 +23,18 @@ NOAA_COOPS_BASE_URL = "https://api.tidesandcurrents.noaa.gov/api/prod/datagetter
 
 # Cache settings
 CACHE_DURATION_MINUTES = 15  # Refresh every 15 minutes
+
+# Stale-while-revalidate windows for the scheduled update: data younger than
+# SWR_FRESH_MINUTES isn't refetched, and data younger than SWR_STALE_MINUTES is
+# served while it refreshes in the background
+SWR_FRESH_MINUTES = 5
+SWR_STALE_MINUTES = 30
+
 _cached_observations: Optional[Dict] = None
 _cache_timestamp: Optional[datetime] = None
+_refresh_lock = threading.Lock()
+_unreported_change = False  # A background refresh changed the data since the last update call
+_change_lock = threading.Lock()  # Guards _unreported_change between refresh and scheduler threads
 
 
 def _get_primary_station() -> str:
@@ -209,15 +220,8 @@ def get_weather_observations() -> Optional[Dict]:
     return result
 
 
-def update_weather_observations_cache() -> bool:
-    """
-    Force update of weather observations cache.
-
-    Called by scheduler to periodically refresh observations.
-
-    Returns:
-        True if successfully updated, False otherwise
-    """
+def _refresh_weather_observations_cache() -> Tuple[bool, bool]:
+    """Fetch fresh weather observations from NOAA into the cache (blocking)."""
     global _cached_observations, _cache_timestamp
 
     logger.info("Scheduled weather observations update...")
@@ -232,16 +236,68 @@ def update_weather_observations_cache() -> bool:
         result = fetch_weather_observations_from_noaa(backup_station)
 
     if result:
+        # fetch_time is stamped on every fetch, so leave it out of the comparison
+        changed = dict(result, fetch_time=None) != dict(_cached_observations or {}, fetch_time=None)
         _cached_observations = result
         _cache_timestamp = datetime.utcnow()
 
         air_temp = result.get('air_temp_f', 'N/A')
         wind = f"{result.get('wind_speed_mph', 'N/A')} mph {result.get('wind_direction_cardinal', '')}"
         logger.info(f"Weather observations updated: {air_temp}°F, Wind: {wind}")
-        return True
+        return True, changed
     else:
         logger.error("Failed to update weather observations cache")
-        return False
+        return False, False
+
+
+def _refresh_in_background():
+    """Refresh the cache on a daemon thread, unless a refresh is already running."""
+    if not _refresh_lock.acquire(blocking=False):
+        return
+
+    def run():
+        global _unreported_change
+        try:
+            success, changed = _refresh_weather_observations_cache()
+            if changed:
+                with _change_lock:
+                    _unreported_change = True
+        except Exception as e:
+            logger.error(f"Error refreshing weather observations in background: {e}")
+        finally:
+            _refresh_lock.release()
+
+    threading.Thread(target=run, name='observations-refresh', daemon=True).start()
+
+
+def update_weather_observations_cache() -> Tuple[bool, bool]:
+    """
+    Update the weather observations cache (stale-while-revalidate).
+
+    Called by scheduler to periodically refresh weather observations. Data younger
+    than SWR_FRESH_MINUTES is kept as is, data younger than SWR_STALE_MINUTES
+    is returned while a background thread refreshes it, and anything older is
+    refreshed before returning.
+
+    Returns:
+        (success, changed) tuple; changed is True if the data differs from what
+        was last reported, including changes picked up by a background refresh
+    """
+    global _unreported_change
+
+    if _cached_observations and _cache_timestamp:
+        age = datetime.utcnow() - _cache_timestamp
+        if age < timedelta(minutes=SWR_STALE_MINUTES):
+            if age >= timedelta(minutes=SWR_FRESH_MINUTES):
+                _refresh_in_background()
+            with _change_lock:
+                changed, _unreported_change = _unreported_change, False
+            return True, changed
+
+    success, changed = _refresh_weather_observations_cache()
+    with _change_lock:
+        changed, _unreported_change = changed or _unreported_change, False
+    return success, changed
 
 
 def clear_cache():
@@ -1,7 +1,7 @@
 """Service for fetching weather data from NWS API."""
 import requests
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from app.config import config
 from app.models.schemas import WeatherData
@@ -12,33 +12,45 @@ logger = logging.getLogger(__name__)
 # Cache for NWS grid points
 _grid_cache = None
 
+# Conditional request headers (If-None-Match / If-Modified-Since) per URL,
+# from the last forecast response that was stored
+_last_headers: Dict[str, Dict[str, str]] = {}
 
-def fetch_weather_data(db: Session) -> bool:
+
+def fetch_weather_data(db: Session) -> Tuple[bool, bool]:
     """
     Fetch weather forecast from NWS API and store in database.
 
     Returns:
-        True if successful, False otherwise
+        (success, changed) tuple; changed is False when NWS reports the
+        forecast not modified
     """
     try:
         # Get grid point for our location
         grid = _get_grid_point()
         if not grid:
             logger.error("Failed to get NWS grid point")
-            return False
+            return False, False
 
         # Fetch hourly forecast
         forecast_url = grid['forecast_hourly_url']
         headers = {'User-Agent': config.weather_user_agent}
+        headers.update(_last_headers.get(forecast_url, {}))
 
         response = requests.get(forecast_url, headers=headers, timeout=30)
+
+        # Forecast unchanged since the last stored response
+        if response.status_code == 304:
+            logger.info("Weather forecast not modified, keeping stored periods")
+            return True, False
+
         response.raise_for_status()
 
         data = response.json()
 
         if 'properties' not in data or 'periods' not in data['properties']:
             logger.error("Invalid forecast response")
-            return False
+            return False, False
 
         periods = data['properties']['periods']
 
@@ -92,15 +104,27 @@ def fetch_weather_data(db: Session) -> bool:
         db.commit()
         logger.info(f"Stored {stored_count} weather forecast periods")
 
+        _remember_validators(forecast_url, response)
+
         # Compute pressure trends (if we had obs data, we'd use it)
         _compute_pressure_trends(db)
 
-        return True
+        return True, True
 
     except Exception as e:
         logger.error(f"Error fetching weather data: {e}")
         db.rollback()
-        return False
+        return False, False
+
+
+def _remember_validators(url: str, response: requests.Response):
+    """Save a response's ETag/Last-Modified for the next request to url."""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['If-None-Match'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = response.headers['Last-Modified']
+    _last_headers[url] = validators
 
 
 def _get_grid_point() -> Optional[Dict]:
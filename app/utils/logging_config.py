@@ -0,0 +1,15 @@
+"""
+Logging setup for BayScan.
+
+Shared by the web app and the score recalculation worker process, so both
+log with the same level and format.
+"""
+import logging
+
+
+def setup_logging():
+    """Configure root logging (INFO, with timestamp and logger name)."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
@@ -0,0 +1,8 @@
+-- Migration: Add covering indexes for the scheduler's recent-activity scan
+-- Date: 2026-10-15
+-- Description: Lets the periodic recalculation seed query (activity since a cutoff,
+-- grouped by species+zone) read catches and predator_logs from an index only
+
+CREATE INDEX IF NOT EXISTS ix_catch_ts_species_zone ON catches (timestamp, species, zone_id);
+
+CREATE INDEX IF NOT EXISTS ix_predatorlog_time_zone ON predator_logs (time, zone);